@@ -1,6 +1,5 @@
 import os
 import time
-import re
 import subprocess
 from pathlib import Path
 
@@ -10,6 +9,8 @@ from adafruit_pca9685 import PCA9685
 from adafruit_motor import motor, servo
 from openai import OpenAI
 
+from text_ratio import analyze, english_words
+
 # =========================================================
 # 1) 이동 튜닝 (최종)
 # =========================================================
@@ -79,19 +80,18 @@ def run(cmd):
 # 영어 비율 분석 (단어 기준)
 # =========================================================
 def analyze_english_ratio(text: str) -> float:
-    english_words = re.findall(r"[A-Za-z]+", text)
-    all_words = re.findall(r"[A-Za-z0-9가-힣]+", text)
+    a = analyze(text)
 
-    eng_count = len(english_words)
-    total_count = len(all_words)
+    eng_count = a.en_words
+    total_count = a.words
 
-    ratio = (eng_count / total_count) if total_count > 0 else 0.0
+    ratio = a.word_ratio
 
     print("\n===== 🔍 영어 단어 비율 분석 =====")
     print(f"영어 단어 수: {eng_count}")
     print(f"전체 단어 수: {total_count}")
     print(f"영어 비율: {ratio*100:.2f}%")
-    print(f"영어 단어 리스트: {english_words}")
+    print(f"영어 단어 리스트: {english_words(text)}")
     print("================================")
 
     return ratio
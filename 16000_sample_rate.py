@@ -6,10 +6,11 @@ import re
 
 import sounddevice as sd
 import soundfile as sf
-from openai import OpenAI
+
+from stt_client import SttClient
 
 # --- OpenAI 클라이언트 ---
-client = OpenAI()   # 환경변수에 API KEY 저장했다면 괄호 비워두기
+client = SttClient()   # 환경변수에 API KEY 저장했다면 괄호 비워두기. 녹음하는 동안 미리 연결 (stt_client.py)
 
 # --- 설정 ---
 SAVE_DIR = "/home/pi/recorded_voice"  # 라즈베리파이 저장 경로
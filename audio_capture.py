@@ -0,0 +1,190 @@
+# audio_capture.py
+# 미션 내내 열어두는 마이크 입력 + 미리 할당한 int16 링 버퍼
+# arecord 프로세스 / SD카드 WAV 파일 없이 메모리에서 바로 STT로 넘김
+
+import io
+import threading
+import wave
+from pathlib import Path
+
+import numpy as np
+
+
+def find_usb_microphone():
+    """USB 마이크 자동 탐색 (pi_stt_record.py와 같은 규칙)"""
+    import sounddevice as sd
+
+    devices = sd.query_devices()
+    for idx, dev in enumerate(devices):
+        name = dev["name"].lower()
+        if dev["max_input_channels"] > 0:
+            if ("usb" in name) or ("microphone" in name) or ("audio" in name):
+                print(f"[MIC] index={idx}, name={dev['name']}")
+                return idx
+    raise RuntimeError("USB 마이크를 찾을 수 없습니다.")
+
+
+class Segment:
+    """링 버퍼 안의 녹음 구간 (복사 없는 memoryview)"""
+
+    def __init__(self, pcm: memoryview, samplerate: int, channels: int = 1):
+        self.pcm = pcm
+        self.samplerate = samplerate
+        self.channels = channels
+
+    @property
+    def frames(self) -> int:
+        return len(self.pcm) // self.channels
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.samplerate
+
+    def samples(self) -> np.ndarray:
+        return np.frombuffer(self.pcm, dtype=np.int16)
+
+    def copy(self) -> "Segment":
+        """링 버퍼와 분리된 복사본 (다음 녹음이 덮어써도 유지)"""
+        return Segment(memoryview(bytes(self.pcm)), self.samplerate, self.channels)
+
+    def as_wav(self, name: str = "group.wav") -> io.BytesIO:
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(self.channels)
+            w.setsampwidth(2)
+            w.setframerate(self.samplerate)
+            w.writeframes(self.pcm)
+        buf.seek(0)
+        buf.name = name  # openai 업로드 시 확장자로 포맷 판단
+        return buf
+
+
+def open_for_upload(audio):
+    """Path(WAV 파일) 또는 Segment -> 업로드용 파일 객체"""
+    if isinstance(audio, Segment):
+        return audio.as_wav()
+    return open(Path(audio), "rb")
+
+
+class RingCapture:
+    """
+    InputStream 하나를 미션 동안 계속 열어두고, record() 동안만 링 버퍼에 씀.
+    각 녹음 구간은 버퍼 안에서 연속이 되도록 배치하므로 Segment는 복사 없이 넘어감.
+    다음 구간은 직전 구간과 겹치지 않게 배치하므로 직전 구간은 그대로 유지됨 (파이프라인 워커가 읽는 중일 수 있음).
+    그 전 구간들은 덮어쓸 수 있음 (더 오래 잡아둘 쪽은 Segment.copy()).
+    """
+
+    def __init__(self, samplerate: int = 44100, channels: int = 1, seconds: float = 60,
+                 device=None, blocksize: int = 1024):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.device = device
+        self.blocksize = blocksize
+        self.capacity = int(seconds * samplerate)
+        self._buf = np.zeros(self.capacity * channels, dtype=np.int16)  # 미리 할당
+        self._start = 0     # 현재 구간 시작 (frame)
+        self._pos = 0       # 현재 구간 쓰기 위치 (frame)
+        self._end = 0       # 현재 구간 최대 끝 (frame)
+        self._armed = False
+        self._cond = threading.Condition()
+        self._stream = None
+        self.overruns = 0
+
+    def start(self):
+        import sounddevice as sd  # 마이크 쓸 때만 (sim/노트북에는 PortAudio 없음)
+
+        if self.device is None:
+            self.device = find_usb_microphone()
+        self._stream = sd.InputStream(
+            samplerate=self.samplerate,
+            channels=self.channels,
+            dtype="int16",
+            device=self.device,
+            blocksize=self.blocksize,
+            callback=self._callback,
+        )
+        self._stream.start()
+        print(f"[MIC] stream open ({self.samplerate} Hz, ring {self.capacity / self.samplerate:.0f}s)")
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+    def _callback(self, indata, frames, time_info, status):
+        if status:
+            self.overruns += 1
+        if not self._armed:
+            return
+        with self._cond:
+            n = min(frames, self._end - self._pos)
+            if n > 0:
+                c = self.channels
+                self._buf[self._pos * c:(self._pos + n) * c] = indata[:n].reshape(-1)
+                self._pos += n
+            self._cond.notify_all()
+
+    def _arm(self, max_frames: int):
+        # 구간은 항상 연속 + 직전 구간 [_start, _end) 과 안 겹치게: 뒤에 자리가 있으면 뒤,
+        # 없으면 처음 (직전 구간 시작 전까지 들어가면). 둘 다 안 되면 새 버퍼
+        # (직전 Segment 의 memoryview 가 옛 버퍼를 잡고 있어서 그대로 유지)
+        if self._end + max_frames <= self.capacity:
+            start = self._end
+        elif max_frames <= self._start:
+            start = 0
+        else:
+            self._buf = np.empty_like(self._buf)
+            start = 0
+            print("[MIC] ring: previous segment in the way -> new buffer")
+        with self._cond:
+            self._start = self._pos = start
+            self._end = start + max_frames
+            self._armed = True
+
+    def _segment(self) -> Segment:
+        c = self.channels
+        view = memoryview(self._buf)[self._start * c:self._pos * c]
+        self._end = self._pos  # 다음 구간은 여기부터
+        return Segment(view, self.samplerate, c)
+
+    def record(self, seconds: float, progress: bool = True, vad=None, on_chunk=None) -> Segment:
+        """
+        최대 seconds 동안 녹음. vad(StreamingVad)를 주면 새로 들어온 샘플을 계속 넘기고,
+        vad.done(말 끝 + 무음 지속, 또는 말 없음)이면 바로 종료.
+        on_chunk(새 샘플)가 True를 돌려주면 역시 종료 (스트리밍 STT 조기 판단)
+        """
+        max_frames = min(int(seconds * self.samplerate), self.capacity)
+        print(f"[REC] START recording (max {seconds}s)")
+        self._arm(max_frames)
+        c = self.channels
+        fed = self._start
+        last_sec = 0
+        try:
+            while True:
+                with self._cond:
+                    if self._pos >= self._end:
+                        break
+                    if not self._stream.active:
+                        raise RuntimeError("마이크 스트림이 멈춤")
+                    self._cond.wait(timeout=0.5)
+                    pos = self._pos
+
+                sec = (pos - self._start) // self.samplerate
+                if progress and sec > last_sec:
+                    last_sec = sec
+                    print(f"[REC] {sec} / {seconds} sec")
+
+                if pos > fed:
+                    new = self._buf[fed * c:pos * c:c]  # 첫 채널만 (복사 없는 view)
+                    fed = pos
+                    done = vad.feed(new) if vad is not None else False
+                    if on_chunk is not None and on_chunk(new):
+                        done = True
+                    if done:
+                        break
+        finally:
+            with self._cond:
+                self._armed = False
+        print("[REC] END recording")
+        return self._segment()
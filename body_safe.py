@@ -12,6 +12,10 @@ import subprocess
 sys.path.append("/home/pi/Adeept_PiCar-Pro-V2/Code/Adeept_PiCar-Pro/Examples/04_Motor")
 from MotorCtrl import Motor, motorStop
 
+# 음성인식 상주 프로세스 클라이언트 (speech_daemon.py, 표준 라이브러리만 사용)
+sys.path.append("/home/pi/stt")
+from speech_daemon import classify, print_result
+
 # -----------------------------
 # 이동 함수 (조금 느리게, 안전)
 # -----------------------------
@@ -56,9 +60,18 @@ def right_turn(t=1, speed=30):
 # -----------------------------
 def run_voice_recognition():
     """
-    stt_venv 가상환경 활성화 후 음성인식 실행
+    speech_daemon 이 떠 있으면 소켓으로 요청 (녹음 + STT + 비율)
+    없으면 stt_venv 가상환경 활성화 후 음성인식 실행
     subprocess check=True로 완료 후 종료
     """
+    try:
+        res = classify()
+        if res is not None:
+            print_result(res)
+            time.sleep(1)
+            return
+    except OSError as e:
+        print(f"[Warning] speech daemon 오류, subprocess로 실행: {e}")
     try:
         subprocess.run(
             ["bash", "-c", "source /home/pi/stt_venv/bin/activate && python3 /home/pi/stt/pi_english_proportion.py"],
@@ -0,0 +1,260 @@
+# bringup.py
+# 하드웨어 빠른 시작 (PCA9685 주소 캐시 + 단계별 시작 시간)
+# 기존 init_pca(): 후보 주소마다 드라이버를 만들어 보고(실패하면 예외) 주파수 설정 뒤 0.2초 대기,
+# make_servo()는 부를 때마다 servo.Servo를 새로 만듦 (만들 때마다 PRESCALE 레지스터 읽기 2번)
+# 여기서는
+#   - 지난번에 잡힌 주소 / 채널 배치를 파일에 저장해두고 다음 시작은 그 주소만 열어 PRESCALE 한 번 읽기로 확인
+#     (이전 실행이 50 Hz로 설정해둔 칩이면 주파수 다시 안 씀. 전원이 꺼졌다 켜진 칩만 설정)
+#   - 캐시 주소가 대답 안 하면 버스 스캔 한 번(i2c.scan)으로 후보 중 있는 주소를 찾음
+#   - 채널 배치가 지난번과 다르면 알려줌 (배선 / 프로필 바뀐 것 확인용)
+#   - 서보 객체는 (보드, 채널, 펄스 범위)마다 한 번만 만듦
+#   - 단계(phase)별 시간 + 프로세스 시작부터 준비 완료까지 (목표 TARGET_SEC)
+#
+#   pwm = bringup.open_pca(PCA_ADDR_CANDIDATES, channels={"STEER_CH": 11, ...})
+#   with bringup.phase("servos"):
+#       steer = bringup.servo(pwm, STEER_CH, min_pulse=500, max_pulse=2500)
+#   bringup.report()
+#
+#   python3 bringup.py                 # 라즈베리파이: 한 번 시작해보고 단계별 시간
+#   python3 bringup.py --forget        # 캐시 지우기 (다음 시작은 버스 스캔)
+#   python3 bringup.py --bench         # sim: 기존 init_pca vs 캐시 없음 vs 캐시 (가상 시간 / I2C 트랜잭션)
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import hal
+from hal import servo as _servo
+from pwm_batch import BatchedPCA9685
+
+CACHE_PATH = Path(os.environ.get("PICAR_BRINGUP", "/home/pi/picar_bringup.json"))
+PWM_HZ = 50
+OSC_SETTLE_SEC = 0.0005  # PCA9685 오실레이터 안정 (데이터시트 500 us)
+MODE1_AI = 0x20          # MODE1 자동 증가 (pwm_batch 블록 쓰기에 필요, 드라이버 reset이 지움)
+TARGET_SEC = 0.5         # 프로세스 시작 -> 미션 준비 목표
+
+
+def prescale(freq: float) -> int:
+    """adafruit PCA9685 frequency 설정과 같은 계산 (25 MHz 내부 클럭)"""
+    return int(25000000 / 4096 / freq + 0.5) - 1
+
+
+def process_age():
+    """프로세스 시작부터 지금까지 (s, 10 ms 단위). /proc 없으면 None"""
+    try:
+        with open("/proc/self/stat") as f:
+            start = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            up = float(f.read().split()[0])
+        return up - start / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# =========================================================
+# 캐시
+# =========================================================
+def load_cache(path=CACHE_PATH) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict, path=CACHE_PATH):
+    """SD 카드 쓰기는 바뀐 것이 있을 때만. 임시 파일 -> rename (쓰다가 꺼져도 안 깨짐)"""
+    path = Path(path)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=1)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[BOOT] 캐시 저장 못 함 ({e})")
+
+
+# =========================================================
+# 시작
+# =========================================================
+class Bringup:
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path  # None = 실제 보드면 CACHE_PATH, sim이면 메모리에만
+        self.cache = None
+        self.phases = []  # (이름, s)
+        self.how = None   # "cached" / "scan"
+        self._servos = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        t = hal.now()
+        try:
+            yield
+        finally:
+            self.phases.append((name, hal.now() - t))
+
+    def _open(self, i2c, address: int, freq: float):
+        pca = hal.pca9685(i2c, address)  # 주소 응답 확인 + MODE1 reset
+        if pca.prescale_reg == prescale(freq):
+            pca.mode1_reg = MODE1_AI  # 주파수는 그대로, reset이 지운 자동 증가만 다시
+            hal.sleep(OSC_SETTLE_SEC)
+        else:
+            pca.frequency = freq      # 전원 켜진 직후 (PRESCALE 기본값 200 Hz)
+        return pca
+
+    def open_pca(self, candidates, channels: dict = None, freq: float = PWM_HZ) -> BatchedPCA9685:
+        with self.phase("i2c"):
+            if self.cache_path is None and hal.BACKEND == "real":
+                self.cache_path = CACHE_PATH
+            if self.cache is None:
+                self.cache = load_cache(self.cache_path) if self.cache_path else {}
+            i2c = hal.i2c_bus()
+
+        with self.phase("pca"):
+            pca = None
+            addr = self.cache.get("address")
+            if addr in candidates:
+                try:
+                    pca = self._open(i2c, addr, freq)
+                    self.how = "cached"
+                except Exception as e:
+                    print(f"[BOOT] 캐시 주소 {hex(addr)} 응답 없음 -> 버스 스캔 ({e})")
+            if pca is None:
+                found = hal.scan(i2c)
+                for a in candidates:
+                    if a in found:
+                        pca, addr = self._open(i2c, a, freq), a
+                        self.how = "scan"
+                        break
+                else:
+                    raise RuntimeError(f"PCA9685 못 잡음. 후보 {[hex(a) for a in candidates]}, "
+                                       f"버스 {[hex(a) for a in found]}")
+        print(f"[OK] PCA9685 addr = {hex(addr)} ({self.how})")
+
+        new = dict(self.cache, address=addr, frequency=freq)
+        if channels is not None:
+            old = self.cache.get("channels")
+            if old is not None and old != channels:
+                diff = [f"{k} {old.get(k)}->{v}" for k, v in channels.items() if old.get(k) != v]
+                print(f"[BOOT] 채널 배치가 지난번과 다름: {', '.join(diff)}")
+            new["channels"] = channels
+        if new != self.cache:
+            if self.cache_path:
+                save_cache(new, self.cache_path)
+            self.cache = new
+        return BatchedPCA9685(pca)  # 채널 쓰기 묶음 + 중복 제거 (pwm_batch.py)
+
+    def servo(self, pwm, ch: int, **kw):
+        key = (id(pwm), ch, tuple(sorted(kw.items())))
+        if key not in self._servos:
+            self._servos[key] = _servo.Servo(pwm.channels[ch], **kw)
+        return self._servos[key]
+
+    def report(self):
+        print("\n===== BRING-UP =====")
+        for name, sec in self.phases:
+            print(f"{name:16s} {sec * 1000:7.1f} ms")
+        print(f"{'total':16s} {sum(s for _, s in self.phases) * 1000:7.1f} ms  (PCA9685: {self.how})")
+        age = process_age() if hal.BACKEND == "real" else None
+        if age is not None:
+            verdict = "OK" if age <= TARGET_SEC else "SLOW"
+            print(f"process start -> ready {age * 1000:.0f} ms (target {TARGET_SEC * 1000:.0f} ms) {verdict}")
+        print("====================")
+
+
+# =========================================================
+# 기본 (미션 스크립트)
+# =========================================================
+_default = Bringup()
+
+
+def phase(name: str):
+    return _default.phase(name)
+
+
+def open_pca(candidates, channels: dict = None, freq: float = PWM_HZ) -> BatchedPCA9685:
+    return _default.open_pca(candidates, channels, freq)
+
+
+def servo(pwm, ch: int, **kw):
+    return _default.servo(pwm, ch, **kw)
+
+
+def report():
+    _default.report()
+
+
+# =========================================================
+# 벤치 (sim)
+# =========================================================
+SERVO_CHS = (11, 10, 9, 8, 7)
+
+
+def legacy_init(candidates):
+    """기존 init_pca() + make_servo() 5번"""
+    for addr in candidates:
+        try:
+            pca = hal.pca9685(None, addr)
+            pca.frequency = PWM_HZ
+            hal.sleep(0.2)
+            break
+        except ValueError:
+            continue
+    for ch in SERVO_CHS:
+        _servo.Servo(pca.channels[ch], min_pulse=500, max_pulse=2500)
+    return pca
+
+
+def bench():
+    hal.use_sim()
+    order = [0x40, 0x41, 0x60, hal.SIM_ADDRESS]  # 맞는 주소가 후보 맨 뒤인 경우
+    with tempfile.TemporaryDirectory() as d:
+        cache = Path(d) / "bringup.json"
+        print("===== BRING-UP (sim, PCA9685 at candidate #4) =====")
+        print(f"{'mode':24s} {'virtual ms':>10s} {'I2C tx':>7s}")
+        rows = [("legacy init_pca", None), ("bringup, no cache", cache), ("bringup, cached", cache)]
+        for label, path in rows:
+            t0 = hal.now()
+            if path is None:
+                board = legacy_init(order)
+            else:
+                b = Bringup(path)
+                pwm = b.open_pca(order)
+                for ch in SERVO_CHS + SERVO_CHS:  # 같은 서보 두 번 요청 -> 두 번째는 캐시
+                    b.servo(pwm, ch, min_pulse=500, max_pulse=2500)
+                board = pwm.pca
+            print(f"{label:24s} {(hal.now() - t0) * 1000:10.1f} {board.transactions:7d}")
+        print("=" * 51)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--bench", action="store_true")
+    ap.add_argument("--forget", action="store_true", help="캐시 파일 지우기")
+    ap.add_argument("--file", type=Path, default=CACHE_PATH)
+    args = ap.parse_args()
+    if args.bench:
+        bench()
+        return
+    if args.forget:
+        args.file.unlink(missing_ok=True)
+        print(f"removed {args.file}")
+        return
+    t0 = time.perf_counter()
+    b = Bringup(args.file)
+    with b.phase("i2c bus import"):
+        hal.i2c_bus()
+    pwm = b.open_pca([0x5F, 0x40, 0x41, 0x60])
+    with b.phase("servos"):
+        for ch in SERVO_CHS:
+            b.servo(pwm, ch, min_pulse=500, max_pulse=2500)
+    b.report()
+    print(f"bring-up only: {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
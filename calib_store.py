@@ -0,0 +1,231 @@
+# calib_store.py
+# 주행 캘리브레이션 기록 (JSONL, 한 줄 = 시도 한 번) + 모델 맞추기
+# 측정 스크립트(calibration.py / steer_tune.py / measure_1m_time.py)가 시도마다 기록하고
+# 미션 스크립트는 시작할 때 맞춘 값으로 FWD_SEC_1CELL / TURN_SEC_LEFT / TURN_SEC_RIGHT / STEER_CENTER 계산
+#   - 속도 -> 주행 속도(m/s)      : v = k * speed + b (속도 한 가지뿐이면 원점 지나는 비례)
+#   - 조향 각도 -> 곡률(rad/m)     : 좌/우 따로 kappa = a * steer + b  (회전 시간 = 각도 / (v * kappa))
+#   - 직진 쏠림(cm) -> 조향 중앙   : drift = a * steer + b 에서 drift = 0 인 각도
+# 곡률로 맞추기 때문에 SPEED를 올려도 회전 시간이 같이 계산됨
+# 기록한 속도 범위 밖 SPEED / 0 이하 / 프로필 범위 밖 값은 적용 안 함 (프로필 값 유지 + 경고)
+#
+#   log_trial("forward", speed=23.6, sec=3.6, distance_m=0.30, power="battery")
+#   log_trial("turn", speed=23.6, sec=5.0, steer=80, angle_deg=90)      # + 좌회전 / - 우회전
+#   log_trial("turn", speed=30, sec=1.0, angle_deg=-85)                 # steer 없음 = 제자리 회전 (deg/s 만)
+#   log_trial("center", speed=30, sec=2.0, steer=112, drift_cm=-1.5)    # + 왼쪽으로 쏠림
+#   apply_fitted(globals(), power="battery")                            # 미션 main() 시작에서
+#
+#   python3 calib_store.py fit --power battery
+#   python3 calib_store.py add forward --speed 35 --sec 3.0 --distance 0.3 --power charger
+
+import argparse
+import json
+import math
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from mission_profile import ProfileError, check
+
+CALIB_PATH = Path(os.environ.get("PICAR_CALIB", "/home/pi/picar_calib.jsonl"))
+CELL_M = 0.30  # 격자 한 칸
+
+
+# =========================================================
+# 기록
+# =========================================================
+def log_trial(kind: str, path=CALIB_PATH, **fields) -> dict:
+    """시도 하나 추가. 값이 None인 필드는 빼고 저장"""
+    rec = {"time": time.strftime("%Y-%m-%d %H:%M:%S"), "kind": kind}
+    rec.update({k: v for k, v in fields.items() if v is not None})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    return rec
+
+
+def load_trials(path=CALIB_PATH, power: str = None, surface: str = None):
+    """조건(전원 / 바닥)이 맞는 시도만. 조건이 기록 안 된 시도는 포함"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    out = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            rec = json.loads(line)
+            if power is not None and rec.get("power", power) != power:
+                continue
+            if surface is not None and rec.get("surface", surface) != surface:
+                continue
+            out.append(rec)
+    return out
+
+
+# =========================================================
+# 모델
+# =========================================================
+def _line(x, y):
+    """y = a x + b. x 값이 한 가지면 a = 0 (평균)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(np.unique(x)) < 2:
+        return 0.0, float(y.mean())
+    a, b = np.polyfit(x, y, 1)
+    return float(a), float(b)
+
+
+@dataclass
+class Fit:
+    velocity: tuple = None                         # (k, b): m/s = k * speed + b
+    curvature: dict = field(default_factory=dict)  # "left"/"right" -> (a, b): rad/m = a * steer + b
+    center: float = None                           # 직진 쏠림 0 인 조향 각도
+    speeds: tuple = None                           # 전진 기록 속도 (최소, 최대)
+    spin: dict = field(default_factory=dict)       # "left"/"right" -> deg/s 제자리 회전
+    counts: dict = field(default_factory=dict)
+
+    def speed_mps(self, speed: float) -> float:
+        k, b = self.velocity
+        return k * speed + b
+
+    def cell_sec(self, speed: float, cell_m: float = CELL_M) -> float:
+        return cell_m / self.speed_mps(speed)
+
+    def turn_sec(self, side: str, steer: float, speed: float, deg: float = 90.0) -> float:
+        a, b = self.curvature[side]
+        return math.radians(deg) / (self.speed_mps(speed) * (a * steer + b))
+
+
+def fit(trials) -> Fit:
+    out = Fit()
+    fwd = [r for r in trials if r["kind"] == "forward" and r.get("distance_m") and r.get("sec")]
+    out.counts["forward"] = len(fwd)
+    if fwd:
+        speed = [r["speed"] for r in fwd]
+        v = [r["distance_m"] / r["sec"] for r in fwd]
+        out.speeds = (min(speed), max(speed))
+        if len(set(speed)) < 2:
+            out.velocity = (float(np.mean(v)) / speed[0], 0.0)
+        else:
+            out.velocity = _line(speed, v)
+
+    turns = [r for r in trials if r["kind"] == "turn" and r.get("angle_deg") and r.get("steer") is not None]
+    if out.velocity is not None:
+        for side in ("left", "right"):
+            rs = [r for r in turns if (r["angle_deg"] > 0) == (side == "left")]
+            out.counts[side] = len(rs)
+            if rs:
+                kappa = [math.radians(abs(r["angle_deg"])) / (out.speed_mps(r["speed"]) * r["sec"]) for r in rs]
+                out.curvature[side] = _line([r["steer"] for r in rs], kappa)
+
+    spins = [r for r in trials if r["kind"] == "turn" and r.get("angle_deg") and r.get("steer") is None
+             and r.get("sec")]
+    for side in ("left", "right"):
+        rs = [r for r in spins if (r["angle_deg"] > 0) == (side == "left")]
+        if rs:
+            out.spin[side] = float(np.mean([abs(r["angle_deg"]) / r["sec"] for r in rs]))
+
+    center = [r for r in trials if r["kind"] == "center" and r.get("drift_cm") is not None]
+    out.counts["center"] = len(center)
+    if len({r["steer"] for r in center}) >= 2:
+        a, b = _line([r["steer"] for r in center], [r["drift_cm"] for r in center])
+        if a != 0:
+            out.center = -b / a
+    return out
+
+
+# =========================================================
+# 미션 스크립트용
+# =========================================================
+def apply_fitted(ns: dict, power: str = None, surface: str = None, path=CALIB_PATH):
+    """미션 상수(globals())를 맞춘 값으로 덮어쓰기. 기록 없으면 그대로"""
+    trials = load_trials(path, power, surface)
+    if not trials:
+        return None
+    f = fit(trials)
+    new = {}
+    if f.center is not None:
+        new["STEER_CENTER"] = round(f.center, 1)
+    if f.velocity is not None:
+        lo, hi = f.speeds
+        if not lo <= ns["SPEED"] <= hi:
+            print(f"[CALIB WARN] SPEED {ns['SPEED']} outside logged speeds {lo}..{hi} "
+                  f"-> FWD_SEC_1CELL / TURN_SEC_* 프로필 값 유지")
+        elif f.speed_mps(ns["SPEED"]) <= 0:
+            print(f"[CALIB WARN] fitted {f.speed_mps(ns['SPEED']):.3f} m/s at SPEED {ns['SPEED']} "
+                  f"-> FWD_SEC_1CELL / TURN_SEC_* 프로필 값 유지")
+        else:
+            new["FWD_SEC_1CELL"] = round(f.cell_sec(ns["SPEED"]), 2)
+            for side, steer in (("left", "STEER_LEFT"), ("right", "STEER_RIGHT")):
+                a, b = f.curvature.get(side, (0.0, 0.0))
+                if a * ns[steer] + b != 0:  # 기록 없는 쪽 / 0 나누기
+                    new[f"TURN_SEC_{side.upper()}"] = round(f.turn_sec(side, ns[steer], ns["SPEED"]), 2)
+    for k, v in new.items():
+        try:
+            if k != "STEER_CENTER" and v <= 0:
+                raise ProfileError(f"{k.lower()}: {v} <= 0")
+            lo, hi = sorted((ns["STEER_LEFT"], ns["STEER_RIGHT"]))
+            if k == "STEER_CENTER" and not lo < v < hi:
+                raise ProfileError(f"steer_center: {v} not between STEER_LEFT / STEER_RIGHT")
+            check(k.lower(), v)
+        except ProfileError as e:
+            print(f"[CALIB WARN] {e} -> {k} = {ns.get(k)} 유지")
+            continue
+        print(f"[CALIB] {k}: {ns.get(k)} -> {v}")
+        ns[k] = v
+    print(f"[CALIB] {len(trials)} trials (power={power}, surface={surface}) from {path}")
+    return f
+
+
+def report(f: Fit, speed: float = None, steer=None):
+    print("===== CALIBRATION FIT =====")
+    print("trials: " + ", ".join(f"{k}={n}" for k, n in f.counts.items()))
+    if f.velocity is not None:
+        k, b = f.velocity
+        print(f"velocity: {k * 100:.3f} cm/s per speed {b * 100:+.2f} cm/s")
+        for s in ([speed] if speed else [23.6, 35, 50]):
+            print(f"  SPEED {s:5.1f}: {f.speed_mps(s):.3f} m/s, FWD_SEC_1CELL = {f.cell_sec(s):.2f}s")
+    for side, (a, b) in f.curvature.items():
+        line = f"curvature {side}: {a:+.4f} * steer {b:+.3f} rad/m"
+        if speed and steer and side in steer:
+            line += f" -> TURN_SEC_{side.upper()} = {f.turn_sec(side, steer[side], speed):.2f}s"
+        print(line)
+    for side, dps in f.spin.items():
+        print(f"spin {side}: {dps:.1f} deg/s (90 deg = {90 / dps:.2f}s)")
+    if f.center is not None:
+        print(f"STEER_CENTER = {f.center:.1f}")
+    print("===========================")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("cmd", choices=["fit", "add"])
+    ap.add_argument("kind", nargs="?", choices=["forward", "turn", "center"])
+    ap.add_argument("--file", type=Path, default=CALIB_PATH)
+    ap.add_argument("--power", help="battery / charger")
+    ap.add_argument("--surface")
+    ap.add_argument("--speed", type=float)
+    ap.add_argument("--sec", type=float)
+    ap.add_argument("--distance", type=float, help="m")
+    ap.add_argument("--steer", type=float)
+    ap.add_argument("--angle", type=float, help="회전 각도 (+ 좌 / - 우)")
+    ap.add_argument("--drift", type=float, help="직진 쏠림 cm (+ 왼쪽)")
+    ap.add_argument("--left", type=float, help="fit: TURN_SEC_LEFT 계산할 STEER_LEFT")
+    ap.add_argument("--right", type=float, help="fit: TURN_SEC_RIGHT 계산할 STEER_RIGHT")
+    args = ap.parse_args()
+
+    if args.cmd == "add":
+        rec = log_trial(args.kind, args.file, speed=args.speed, sec=args.sec, distance_m=args.distance,
+                        steer=args.steer, angle_deg=args.angle, drift_cm=args.drift,
+                        power=args.power, surface=args.surface)
+        print(f"saved {rec}")
+        return
+    steer = {k: v for k, v in (("left", args.left), ("right", args.right)) if v is not None}
+    report(fit(load_trials(args.file, args.power, args.surface)), args.speed, steer)
+
+
+if __name__ == "__main__":
+    main()
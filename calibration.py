@@ -10,6 +10,11 @@ import time
 sys.path.append("/home/pi/Adeept_PiCar-Pro-V2/Code/Adeept_PiCar-Pro/Examples/04_Motor")
 from MotorCtrl import Motor, motorStop
 
+from calib_store import fit, load_trials, log_trial, report
+
+POWER = "battery"  # battery / charger
+SPEED = 30
+
 # -----------------------------
 # 이동 함수 (속도 안전하게 30으로 조정)
 # -----------------------------
@@ -49,6 +54,11 @@ def right_turn(t=1, speed=30):
     motorStop()
     time.sleep(0.5)
 
+def ask(prompt):
+    """측정값 입력 (빈칸 = 기록 안 함)"""
+    s = input(prompt).strip()
+    return float(s) if s else None
+
 # -----------------------------
 # 캘리브레이션 루틴
 # -----------------------------
@@ -60,9 +70,12 @@ def calibration_routine():
     # 1m 전진 테스트 (약 2초)
     print("\n1m 전진 테스트")
     start = time.time()
-    forward(2.0)
+    forward(2.0, SPEED)
     end = time.time()
     print(f"실제 1m 전진 시간: {end-start:.2f}초")
+    dist = ask("이동 거리 cm: ")
+    if dist:
+        log_trial("forward", speed=SPEED, sec=2.0, distance_m=dist / 100, power=POWER, script="calibration")
     
     # 1m 후진 테스트
     print("\n1m 후진 테스트")
@@ -74,18 +87,25 @@ def calibration_routine():
     # 90도 회전 테스트
     print("\n90도 우회전 테스트")
     start = time.time()
-    right_turn(1.0)
+    right_turn(1.0, SPEED)
     end = time.time()
     print(f"실제 90도 우회전 시간: {end-start:.2f}초")
+    angle = ask("회전 각도 deg: ")
+    if angle:
+        log_trial("turn", speed=SPEED, sec=1.0, angle_deg=-abs(angle), power=POWER, script="calibration")
 
     print("\n90도 좌회전 테스트")
     start = time.time()
-    left_turn(1.0)
+    left_turn(1.0, SPEED)
     end = time.time()
     print(f"실제 90도 좌회전 시간: {end-start:.2f}초")
+    angle = ask("회전 각도 deg: ")
+    if angle:
+        log_trial("turn", speed=SPEED, sec=1.0, angle_deg=abs(angle), power=POWER, script="calibration")
 
     print("\n===== 캘리브레이션 완료 =====")
-    print("측정한 시간을 main_safe.py forward/turn 함수에 반영하세요")
+    # 손으로 옮겨 적는 대신 calib_store 기록 -> 미션 스크립트가 시작할 때 읽음
+    report(fit(load_trials(power=POWER)), SPEED)
 
 # -----------------------------
 # 메인 실행
@@ -0,0 +1,97 @@
+# choreography.py
+# 서보 제스처를 주행과 다른 타임라인에서 재생 (motion.py 위)
+#   - 제스처 = 조 앞에서 꼭 보여줄 부분(play, 끝날 때까지 대기) + 뒷정리(defer, 예: 팔 복귀)
+#   - 뒷정리는 다음 주행이 시작될 때 같이 재생 -> 차는 바로 다음 조로 출발
+#   - 서보별 잠금: 아직 움직이는 중이거나 뒷정리가 남은 서보를 다른 제스처가 쓰려 하면 그게 끝날 때까지 대기
+#
+#   choreo = Choreographer()
+#   choreo.play("arm_grip", (arm1, arm2, grip), steps)   # 조 앞에서
+#   choreo.defer("arm_home", (arm1, arm2, grip), tail)   # 다음 주행 때
+#   with choreo.driving(idx): move_to(...)
+#   choreo.finish(); choreo.report()                     # 조별 아낀 시간
+
+from contextlib import contextmanager
+
+import hal
+import motion
+
+
+class Choreographer:
+    def __init__(self):
+        self._busy = {}      # id(서보) -> 그 서보를 쓰는 MotionFuture
+        self._deferred = []  # (이름, 서보들, 단계) 다음 주행 때 재생
+        self.overlaps = []   # (도착 조 idx, 이름, future, 주행 시작, 주행 끝)
+
+    def _claim(self, servos):
+        """서보 잠금: 남은 뒷정리는 지금 재생, 움직이는 중이면 끝날 때까지 대기"""
+        ids = {id(s) for s in servos if s is not None}
+        for item in [d for d in self._deferred if ids & {id(s) for s in d[1] if s is not None}]:
+            self._deferred.remove(item)
+            self._start(*item)
+        for i in ids:
+            fut = self._busy.get(i)
+            if fut is not None and not fut.done.is_set():
+                fut.wait()
+
+    def _start(self, name, servos, steps) -> motion.MotionFuture:
+        fut = motion.submit(steps, name)
+        for s in servos:
+            if s is not None:
+                self._busy[id(s)] = fut
+        return fut
+
+    def play(self, name: str, servos, steps, wait: bool = True) -> motion.MotionFuture:
+        self._claim(servos)
+        fut = self._start(name, servos, steps)
+        if wait:
+            fut.wait()
+        return fut
+
+    def defer(self, name: str, servos, steps):
+        self._claim(servos)
+        self._deferred.append((name, servos, steps))
+
+    @contextmanager
+    def driving(self, idx):
+        """주행 시작과 함께 남은 뒷정리 재생 (기다리지 않음)"""
+        t0 = hal.now()
+        started = [(name, self._start(name, servos, steps)) for name, servos, steps in self._deferred]
+        self._deferred = []
+        try:
+            yield
+        finally:
+            t1 = hal.now()
+            for name, fut in started:
+                self.overlaps.append((idx, name, fut, t0, t1))
+
+    def finish(self):
+        """미션 끝: 남은 뒷정리 재생 + 움직이는 서보 전부 대기"""
+        deferred, self._deferred = self._deferred, []
+        for item in deferred:
+            self._start(*item)
+        for fut in set(self._busy.values()):
+            if not fut.done.is_set():
+                fut.wait()
+
+    # -----------------------------------------------------
+    # 리포트
+    # -----------------------------------------------------
+    @staticmethod
+    def saved_sec(fut: motion.MotionFuture, d0: float, d1: float) -> float:
+        """주행 시작 ~ 뒷정리 끝 중 주행 시간 안에 든 부분 (= 멈춰서 기다렸을 시간)"""
+        if fut.finished is None:
+            return 0.0
+        return max(0.0, min(fut.finished, d1) - d0)
+
+    def report(self):
+        if not self.overlaps:
+            return 0.0
+        print("\n===== GESTURE / DRIVE OVERLAP =====")
+        total = 0.0
+        for idx, name, fut, d0, d1 in self.overlaps:
+            s = self.saved_sec(fut, d0, d1)
+            total += s
+            print(f"group {idx} -> {idx + 1}: {name} during drive, saved {s:.2f}s")
+        print(f"total mission time saved: {total:.2f}s")
+        print("===================================")
+        return total
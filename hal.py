@@ -0,0 +1,373 @@
+# hal.py
+# 하드웨어 추상화 (PCA9685 드라이버 + 시계)
+#   real : busio.I2C + adafruit PCA9685, 실제 시간 (time.sleep)
+#   sim  : 채널 쓰기를 시각과 함께 기록하는 가짜 PCA9685 + 가상 시계
+#          -> 차 없이 노트북에서 6조 미션 main() 전체를 몇 ms 만에 실행 (sim_mission.py)
+#
+# 미션 코드는 time.sleep 대신 hal.sleep, PCA9685(...) 대신 hal.pca9685(...)를 씀
+#   python3 sim_mission.py 888.py   # 미션 전체 (녹음 / STT 도 가상으로 바꿔서 실행)
+#   PICAR_SIM=1 은 PCA9685 / 시계만 가짜 -> 미션 main() 은 여전히 마이크 + OPENAI_API_KEY 필요
+
+import heapq
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+SIM_ADDRESS = 0x5F  # 가짜 PCA9685가 대답하는 주소 (미션의 PCA_ADDR_CANDIDATES 첫 번째)
+I2C_HZ = 100000         # 라즈베리파이 기본 I2C 속도
+TX_OVERHEAD_SEC = 2e-4  # 트랜잭션 한 번당 파이썬/드라이버 오버헤드 (추정치)
+
+
+# =========================================================
+# 시계
+# =========================================================
+class RealClock:
+    def now(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, sec: float):
+        if sec > 0:
+            time.sleep(sec)
+
+    def wait(self, event: threading.Event, timeout: float = None) -> bool:
+        return event.wait(timeout)
+
+    def hold(self):
+        pass
+
+    def release(self):
+        pass
+
+
+class VirtualClock:
+    """가상 시계. 만든 스레드(미션 main = 주인)의 sleep만 시간을 앞으로 돌림
+
+    다른 스레드(STT 워커 등 = 손님)는 hold() ~ release() 사이에서 일하고, 그 안의 sleep은
+    주인이 그 시각까지 시간을 돌릴 때까지 기다림. 주인은 손님이 일하는 중(hold)이면
+    시간을 돌리기 전에 끝나거나 sleep에 들어갈 때까지 기다려서 실행 순서가 항상 같음.
+    call_at()으로 건 함수는 주인이 시간을 돌리다가 그 시각이 되면 주인 스레드에서 실행.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = float(start)
+        self._cond = threading.Condition()
+        self._owner = threading.get_ident()
+        self._busy = 0     # 일하는 중인 손님 수
+        self._queue = []   # (시각, 순번, 깨움 표시 list | 실행할 함수)
+        self._seq = 0
+
+    def now(self) -> float:
+        return self._now
+
+    def hold(self):
+        with self._cond:
+            self._busy += 1
+
+    def release(self):
+        with self._cond:
+            self._busy -= 1
+            self._cond.notify_all()
+
+    def _push(self, due: float, item):
+        self._seq += 1
+        heapq.heappush(self._queue, (due, self._seq, item))
+
+    def _settle(self):
+        while self._busy > 0:
+            self._cond.wait()
+
+    def call_at(self, due: float, fn):
+        with self._cond:
+            self._push(due, fn)
+
+    def _advance_to(self, t: float):
+        """주인 스레드, 락 없이 호출. t까지 손님 깨우기 / 타이머 실행을 시각 순서대로"""
+        while True:
+            with self._cond:
+                self._settle()
+                if not self._queue or self._queue[0][0] > t:
+                    self._now = max(self._now, t)
+                    return
+                due, _, item = heapq.heappop(self._queue)
+                self._now = max(self._now, due)
+                if isinstance(item, list):
+                    item.append(True)
+                    self._busy += 1  # 깨운 손님이 다시 sleep / release 할 때까지 시간 정지
+                    self._cond.notify_all()
+                    continue
+            item()  # 락 밖에서 (PCA 쓰기가 다시 시계를 쓸 수 있음)
+
+    def sleep(self, sec: float):
+        if sec <= 0:
+            return
+        if threading.get_ident() == self._owner:
+            self._advance_to(self._now + sec)
+            return
+        with self._cond:
+            woken = []
+            self._push(self._now + sec, woken)
+            self._busy -= 1
+            self._cond.notify_all()
+            while not woken:
+                self._cond.wait()
+
+    def wait(self, event: threading.Event, timeout: float = None) -> bool:
+        """주인: 손님 / 타이머가 event를 set할 때까지 필요한 만큼만 시간을 돌림"""
+        if threading.get_ident() != self._owner:
+            return event.wait(timeout)
+        deadline = None if timeout is None else self._now + timeout
+        while not event.is_set():
+            with self._cond:
+                if self._busy > 0:
+                    self._cond.wait()
+                    continue
+                nxt = self._queue[0][0] if self._queue else None
+            if nxt is None or (deadline is not None and nxt > deadline):
+                break
+            self._advance_to(nxt)
+        if event.is_set():
+            return True
+        if deadline is not None:
+            self._advance_to(deadline)
+            return event.is_set()
+        return event.wait()  # 가상 시간과 상관없는 대기 (실제 시간으로)
+
+
+clock = RealClock()
+
+
+def now() -> float:
+    return clock.now()
+
+
+def sleep(sec: float):
+    clock.sleep(sec)
+
+
+def wait(event: threading.Event, timeout: float = None) -> bool:
+    return clock.wait(event, timeout)
+
+
+# =========================================================
+# 가짜 PCA9685 (sim)
+# =========================================================
+class SimChannel:
+    def __init__(self, board, index: int):
+        self._board = board
+        self._index = index
+
+    @property
+    def frequency(self):
+        return self._board.frequency
+
+    @property
+    def duty_cycle(self) -> int:
+        return self._board.duty[self._index]
+
+    @duty_cycle.setter
+    def duty_cycle(self, value: int):
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError(f"Out of range: value {value} not 0 <= value <= 65,535")
+        self._board.write(self._index, int(value))
+
+
+class SimPCA9685:
+    """채널 쓰기를 (가상 시각, 채널, duty) 로 전부 기록
+
+    I2C 트랜잭션 하나마다 버스 시간만큼 가상 시간이 흐르고, 출력은 트랜잭션 끝(STOP)에 바뀜
+    (채널 하나 = 주소 + 레지스터 + 4바이트, write_channels = 자동 증가 블록 쓰기 한 번)
+    만들 때 MODE1 리셋 한 번, frequency 설정은 adafruit 드라이버처럼 4번 + 오실레이터 5 ms,
+    frequency 읽기는 PRESCALE 레지스터 읽기 한 번 (서보 만들 때 2번)
+    """
+
+    def __init__(self, address: int = SIM_ADDRESS, frequency: int = 50, bus_model: bool = True):
+        self.address = address
+        self._frequency = frequency
+        self.channels = [SimChannel(self, i) for i in range(16)]
+        self.duty = [0] * 16
+        self.log = []
+        self.transactions = 0
+        self.bus_model = bus_model
+        self._mode1 = 0x00
+        self._transaction(0)  # reset (MODE1 = 0)
+
+    def _transaction(self, n_channels: int):
+        self.transactions += 1
+        if self.bus_model:
+            clock.sleep(TX_OVERHEAD_SEC + (2 + 4 * n_channels) * 9 / I2C_HZ)
+
+    @property
+    def frequency(self):
+        return 25000000 / 4096 / (self.prescale_reg + 1)
+
+    @frequency.setter
+    def frequency(self, value):
+        for _ in range(4):  # MODE1 sleep / PRESCALE / MODE1 / MODE1 restart + 자동 증가
+            self._transaction(0)
+        clock.sleep(0.005)
+        self._frequency = value
+        self._mode1 = 0xA0
+
+    @property
+    def prescale_reg(self) -> int:
+        self._transaction(0)  # 레지스터 하나 읽기 (주소 + 레지스터 / 주소 + 1바이트)
+        return int(25000000 / 4096 / self._frequency + 0.5) - 1
+
+    @property
+    def mode1_reg(self) -> int:
+        self._transaction(0)
+        return self._mode1
+
+    @mode1_reg.setter
+    def mode1_reg(self, value: int):
+        self._transaction(0)
+        self._mode1 = value
+
+    def write(self, ch: int, value: int):
+        self._transaction(1)
+        self.duty[ch] = value
+        self.log.append((clock.now(), ch, value))
+
+    def write_channels(self, first: int, values):
+        """LED{first}_ON_L 부터 자동 증가 블록 쓰기 (채널 여러 개가 동시에 바뀜)"""
+        self._transaction(len(values))
+        t = clock.now()
+        for i, value in enumerate(values):
+            self.duty[first + i] = value
+            self.log.append((t, first + i, value))
+
+    def deinit(self):
+        self.duty = [0] * 16
+
+
+sim_boards = []  # sim에서 만든 보드 (sim_mission.py 리포트용)
+
+
+# =========================================================
+# 백엔드 선택
+# =========================================================
+BACKEND = "real"
+
+
+def use_sim(start: float = 0.0) -> VirtualClock:
+    """가상 PCA9685 + 가상 시계로 전환. 부른 스레드가 시계 주인이 됨"""
+    global BACKEND, clock
+    BACKEND = "sim"
+    clock = VirtualClock(start)
+    sim_boards.clear()
+    return clock
+
+
+def i2c_bus():
+    if BACKEND == "sim":
+        return None
+    import busio
+    from board import SCL, SDA
+    return busio.I2C(SCL, SDA)
+
+
+def scan(i2c) -> list:
+    """버스 전체를 한 번 훑어서 대답한 주소 목록 (후보 주소마다 드라이버를 만들어 보는 것보다 빠름)"""
+    if BACKEND == "sim":
+        clock.sleep(TX_OVERHEAD_SEC + 112 * 9 / I2C_HZ)  # 0x08 ~ 0x77 주소 바이트 하나씩
+        return [SIM_ADDRESS]
+    while not i2c.try_lock():
+        pass
+    try:
+        return i2c.scan()
+    finally:
+        i2c.unlock()
+
+
+def pca9685(i2c, address: int):
+    if BACKEND == "sim":
+        if address != SIM_ADDRESS:
+            clock.sleep(TX_OVERHEAD_SEC + 9 / I2C_HZ)  # 주소 NACK
+            raise ValueError(f"No I2C device at address: {hex(address)}")
+        board = SimPCA9685(address)
+        sim_boards.append(board)
+        return board
+    from adafruit_pca9685 import PCA9685
+    return PCA9685(i2c, address=address)
+
+
+# =========================================================
+# DCMotor / Servo
+# 라즈베리파이에는 adafruit_motor가 있고, 노트북(sim)에 없으면 같은 계산의 최소 구현 사용
+# =========================================================
+class _DCMotor:
+    def __init__(self, positive_pwm, negative_pwm):
+        self._positive = positive_pwm
+        self._negative = negative_pwm
+        self._throttle = None
+        self.decay_mode = _FAST_DECAY
+
+    @property
+    def throttle(self):
+        return self._throttle
+
+    @throttle.setter
+    def throttle(self, value):
+        if value is not None and not -1.0 <= value <= 1.0:
+            raise ValueError("Throttle must be None or between -1.0 and +1.0")
+        self._throttle = value
+        if value is None:
+            self._positive.duty_cycle = 0
+            self._negative.duty_cycle = 0
+            return
+        duty = int(0xFFFF * abs(value))
+        if self.decay_mode == _SLOW_DECAY:
+            if value < 0:
+                self._positive.duty_cycle = 0xFFFF - duty
+                self._negative.duty_cycle = 0xFFFF
+            else:
+                self._positive.duty_cycle = 0xFFFF
+                self._negative.duty_cycle = 0xFFFF - duty
+        elif value == 0:
+            self._positive.duty_cycle = 0xFFFF
+            self._negative.duty_cycle = 0xFFFF
+        elif value < 0:
+            self._positive.duty_cycle = 0
+            self._negative.duty_cycle = duty
+        else:
+            self._positive.duty_cycle = duty
+            self._negative.duty_cycle = 0
+
+
+class _Servo:
+    def __init__(self, pwm_out, *, actuation_range=180, min_pulse=750, max_pulse=2250):
+        self._pwm_out = pwm_out
+        self.actuation_range = actuation_range
+        self._min_duty = int(min_pulse * pwm_out.frequency / 1000000 * 0xFFFF)
+        max_duty = int(max_pulse * pwm_out.frequency / 1000000 * 0xFFFF)
+        self._duty_range = max_duty - self._min_duty
+        self._angle = None
+
+    @property
+    def angle(self):
+        return self._angle
+
+    @angle.setter
+    def angle(self, new_angle):
+        if new_angle is None:
+            self._pwm_out.duty_cycle = 0
+            self._angle = None
+            return
+        if not 0 <= new_angle <= self.actuation_range:
+            raise ValueError("Angle out of range")
+        self._angle = new_angle
+        self._pwm_out.duty_cycle = self._min_duty + int(new_angle / self.actuation_range * self._duty_range)
+
+
+_FAST_DECAY, _SLOW_DECAY = 0, 1
+
+try:
+    from adafruit_motor import motor, servo
+except ImportError:
+    motor = SimpleNamespace(DCMotor=_DCMotor, FAST_DECAY=_FAST_DECAY, SLOW_DECAY=_SLOW_DECAY)
+    servo = SimpleNamespace(Servo=_Servo)
+
+
+if os.environ.get("PICAR_SIM"):
+    use_sim()
@@ -0,0 +1,276 @@
+# lang_id.py
+# STT 없이 Pi CPU에서 영어/한국어 비율 추정 (MFCC + 로지스틱 회귀, 모델은 NumPy .npz)
+# 로컬 추정이 애매할 때만 클라우드 STT 사용
+#
+#   python3 lang_id.py train --dir /home/pi/recorded_voice   # WAV + 같은 이름 .txt(STT 결과)로 학습
+#   python3 lang_id.py eval  --dir /home/pi/recorded_voice   # 로컬 판단 vs STT 판단, 지연시간 비교
+#   python3 lang_id.py eval  --dir ... --stt                  # .txt 없으면 STT 호출해서 만들기
+#   python3 lang_id.py eval  --dir ... --profile 999          # 임계값 / min_z 는 미션 프로필 값 (기본 PICAR_PROFILE)
+
+import argparse
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from text_ratio import english_ratio
+from upload_prep import read_audio, resample
+
+SR = 16000
+WIN = 400        # 25 ms
+HOP = 160        # 10 ms
+N_FFT = 512
+N_MELS = 26
+N_MFCC = 13
+WIN_FRAMES = 100  # 판단 단위 1초 (100 프레임)
+
+DEFAULT_MODEL = Path(__file__).with_name("lang_id_model.npz")
+
+
+# =========================================================
+# 특징 (MFCC)
+# =========================================================
+@lru_cache(maxsize=1)
+def mel_filterbank():
+    def hz2mel(f):
+        return 2595 * np.log10(1 + f / 700)
+
+    def mel2hz(m):
+        return 700 * (10 ** (m / 2595) - 1)
+
+    mels = np.linspace(hz2mel(0), hz2mel(SR / 2), N_MELS + 2)
+    bins = np.floor((N_FFT + 1) * mel2hz(mels) / SR).astype(int)
+    fb = np.zeros((N_MELS, N_FFT // 2 + 1), np.float32)
+    for i in range(N_MELS):
+        l, c, r = bins[i], bins[i + 1], bins[i + 2]
+        if c > l:
+            fb[i, l:c] = (np.arange(l, c) - l) / (c - l)
+        if r > c:
+            fb[i, c:r] = (r - np.arange(c, r)) / (r - c)
+    return fb
+
+
+@lru_cache(maxsize=1)
+def dct_matrix():
+    n = np.arange(N_MELS)
+    k = np.arange(N_MFCC)[:, None]
+    d = np.cos(np.pi * k * (2 * n + 1) / (2 * N_MELS)) * np.sqrt(2 / N_MELS)
+    d[0] /= np.sqrt(2)
+    return d.astype(np.float32)
+
+
+def mfcc(x: np.ndarray):
+    """int16 16 kHz -> (프레임별 MFCC (n, 13), 프레임별 log 에너지 (n,))"""
+    x = x.astype(np.float32) / 32768.0
+    if len(x) < WIN:
+        return np.empty((0, N_MFCC), np.float32), np.empty(0, np.float32)
+    x = np.append(x[0], x[1:] - 0.97 * x[:-1])  # pre-emphasis
+    frames = np.lib.stride_tricks.sliding_window_view(x, WIN)[::HOP] * np.hamming(WIN).astype(np.float32)
+    power = np.abs(np.fft.rfft(frames, N_FFT)) ** 2 / N_FFT
+    energy = np.log(power.sum(axis=1) + 1e-10)
+    mel = np.log(power @ mel_filterbank().T + 1e-10)
+    return mel @ dct_matrix().T, energy
+
+
+def window_features(x: np.ndarray):
+    """1초 창별 [MFCC 평균, 표준편차, 델타 평균] (n_win, 39). 말소리 적은 창은 제외"""
+    c, energy = mfcc(x)
+    n_win = len(c) // WIN_FRAMES
+    if n_win == 0:
+        return np.empty((0, 3 * N_MFCC), np.float32)
+    c = c[:n_win * WIN_FRAMES]
+    delta = np.diff(c, axis=0, prepend=c[:1])
+
+    # 노이즈 바닥(하위 10%) + 10 dB 또는 큰 소리(상위 10%) - 10 dB 중 낮은 쪽보다 크면 말소리 프레임
+    # (ln 에너지라서 10 dB = ln 10 ≈ 2.3)
+    lo, hi = np.percentile(energy, [10, 90])
+    speech = energy[:n_win * WIN_FRAMES] > min(lo + 2.3, hi - 2.3)
+    keep = speech.reshape(n_win, WIN_FRAMES).mean(axis=1) >= 0.5
+
+    cw = c.reshape(n_win, WIN_FRAMES, N_MFCC)
+    dw = delta.reshape(n_win, WIN_FRAMES, N_MFCC)
+    feats = np.concatenate((cw.mean(axis=1), cw.std(axis=1), dw.mean(axis=1)), axis=1)
+    return feats[keep]
+
+
+def load_16k(audio) -> np.ndarray:
+    x, sr = read_audio(audio)
+    return resample(x, sr, SR)
+
+
+# =========================================================
+# 모델
+# =========================================================
+def sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class LangEstimate:
+    def __init__(self, ratio: float, z: float, windows: int, ms: float):
+        self.ratio = ratio      # 추정 영어 비율 (0~1)
+        self.z = z              # |ratio - 기준| / 표준오차
+        self.windows = windows  # 사용한 1초 창 개수
+        self.ms = ms
+
+    def confident(self, min_z: float, min_windows: int = 3) -> bool:
+        return self.windows >= min_windows and self.z >= min_z
+
+
+class LangId:
+    def __init__(self, mean, std, w, b):
+        self.mean = mean
+        self.std = std
+        self.w = w
+        self.b = float(b)
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL):
+        d = np.load(path)
+        return cls(d["mean"], d["std"], d["w"], d["b"])
+
+    def save(self, path=DEFAULT_MODEL):
+        np.savez(path, mean=self.mean, std=self.std, w=self.w, b=self.b)
+
+    def window_probs(self, feats: np.ndarray) -> np.ndarray:
+        return sigmoid(((feats - self.mean) / self.std) @ self.w + self.b)
+
+    def estimate(self, audio, threshold: float) -> LangEstimate:
+        t0 = time.perf_counter()
+        p = self.window_probs(window_features(load_16k(audio)))
+        ms = (time.perf_counter() - t0) * 1000
+        if len(p) == 0:
+            return LangEstimate(0.0, 0.0, 0, ms)
+        ratio = float(p.mean())
+        se = float(p.std(ddof=1) / np.sqrt(len(p))) if len(p) > 1 else 0.5
+        z = abs(ratio - threshold) / max(se, 1e-3)
+        return LangEstimate(ratio, z, len(p), ms)
+
+    def decide(self, audio, threshold: float, min_z: float):
+        """확신 있으면 LangEstimate, 아니면 None (-> 클라우드 STT)"""
+        est = self.estimate(audio, threshold)
+        ok = est.confident(min_z)
+        tag = "local decision" if ok else "low confidence -> STT"
+        print(f"[LID] english={est.ratio * 100:.1f}% z={est.z:.1f} win={est.windows} "
+              f"({est.ms:.0f} ms, {tag})")
+        return est if ok else None
+
+
+def train(feats: np.ndarray, labels: np.ndarray, l2: float = 1e-3, lr: float = 0.5, iters: int = 2000) -> LangId:
+    """로지스틱 회귀 (labels는 0~1 소프트 라벨 = 녹음 전체의 영어 비율)"""
+    mean = feats.mean(axis=0)
+    std = feats.std(axis=0) + 1e-6
+    X = (feats - mean) / std
+    w = np.zeros(X.shape[1])
+    b = 0.0
+    for _ in range(iters):
+        g = sigmoid(X @ w + b) - labels
+        w -= lr * (X.T @ g / len(X) + l2 * w)
+        b -= lr * g.mean()
+    return LangId(mean, std, w, b)
+
+
+# =========================================================
+# 학습 / 평가 CLI
+# =========================================================
+def stt_sidecar(wav: Path, client=None, model: str = "gpt-4o-mini-transcribe"):
+    """(텍스트, STT 지연 ms). WAV 옆 .txt 있으면 그걸 쓰고, 없고 client 있으면 STT 호출 후 저장"""
+    txt = wav.with_suffix(".txt")
+    if txt.exists():
+        return txt.read_text(encoding="utf-8"), None
+    if client is None:
+        return None, None
+    t0 = time.perf_counter()
+    with open(wav, "rb") as f:
+        res = client.audio.transcriptions.create(model=model, file=f)
+    ms = (time.perf_counter() - t0) * 1000
+    text = (res.text or "").strip()
+    txt.write_text(text, encoding="utf-8")
+    return text, ms
+
+
+def cmd_train(args):
+    X, y = [], []
+    for wav in sorted(Path(args.dir).glob("*.wav")):
+        text, _ = stt_sidecar(wav)
+        if text is None:
+            continue
+        f = window_features(load_16k(wav))
+        X.append(f)
+        y.append(np.full(len(f), english_ratio(text)))
+        print(f"{wav.name}: {len(f)} windows, english={y[-1][0] * 100 if len(f) else 0:.0f}%")
+    if not X or not sum(len(f) for f in X):
+        raise SystemExit("학습할 WAV + .txt 없음")
+    model = train(np.concatenate(X), np.concatenate(y))
+    model.save(args.model)
+    print(f"saved {args.model}")
+
+
+def cmd_eval(args):
+    model = LangId.load(args.model)
+    client = None
+    if args.stt:
+        from openai import OpenAI
+        client = OpenAI()
+
+    rows = []
+    for wav in sorted(Path(args.dir).glob("*.wav")):
+        text, stt_ms = stt_sidecar(wav, client)
+        if text is None:
+            continue
+        ref = english_ratio(text)
+        est = model.estimate(wav, args.threshold)
+        local_ok = est.confident(args.min_z)
+        match = (est.ratio >= args.threshold) == (ref >= args.threshold)
+        rows.append((local_ok, match, est.ms, stt_ms))
+        stt_s = f"{stt_ms:.0f}" if stt_ms is not None else "-"
+        print(f"{wav.name:32s} ref={ref * 100:5.1f}% local={est.ratio * 100:5.1f}% z={est.z:5.1f} "
+              f"{'LOCAL' if local_ok else 'STT  '} {'ok' if match else 'MISMATCH'} "
+              f"local={est.ms:.0f}ms stt={stt_s}ms")
+
+    if not rows:
+        raise SystemExit("평가할 WAV + .txt 없음")
+    n = len(rows)
+    local = [r for r in rows if r[0]]
+    stt_ms = [r[3] for r in rows if r[3] is not None]
+    print("\n===== LANG ID EVAL =====")
+    print(f"files: {n}")
+    print(f"decision agreement (all): {sum(r[1] for r in rows) / n * 100:.1f}%")
+    if local:
+        print(f"local fast path used: {len(local)}/{n}, agreement {sum(r[1] for r in local) / len(local) * 100:.1f}%")
+    print(f"local latency mean: {np.mean([r[2] for r in rows]):.0f} ms")
+    if stt_ms:
+        print(f"STT latency mean: {np.mean(stt_ms):.0f} ms")
+    print("========================")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    for name in ("train", "eval"):
+        p = sub.add_parser(name)
+        p.add_argument("--dir", default="/home/pi/recorded_voice")
+        p.add_argument("--model", default=str(DEFAULT_MODEL))
+        p.add_argument("--profile", default=os.environ.get("PICAR_PROFILE", "998"),
+                       help="--threshold / --min-z 기본값을 가져올 미션 프로필")
+        p.add_argument("--threshold", type=float, help="기본: 프로필 en_threshold")
+        p.add_argument("--min-z", type=float, help="기본: 프로필 lang_id_min_z")
+    sub.choices["eval"].add_argument("--stt", action="store_true", help=".txt 없으면 STT 호출")
+    args = ap.parse_args()
+    if args.threshold is None or args.min_z is None:
+        import mission_profile  # 미션과 같은 판단으로 평가
+
+        prof = mission_profile.load(args.profile).values
+        if args.threshold is None:
+            args.threshold = prof["en_threshold"]
+        if args.min_z is None:
+            args.min_z = prof["lang_id_min_z"]
+    if args.cmd == "train":
+        cmd_train(args)
+    else:
+        cmd_eval(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# lazy.py
+# 무거운 모듈 늦게 불러오기 + 시작 import 시간 분석
+# 라즈베리파이에서 openai import 하나가 몇 초 -> 미션 시작(1조 녹음 / 첫 이동)이 그만큼 늦어짐
+#   - Module     : 첫 속성 접근 때 import (조건부로만 쓰는 route_opt / stt_stream 등)
+#   - Background : 함수를 백그라운드 스레드에서 실행하고 결과 객체처럼 사용 (속성 접근하면 끝날 때까지 대기)
+#                  STT 클라이언트는 1조 녹음 / 첫 이동 중에 준비되고, 첫 STT 호출이 필요하면 기다림
+#   - preload    : 곧 쓸 모듈을 백그라운드에서 미리 import
+#   - profile_startup : python -X importtime 으로 미션 모듈 로드(main 전)까지 import 시간 분해
+#
+#   route_opt = lazy.Module("route_opt")
+#   client = lazy.Background(_openai_client, "openai")
+#   client.audio.transcriptions.create(...)    # 준비 안 됐으면 여기서 기다림
+#
+#   python3 888.py --profile-startup
+#   python3 lazy.py 998.py --top 20
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# 미션 모듈 로드 때는 안 불러오고 늦게(또는 백그라운드로) 불러오는 모듈
+DEFERRED = ["openai", "numpy", "sounddevice", "soundfile", "busio", "board", "adafruit_pca9685"]
+
+
+class Module:
+    """첫 속성 접근 때 import (import 락이 있어서 preload 스레드와 같이 써도 안전)"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._mod = None
+
+    def __getattr__(self, attr):
+        if self._mod is None:
+            self._mod = importlib.import_module(self._name)
+        return getattr(self._mod, attr)
+
+
+class Background:
+    """fn()을 데몬 스레드에서 실행. get() / 속성 접근은 끝날 때까지 기다리고, 예외는 그대로 다시 발생"""
+
+    def __init__(self, fn, name: str = None):
+        self.name = name or getattr(fn, "__name__", "background")
+        self.sec = None
+        self._fn = fn
+        self._value = None
+        self._error = None
+        self._done = threading.Event()
+        threading.Thread(target=self._run, name=f"lazy-{self.name}", daemon=True).start()
+
+    def _run(self):
+        t0 = time.perf_counter()
+        try:
+            self._value = self._fn()
+        except BaseException as e:
+            self._error = e
+        self.sec = time.perf_counter() - t0
+        self._done.set()
+
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def get(self, timeout: float = None):
+        if not self._done.is_set():
+            t0 = time.perf_counter()
+            if not self._done.wait(timeout):
+                raise TimeoutError(f"{self.name} not ready after {timeout}s")
+            print(f"[LAZY] waited {time.perf_counter() - t0:.2f}s for {self.name}")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def __getattr__(self, attr):
+        return getattr(self.get(), attr)
+
+
+def preload(*names) -> Background:
+    """모듈들을 백그라운드에서 import (없는 모듈은 건너뜀)"""
+    def run():
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+    return Background(run, "preload " + ", ".join(names))
+
+
+# =========================================================
+# 시작 import 시간 분석
+# =========================================================
+def _importtime(code: str, env=None):
+    """-X importtime 출력 -> [(깊이, 이름, self us, cumulative us)]"""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                         capture_output=True, text=True, env=env)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cum_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # 머리 줄
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2  # " a" = 0, "   b" = 1, ...
+        rows.append((depth, name.strip(), self_us, cum_us))
+    return rows, out.returncode, out.stderr
+
+
+def profile_startup(script, top: int = 15):
+    """미션 스크립트 모듈 로드(main 실행 전)까지 import 시간. 무거운 top 개 + 늦게 불러오는 모듈 목록"""
+    env = dict(os.environ)
+    code = f"import runpy; runpy.run_path({str(script)!r}, run_name='startup_profile')"
+    t0 = time.perf_counter()
+    rows, rc, err = _importtime(code, env)
+    wall = time.perf_counter() - t0
+    if rc != 0:
+        print(err.strip().splitlines()[-1] if err.strip() else f"exit {rc}")
+        return
+    loaded = {name for _, name, _, _ in rows}
+    first = [r for r in rows if r[0] == 0]
+    total = sum(r[3] for r in first)
+
+    print(f"===== STARTUP IMPORTS ({script}) =====")
+    print(f"{'module':28s} {'cumulative':>11s} {'self':>9s}")
+    for _, name, self_us, cum_us in sorted(first, key=lambda r: -r[3])[:top]:
+        print(f"{name:28s} {cum_us / 1000:8.1f} ms {self_us / 1000:6.1f} ms")
+    print(f"{'imports total':28s} {total / 1000:8.1f} ms  ({len(rows)} modules)")
+    print(f"{'python + load (wall)':28s} {wall * 1000:8.1f} ms")
+
+    print("heavy modules (loaded at startup / deferred: import time on its own):")
+    for name in DEFERRED:
+        if name in loaded:
+            print(f"  {name:26s} loaded at startup")
+            continue
+        sub, rc, _ = _importtime(f"import {name}", env)
+        if rc != 0:
+            print(f"  {name:26s} not installed")
+            continue
+        cum = next(r[3] for r in sub if r[1] == name)
+        print(f"  {name:26s} {cum / 1000:8.1f} ms")
+    print("=" * 40)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("script", help="888.py / 998.py / 999.py / mission.py")
+    ap.add_argument("--top", type=int, default=15)
+    args = ap.parse_args()
+    profile_startup(args.script, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,16 @@
 # measure_1m_time.py
 # Adeept PiCar-Pro + Raspberry Pi
 # 1m 직진 시간 측정용 테스트 코드
+# 측정할 때마다 calib_store 에 기록 -> python3 calib_store.py fit 으로 속도별 주행 속도 확인
 
 import time
 from picarpro import car
 
+from calib_store import fit, load_trials, log_trial, report
+
 FORWARD_SPEED = 50   # 원하는 속도(0~100). 테스트 후 조정 가능.
+POWER = "battery"    # battery / charger
+SURFACE = None       # 바닥 (예: "tile")
 
 def measure_one_meter(speed=FORWARD_SPEED):
     print("\n==============================")
@@ -27,6 +32,8 @@ def measure_one_meter(speed=FORWARD_SPEED):
     duration = end - start
 
     print(f"\n[결과] 속도 {speed}에서 1m 이동 시간: {duration:.3f}초\n")
+    log_trial("forward", speed=speed, sec=duration, distance_m=1.0, power=POWER, surface=SURFACE,
+              script="measure_1m_time")
     return duration
 
 
@@ -39,6 +46,7 @@ if __name__ == "__main__":
             again = input("한 번 더 측정할까요? (y/n): ")
             if again.lower() != 'y':
                 print("측정 종료.")
+                report(fit(load_trials(power=POWER, surface=SURFACE)), FORWARD_SPEED)
                 break
 
     except KeyboardInterrupt:
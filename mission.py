@@ -0,0 +1,553 @@
+# mission.py
+# 조 순회 미션 엔진. 888.py / 998.py / 999.py 는 프로필 이름만 고르는 런처
+# 채널 / 각도 / 시간 / 임계값은 전부 profiles/<이름>.toml (mission_profile.py 가 검사 + 캐시)
+# 조 사이에 프로필 파일을 고치면 다음 이동부터 적용 (속도 / 시간 / 각도 / 임계값)
+#
+#   PICAR_PROFILE=998 python3 mission.py
+#   python3 sim_mission.py mission.py --profile 999
+#   python3 mission_profile.py 998 --diff 999        # A/B 비교
+#   python3 888.py --profile-startup                  # main 전까지 import 시간 분해 (lazy.py)
+
+import os
+import subprocess
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+import lazy
+
+if "--profile-startup" in sys.argv:
+    lazy.profile_startup(sys.argv[0])
+    raise SystemExit
+
+import hal
+from hal import motor
+
+from audio_capture import RingCapture, Segment, open_for_upload
+import bringup
+from calib_store import apply_fitted
+from choreography import Choreographer
+import mission_profile
+import mission_trace
+import motion
+import power
+import stt_cache
+import stt_hedge
+from planner import Costs, describe, plan_route
+from pwm_batch import set_throttle
+from stt_pipeline import SttPipeline
+from text_ratio import count_lang, english_ratio
+import trajectory
+from vad import StreamingVad, VadStats
+
+# 조건부로만 쓰는 모듈은 첫 사용 때 import (lazy.py)
+lang_id = lazy.Module("lang_id")
+route_opt = lazy.Module("route_opt")
+stt_stream = lazy.Module("stt_stream")
+upload_prep = lazy.Module("upload_prep")
+
+# =========================================================
+# 프로필 -> 모듈 상수 (SPEED, PATH, STEER_CH, GRIP_OPEN, ...)
+# =========================================================
+PROFILE = mission_profile.load(os.environ.get("PICAR_PROFILE", "998"))
+globals().update(PROFILE.constants())
+
+VAD_STATS = VadStats()
+
+# 주행 비용이 바뀌면 남은 구간 다시 계획 (planner.Costs)
+REPLAN_KEYS = {"FWD_SEC_1CELL", "TURN_SEC_LEFT", "TURN_SEC_RIGHT", "UTURN_SEC", "REVERSE_SEC"}
+
+# =========================================================
+# 내부 유틸
+# =========================================================
+def sp(x: int) -> float:
+    return max(0, min(100, x)) / 100.0
+
+def run(cmd: list[str]):
+    return subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+# =========================================================
+# 하드웨어 초기화
+# =========================================================
+def init_pca():
+    # 지난번 주소 캐시 -> 레지스터 한 번 읽기로 확인, 안 되면 버스 스캔 (bringup.py)
+    chs = ("STEER_CH", "HEAD_YAW_CH", "ARM_J1_CH", "ARM_J2_CH", "GRIP_CH")
+    return bringup.open_pca(PCA_ADDR_CANDIDATES, {k: globals()[k] for k in chs})
+
+def make_servo(pwm, ch: int | None):
+    if ch is None:
+        return None
+    return bringup.servo(pwm, ch, min_pulse=500, max_pulse=2500)
+
+# =========================================================
+# 모터/조향 제어
+# =========================================================
+M1_IN1, M1_IN2 = 15, 14
+M2_IN1, M2_IN2 = 12, 13
+
+def make_motors(pwm):
+    m1 = motor.DCMotor(pwm.channels[M1_IN1], pwm.channels[M1_IN2])
+    m2 = motor.DCMotor(pwm.channels[M2_IN1], pwm.channels[M2_IN2])
+    for m in (m1, m2):
+        m.decay_mode = motor.SLOW_DECAY
+    return m1, m2
+
+def stop_all(motors):
+    set_throttle(motors, 0)
+
+def drive_forward_time(motors, sec: float, speed=None):
+    power.drive(motors, sec, sp(SPEED if speed is None else speed))
+
+# =========================================================
+# 3 -> 4 유턴 전용
+# =========================================================
+@mission_trace.traced("uturn")
+def uturn_half_circle(motors, steer_srv):
+    print("[UTURN] start (3 -> 4)")
+    v, k = power.scale(sp(SPEED))  # 전압 보정 (throttle 올리거나 시간 늘리기)
+    t_stop = 0.2 + UTURN_SEC * k
+    t_rev = t_stop + 0.4
+    steps = motion.angle_steps(steer_srv, [(0.0, STEER_LEFT), (t_stop + 0.2, STEER_CENTER_UTURN)])
+    steps += [
+        (0.2, lambda: set_throttle(motors, v)),
+        (t_stop, lambda: stop_all(motors)),
+        (t_rev, lambda: set_throttle(motors, -v)),
+        (t_rev + REVERSE_SEC * k, lambda: stop_all(motors)),
+    ]
+    motion.submit(steps, "uturn").wait()
+    print("[UTURN] done (arrived at group 4)")
+
+# =========================================================
+# 회전/직진
+# =========================================================
+def steer_to(steer_srv, angle: int):
+    motion.submit(motion.angle_steps(steer_srv, [(0.0, angle)]) + motion.hold(0.15), "steer").wait()
+
+@mission_trace.traced("turn_left")
+def turn_left_90(motors, steer_srv):
+    steer_to(steer_srv, STEER_LEFT)
+    drive_forward_time(motors, TURN_SEC_LEFT, speed=SPEED)
+    steer_to(steer_srv, STEER_CENTER)
+
+@mission_trace.traced("turn_right")
+def turn_right_90(motors, steer_srv):
+    steer_to(steer_srv, STEER_RIGHT)
+    drive_forward_time(motors, TURN_SEC_RIGHT, speed=SPEED)
+    steer_to(steer_srv, STEER_CENTER)
+
+@mission_trace.traced("forward")
+def forward_cells(motors, steer_srv, n=1):
+    steer_to(steer_srv, STEER_CENTER)  # 직진 전 센터
+    drive_forward_time(motors, FWD_SEC_1CELL * n, speed=SPEED)
+
+def run_leg(leg, motors, steer_srv):
+    """planner 명령 목록 실행 (직진은 n칸 한 번에)"""
+    for cmd, n in leg:
+        if cmd == "forward":
+            forward_cells(motors, steer_srv, n)
+        elif cmd == "left":
+            turn_left_90(motors, steer_srv)
+        elif cmd == "right":
+            turn_right_90(motors, steer_srv)
+        elif cmd == "uturn":
+            uturn_half_circle(motors, steer_srv)
+
+# =========================================================
+# 녹음 - STT
+# =========================================================
+@mission_trace.traced("record_wav")
+def record_wav():
+    cmd = [
+        "arecord",
+        "-D", ARECORD_DEVICE,
+        "-f", "S16_LE",
+        "-r", str(SAMPLE_RATE),
+        "-c", "1",
+        "-d", str(RECORD_SEC),
+        str(AUDIO_PATH),
+    ]
+    print(f"[REC] {RECORD_SEC}s -> {AUDIO_PATH}")
+    run(cmd)
+
+def record_audio(cap: RingCapture | None, on_chunk=None):
+    if cap is None:
+        record_wav()
+        return AUDIO_PATH
+    if not VAD:
+        return cap.record(RECORD_SEC, on_chunk=on_chunk)
+
+    vad = StreamingVad(SAMPLE_RATE, trailing_ms=VAD_TRAILING_MS, no_speech_sec=VAD_NO_SPEECH_SEC)
+    seg = cap.record(RECORD_SEC, vad=vad, on_chunk=on_chunk)
+    VAD_STATS.add(RECORD_SEC, seg.duration, vad.speech_detected)
+    return seg if vad.speech_detected else None  # None -> STT 생략
+
+def _openai_client():
+    import stt_client  # httpx / openai import. sim(노트북)에서는 안 씀
+    return stt_client.SttClient()  # 만들자마자 연결 + 워밍업 (하드웨어 시작 / 1조 가는 동안)
+
+def make_client():
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY 환경변수 없음")
+    # openai import가 Pi에서 몇 초 -> 1조 녹음 / 첫 이동 중에 백그라운드로, 첫 STT가 필요하면 기다림
+    return lazy.Background(_openai_client, "openai")
+
+def built_client(client, timeout: float = 0.0):
+    """report / close 용: 만들어진 SttClient. timeout 안에 못 만들었거나 실패(openai import 등)면 None"""
+    if client is None or (timeout == 0.0 and not client.ready()):
+        return None
+    try:
+        return client.get(timeout)
+    except Exception:
+        return None
+
+def stt_lookup(audio, model):
+    """-> (정규화 결과, 캐시 텍스트). 캐시 꺼져 있으면 (None, None)"""
+    if not STT_CACHE:  # 같은 녹음(정규화 PCM + 모델)이면 업로드 안 함 (stt_cache.py)
+        return None, None
+    norm = upload_prep.normalize(audio)
+    text = stt_cache.get(stt_cache.key(norm, model))
+    if text is not None:
+        print("[STT] cache hit")
+    return norm, text
+
+def stt_upload(client, audio, model, norm=None) -> str:
+    """인코딩 + 업로드만 (캐시 안 봄). norm = 이미 정규화한 결과"""
+    with mission_trace.span("encode"):
+        if UPLOAD_FORMAT:
+            f = upload_prep.prepare_upload(audio, UPLOAD_FORMAT, norm=norm)
+        else:
+            f = open_for_upload(audio)
+    with f, mission_trace.span("upload+transcribe"):
+        res = client.audio.transcriptions.create(
+            model=model,
+            file=f,
+        )
+    return (res.text or "").strip()
+
+def stt_transcribe(client, audio=AUDIO_PATH, model=None) -> str:
+    model = model or STT_MODEL
+    if audio is None:
+        print("[STT] skipped (no speech)")
+        return ""
+    if isinstance(audio, Path) and not audio.exists():
+        return ""
+    with mission_trace.span("encode"):
+        norm, text = stt_lookup(audio, model)
+    if text is not None:
+        return text
+    t = hal.now()
+    text = stt_upload(client, audio, model, norm)
+    if norm is not None:
+        stt_cache.put(stt_cache.key(norm, model), text, model, hal.now() - t)
+    return text
+
+# =========================================================
+# 동작
+# =========================================================
+choreo = Choreographer()  # 제스처 뒷정리(팔 복귀 등)는 다음 주행과 같이
+
+def arm_grip_steps(arm1, arm2, grip):
+    steps, t = [], 0.0
+    arms = (arm1, arm2) if arm1 is not None and arm2 is not None else None
+
+    if arms:
+        traj = trajectory.plan((ARM1_HOME, ARM2_HOME), (ARM1_EXTEND, ARM2_EXTEND), ARM_EXTEND_SEC)
+        t = ARM_START_SEC + traj.duration
+        steps += motion.pose_steps(arms, [(0.0, (ARM1_HOME, ARM2_HOME))])
+        steps += trajectory.to_steps(arms, traj, ARM_START_SEC)
+
+    steps += motion.angle_steps(grip, [(t, GRIP_OPEN), (t + GRIP_HOLD_SEC, GRIP_CLOSE)])
+
+    # 뒷정리: 집게 닫히고 ARM_HOME_DELAY 뒤 팔 복귀 (다음 주행과 같이)
+    tail = motion.hold(ARM_HOME_DELAY)
+    if arms:
+        tail += motion.pose_steps(arms, [(ARM_HOME_DELAY, (ARM1_HOME, ARM2_HOME))])
+        tail += motion.hold(ARM_HOME_DELAY + ARM_HOME_SETTLE)
+    return steps, tail
+
+@mission_trace.traced("arm_grip")
+def arm_grip_action(arm1, arm2, grip):
+    if grip is None:
+        print("[WARN] GRIP 서보 없음 - 스킵")
+        return
+    steps, tail = arm_grip_steps(arm1, arm2, grip)
+    choreo.play("arm_grip", (arm1, arm2, grip), steps)
+    choreo.defer("arm_home", (arm1, arm2, grip), tail)
+
+def head_shake_steps(head_yaw):
+    pts = [(0.0, HEAD_YAW_CENTER)]
+    t = 0.3
+    for _ in range(2):
+        pts += [(t, HEAD_YAW_LEFT + HEAD_SHAKE_INSET), (t + HEAD_SHAKE_SEC / 2, HEAD_YAW_RIGHT - HEAD_SHAKE_INSET)]
+        t += HEAD_SHAKE_SEC
+    steps = motion.angle_steps(head_yaw, pts) + motion.hold(t)
+    tail = motion.angle_steps(head_yaw, [(0.0, HEAD_YAW_CENTER)]) + motion.hold(HEAD_CENTER_SETTLE)
+    return steps, tail
+
+@mission_trace.traced("head_shake")
+def head_shake_smooth(head_yaw):
+    if head_yaw is None:
+        print("[WARN] HEAD_YAW 서보 없음 - 도리도리 스킵")
+        return
+    steps, tail = head_shake_steps(head_yaw)
+    choreo.play("head", (head_yaw,), steps)
+    choreo.defer("head_center", (head_yaw,), tail)
+
+def transcribe(client, audio) -> str:
+    """STT 한 번 (업로드 + 변환, 파이프라인 워커에서도 호출) = span 하나
+    STT_DEADLINE_SEC 이 있으면 느린 요청은 헤지(stt_hedge.py), 마감 넘기면 None"""
+    with mission_trace.span("stt"):
+        if STT_DEADLINE_SEC is None or client is None:  # sim은 가상 시계라 헤지 안 함
+            return stt_transcribe(client, audio)
+        if audio is None or (isinstance(audio, Path) and not audio.exists()):
+            return stt_transcribe(client, audio)
+        # 캐시 / 정규화는 한 번만, 헤지 스레드는 업로드만 (캐시 hit 이 헤지 기준 시간(p90)에 안 들어가게)
+        with mission_trace.span("encode"):
+            norm, text = stt_lookup(audio, STT_MODEL)
+            if text is not None:
+                return text
+            if norm is None and UPLOAD_FORMAT:
+                norm = upload_prep.normalize(audio)
+        # 진 요청 / 마감 넘긴 요청은 못 끊고 끝까지 돎 -> 링 버퍼 대신 복사본을 읽게 (다음 조 녹음이 덮어씀)
+        if isinstance(audio, Segment):
+            audio = audio.copy()
+        res = stt_hedge.run(lambda model: stt_upload(client, audio, model, norm),
+                            STT_MODEL, STT_HEDGE_MODEL, STT_DEADLINE_SEC)
+        if res.source == "hedge":
+            print(f"[STT] hedge ({STT_HEDGE_MODEL}) won after {res.sec:.2f}s")
+        if res.text is not None and STT_CACHE:  # 캐시는 이긴 요청 결과만
+            model = STT_HEDGE_MODEL if res.source == "hedge" else STT_MODEL
+            stt_cache.put(stt_cache.key(norm, model), res.text, model, res.sec)
+        return res.text
+
+def stream_session(client):
+    if STREAM_SERVER is not None:
+        backend = stt_stream.SocketStream(*STREAM_SERVER, SAMPLE_RATE, STT_MODEL)
+    else:
+        backend = stt_stream.OpenAIStream(client, STT_MODEL, UPLOAD_FORMAT)
+    return stt_stream.StreamSession(backend, EN_THRESHOLD)
+
+def local_decision(lid, audio):
+    if lid is None or audio is None:
+        return None
+    try:
+        return lid.decide(audio, EN_THRESHOLD, LANG_ID_MIN_Z)
+    except Exception as e:
+        print(f"[LID ERR] {e}")
+        return None
+
+def deadline_ratio(lid, audio) -> float:
+    """STT 마감을 넘긴 조: lang_id 추정 (확신 낮아도), 모델이 없으면 0 (한국어 쪽 제스처)"""
+    if lid is not None and audio is not None:
+        try:
+            est = lid.estimate(audio, EN_THRESHOLD)
+            print(f"[STT] no result -> lang_id estimate (z={est.z:.1f})")
+            return est.ratio
+        except Exception as e:
+            print(f"[LID ERR] {e}")
+    print("[STT] no result -> no lang_id model, English ratio 0")
+    return 0.0
+
+def decide(ratio: float) -> str:
+    """영어 비율 -> 제스처 ("arm_grip" / "head_shake"). replay.py 도 같은 판단"""
+    return "arm_grip" if ratio >= EN_THRESHOLD else "head_shake"
+
+def react(text, arm1, arm2, grip, head_yaw, ratio=None):
+    if ratio is None:
+        ratio = english_ratio(text)
+        en, ko = count_lang(text)
+        print(f"[TXT] {text}")
+        print(f"[RATIO] en={en}, ko={ko}, english_ratio={ratio * 100:.3f}%")
+    else:
+        print(f"[RATIO] local english_ratio={ratio * 100:.3f}%")
+
+    if decide(ratio) == "arm_grip":
+        print(f"[DECISION] English >= {EN_THRESHOLD:.2f}")
+        arm_grip_action(arm1, arm2, grip)
+    else:
+        print(f"[DECISION] English < {EN_THRESHOLD:.2f}")
+        head_shake_smooth(head_yaw)
+
+# =========================================================
+# 이동 (조 idx-1 -> idx)
+# =========================================================
+def move_to(idx, motors, steer_srv, route):
+    global heading
+    leg = route.legs[idx-1]
+    print(f"[MOVE] {PATH[idx-1]}->{PATH[idx]}: {describe(leg)} ({route.leg_sec[idx-1]:.2f}s)")
+    run_leg(leg, motors, steer_srv)
+    heading = route.headings[idx]
+
+    stop_all(motors)
+
+def hot_reload(route, idx):
+    """조 사이: 프로필 파일이 바뀌었으면 hot 값 적용 (틀린 파일이면 이전 값 유지)"""
+    global PROFILE
+    try:
+        PROFILE, hot, static = mission_profile.reload(PROFILE)
+    except mission_profile.ProfileError as e:
+        print(f"[PROFILE] reload failed, keeping previous values: {e}")
+        return route
+    for name, value in hot.items():
+        print(f"[PROFILE] {name}: {globals()[name]} -> {value}")
+    globals().update(hot)
+    if static:
+        print(f"[PROFILE] next run only: {', '.join(static)}")
+    if REPLAN_KEYS & hot.keys():
+        rest = plan_route(PATH[idx-1:], Costs.from_constants(globals()), heading)
+        route.legs[idx-1:] = rest.legs
+        route.leg_sec[idx-1:] = rest.leg_sec
+        route.headings[idx-1:] = rest.headings
+        print("[PLAN] replanned: " + " | ".join(describe(leg) for leg in rest.legs))
+    return route
+
+# =========================================================
+# 메인
+# =========================================================
+def main():
+    global PATH
+    print(f"[PROFILE] {' <- '.join(f.stem for f in PROFILE.files)}")
+    mission_trace.setup(profile=PROFILE.name, backend=hal.BACKEND)
+    with bringup.phase("calib"):
+        apply_fitted(globals(), CALIB_POWER)
+    with bringup.phase("stt client"):
+        client = make_client()
+        # 첫 STT에 쓰는 모듈도 1조 녹음 중에 미리
+        lazy.preload(*[m for m, use in (("upload_prep", UPLOAD_FORMAT), ("stt_stream", STT_MODE == "stream")) if use])
+    pwm = init_pca()
+    with bringup.phase("power"):
+        power.setup(V_REF, SUPPLY_MODE)
+    with bringup.phase("servos"):
+        motors = make_motors(pwm)
+        steer_srv = make_servo(pwm, STEER_CH)
+        if steer_srv is None:
+            raise RuntimeError("STEER_CH가 None이면 이동 못 함")
+
+        head_yaw = make_servo(pwm, HEAD_YAW_CH)
+        arm1 = make_servo(pwm, ARM_J1_CH)
+        arm2 = make_servo(pwm, ARM_J2_CH)
+        grip = make_servo(pwm, GRIP_CH)
+
+    with bringup.phase("lang id / audio"):
+        lid = lang_id.LangId.load(LANG_ID_MODEL) if LANG_ID_MODEL.exists() else None
+        cap = RingCapture(SAMPLE_RATE, seconds=RECORD_SEC * 2) if CAPTURE == "ring" else None
+        pipe = SttPipeline(lambda audio: transcribe(client, audio)) if PIPELINE else None
+
+    try:
+        if cap is not None:
+            cap.start()
+
+        steer_to(steer_srv, STEER_CENTER)
+        stop_all(motors)
+        bringup.report()
+
+        # 상수(--set 포함)로 비용 계산 -> 좌/우/U턴, 직진 칸 수 결정
+        costs = Costs.from_constants(globals())
+        if ROUTE_CONFIG is not None:
+            PATH = route_opt.path_from_config(ROUTE_CONFIG, costs, heading)
+        route = plan_route(PATH, costs, heading)
+        print(f"[PLAN] drive {route.total:.2f}s: " + " | ".join(describe(leg) for leg in route.legs))
+
+        print("6 groups start")
+
+        pending = None
+        for idx, pos in enumerate(PATH):
+            print(f"\n[GROUP {idx+1}/{len(PATH)}] pos={pos}")
+
+            if idx > 0:
+                route = hot_reload(route, idx)
+                with pipe.driving(idx) if pipe else nullcontext(), choreo.driving(idx), \
+                        mission_trace.span("drive", group=idx + 1):
+                    move_to(idx, motors, steer_srv, route)
+
+            # 이전 조 결과는 다음 녹음 전에 받아서 제스처 재생 (녹음 파일 덮어쓰기 방지)
+            if pending is not None:
+                print(f"[DECISION] group {pending.idx+1} (deferred)")
+                with mission_trace.span("stt_wait", group=pending.idx + 1):
+                    text = pipe.wait(pending)
+                ratio = deadline_ratio(lid, pending.audio) if text is None else None
+                react(text, arm1, arm2, grip, head_yaw, ratio=ratio)
+                pending = None
+
+            if STT_MODE == "stream":
+                try:
+                    sess = stream_session(client)
+                except OSError as e:  # STREAM_SERVER 연결 안 됨 -> 이 조는 아래 배치 STT
+                    print(f"[STREAM ERR] {e} -> batch STT")
+                    sess = None
+                if sess is not None:
+                    with mission_trace.span("record", group=idx + 1):
+                        audio = record_audio(cap, on_chunk=sess.on_chunk)
+                    with mission_trace.span("stt_wait", group=idx + 1):
+                        sess.finish(audio)
+                    if not sess.failed:
+                        react(sess.text, arm1, arm2, grip, head_yaw)
+                        continue
+                    print("[STREAM] failed -> batch STT on the same recording")
+                    try:
+                        text = transcribe(client, audio)
+                    except Exception as e:
+                        text = ""
+                        print(f"[STT ERR] {e}")
+                    react(text, arm1, arm2, grip, head_yaw, ratio=deadline_ratio(lid, audio) if text is None else None)
+                    continue
+
+            with mission_trace.span("record", group=idx + 1):
+                audio = record_audio(cap)
+
+            with mission_trace.span("decision", group=idx + 1):
+                est = local_decision(lid, audio)
+            if est is not None:
+                react("", arm1, arm2, grip, head_yaw, ratio=est.ratio)
+                continue
+
+            if pipe is not None:
+                pending = pipe.submit(idx, audio)
+                continue
+
+            try:
+                text = transcribe(client, audio)
+            except Exception as e:
+                text = ""
+                print(f"[STT ERR] {e}")
+            react(text, arm1, arm2, grip, head_yaw, ratio=deadline_ratio(lid, audio) if text is None else None)
+
+        if pending is not None:
+            print(f"[DECISION] group {pending.idx+1} (deferred)")
+            with mission_trace.span("stt_wait", group=pending.idx + 1):
+                text = pipe.wait(pending)
+            react(text, arm1, arm2, grip, head_yaw, ratio=deadline_ratio(lid, pending.audio) if text is None else None)
+
+        choreo.finish()
+        print("\nmission complete")
+        if pipe is not None:
+            pipe.report()
+        pwm.report()
+        power.report()
+        motion.report()
+        choreo.report()
+        stt_cache.report()
+        stt_hedge.report()
+        if built_client(client) is not None:
+            built_client(client).report()
+        if VAD_STATS.stops:
+            VAD_STATS.report()
+
+    finally:
+        mission_trace.finish()
+        motion.shutdown()
+        if built_client(client, timeout=5.0) is not None:  # 만드는 중이면 조금 기다렸다가
+            built_client(client).close()  # 연결 유지(keepalive) 스레드 / 연결 풀 정리
+        if pipe is not None:
+            pipe.close()
+        if cap is not None:
+            cap.close()
+        stop_all(motors)
+        try:
+            pwm.deinit()
+        except Exception:
+            pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+# mission_profile.py
+# 미션 프로필 (TOML) 읽기 / 검사 / 캐시 / 다시 읽기
+# 888.py / 998.py / 999.py 는 상수만 다른 복사본이었음 -> mission.py 하나 + profiles/<이름>.toml
+#   - extends = "base" 로 다른 프로필을 물려받고 다른 값만 적음 (999 = 998 + 충전기 값)
+#   - 시작할 때 한 번 검사 (없는 키 / 모르는 키 / 타입 / 범위 / 좌우 순서) -> 틀리면 출발 전에 ProfileError
+#   - 읽은 결과는 파일 mtime 기준으로 캐시 -> 조 사이 변경 확인은 stat() 만
+#   - 조 사이에 파일이 바뀌면 다시 읽어서 hot 값(속도 / 시간 / 각도 / 임계값)만 적용
+#     채널 / 오디오 장치 / 경로처럼 시작할 때 쓰는 값은 다음 실행부터
+#
+#   profile = load("998")
+#   globals().update(profile.constants())           # {"SPEED": 23.6, "PATH": [...], ...}
+#   profile, hot, static = reload(profile)           # 조 사이
+#
+#   python3 mission_profile.py 998                   # 검사 + 값 출력
+#   python3 mission_profile.py 998 --diff 999        # A/B 비교
+#   python3 mission_profile.py --check               # profiles/*.toml 전부 검사
+
+import argparse
+import os
+import time
+from pathlib import Path
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 이하
+    import tomli as tomllib
+
+PROFILE_DIR = Path(__file__).with_name("profiles")
+
+
+class ProfileError(ValueError):
+    pass
+
+
+# =========================================================
+# 키 목록: 이름 -> (섹션, 타입, 범위/선택지, hot, 생략 가능)
+#   생략 가능한 키는 없거나 "none" 이면 None
+# =========================================================
+A = (0, 180)  # 서보 각도
+FIELDS = {
+    # 이동
+    "steer_center":       ("drive", float, A, True, False),
+    "steer_center_uturn": ("drive", float, A, True, False),
+    "steer_left":         ("drive", float, A, True, False),
+    "steer_right":        ("drive", float, A, True, False),
+    "turn_sec_left":      ("drive", float, (0, 60), True, False),
+    "turn_sec_right":     ("drive", float, (0, 60), True, False),
+    "speed":              ("drive", float, (0, 100), True, False),
+    "fwd_sec_1cell":      ("drive", float, (0, 60), True, False),
+    "uturn_sec":          ("drive", float, (0, 60), True, False),
+    "reverse_sec":        ("drive", float, (0, 10), True, False),
+    # 전원
+    "v_ref":              ("power", float, (1, 20), False, False),
+    "supply_mode":        ("power", str, {"throttle", "duration"}, False, True),
+    "calib_power":        ("power", str, {"battery", "charger"}, False, True),
+    # 경로
+    "path":               ("route", "points", None, False, False),
+    "heading":            ("route", int, (0, 3), False, False),
+    "route_config":       ("route", Path, None, False, True),
+    # 오디오
+    "arecord_device":     ("audio", str, None, False, False),
+    "sample_rate":        ("audio", int, (8000, 192000), False, False),
+    "record_sec":         ("audio", int, (1, 120), False, False),
+    "audio_path":         ("audio", Path, None, False, False),
+    "capture":            ("audio", str, {"ring", "arecord"}, False, False),
+    "vad":                ("audio", bool, None, True, False),
+    "vad_trailing_ms":    ("audio", int, (100, 10000), True, False),
+    "vad_no_speech_sec":  ("audio", float, (0, 120), True, False),
+    # STT
+    "stt_model":          ("stt", str, None, False, False),
+    "upload_format":      ("stt", str, {"flac", "ogg", "wav"}, True, True),
+    "stt_cache":          ("stt", bool, None, True, False),
+    "stt_deadline_sec":   ("stt", float, (0.5, 120), True, True),
+    "stt_hedge_model":    ("stt", str, None, True, True),
+    "en_threshold":       ("stt", float, (0, 1), True, False),
+    "lang_id_model":      ("stt", Path, None, False, False),
+    "lang_id_min_z":      ("stt", float, (0, 100), True, False),
+    "pipeline":           ("stt", bool, None, False, False),
+    "stt_mode":           ("stt", str, {"batch", "stream"}, False, False),
+    "stream_server":      ("stt", "hostport", None, False, True),
+    # 하드웨어
+    "pca_addr_candidates": ("hardware", "ints", (0x03, 0x77), False, False),
+    "steer_ch":           ("hardware", int, (0, 15), False, False),
+    "head_yaw_ch":        ("hardware", int, (0, 15), False, True),
+    "arm_j1_ch":          ("hardware", int, (0, 15), False, True),
+    "arm_j2_ch":          ("hardware", int, (0, 15), False, True),
+    "grip_ch":            ("hardware", int, (0, 15), False, True),
+    # 서보 각도
+    "arm1_home":          ("servo", float, A, True, False),
+    "arm2_home":          ("servo", float, A, True, False),
+    "arm1_extend":        ("servo", float, A, True, False),
+    "arm2_extend":        ("servo", float, A, True, False),
+    "grip_close":         ("servo", float, A, True, False),
+    "grip_open":          ("servo", float, A, True, False),
+    "head_yaw_center":    ("servo", float, A, True, False),
+    "head_yaw_left":      ("servo", float, A, True, False),
+    "head_yaw_right":     ("servo", float, A, True, False),
+    # 제스처 타이밍
+    "arm_extend_sec":     ("gesture", float, (0.1, 10), True, False),
+    "arm_start_sec":      ("gesture", float, (0, 5), True, False),
+    "grip_hold_sec":      ("gesture", float, (0, 30), True, False),
+    "arm_home_delay":     ("gesture", float, (0, 5), True, False),
+    "arm_home_settle":    ("gesture", float, (0, 5), True, False),
+    "head_shake_sec":     ("gesture", float, (0.1, 5), True, False),
+    "head_shake_inset":   ("gesture", float, (0, 45), True, False),
+    "head_center_settle": ("gesture", float, (0, 5), True, False),
+}
+LOWER = {"heading"}  # 미션 안에서 바뀌는 상태라 소문자 그대로
+
+
+def _convert(key, value):
+    section, typ, check, _, optional = FIELDS[key]
+    where = f"[{section}] {key}"
+    if optional and value == "none":
+        return None
+    try:
+        if typ is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError
+            value = float(value)
+        elif typ is int or typ is bool or typ is str:
+            if type(value) is not typ:
+                raise TypeError
+        elif typ is Path:
+            value = Path(str(value)) if isinstance(value, str) else None
+            if value is None:
+                raise TypeError
+        elif typ == "points":
+            value = [tuple(p) for p in value]
+            if not value or any(len(p) != 2 or not all(type(v) is int for v in p) for p in value):
+                raise TypeError
+        elif typ == "ints":
+            if not value or not all(type(v) is int for v in value):
+                raise TypeError
+            value = list(value)
+        elif typ == "hostport":
+            if len(value) != 2 or type(value[0]) is not str or type(value[1]) is not int:
+                raise TypeError
+            value = (value[0], value[1])
+    except TypeError:
+        name = typ if isinstance(typ, str) else typ.__name__
+        raise ProfileError(f"{where}: {value!r} is not {name}") from None
+
+    if isinstance(check, set) and value not in check:
+        raise ProfileError(f"{where}: {value!r} not one of {sorted(check)}")
+    if isinstance(check, tuple):
+        lo, hi = check
+        for v in (value if isinstance(value, list) else [value]):
+            if not lo <= v <= hi:
+                raise ProfileError(f"{where}: {v} out of range {lo}..{hi}")
+    return value
+
+
+def check(key: str, value):
+    """값 하나를 프로필 규칙(타입 / 범위)으로 검사. 틀리면 ProfileError"""
+    return _convert(key, value)
+
+
+def _order(v, keys, where):
+    a, b, c = (v[k] for k in keys)
+    if not (min(a, c) < b < max(a, c)):
+        raise ProfileError(f"{where}: {keys[1]}={b} must lie between {keys[0]}={a} and {keys[2]}={c}")
+
+
+def validate(raw: dict, name: str = "") -> dict:
+    """섹션 TOML -> 평평한 {키: 값}. 틀린 곳을 전부 모아서 ProfileError"""
+    values, errors = {}, []
+    for section, table in raw.items():
+        if section == "extends":
+            continue
+        if not isinstance(table, dict):
+            errors.append(f"{section}: expected [section] table")
+            continue
+        for key, value in table.items():
+            if key not in FIELDS or FIELDS[key][0] != section:
+                errors.append(f"[{section}] {key}: unknown key")
+                continue
+            try:
+                values[key] = _convert(key, value)
+            except ProfileError as e:
+                errors.append(str(e))
+    for key, (section, _, _, _, optional) in FIELDS.items():
+        if key not in values:
+            if optional:
+                values[key] = None
+            else:
+                errors.append(f"[{section}] {key}: missing")
+    if not errors:
+        try:
+            _order(values, ("steer_left", "steer_center", "steer_right"), "[drive]")
+            _order(values, ("head_yaw_left", "head_yaw_center", "head_yaw_right"), "[servo]")
+        except ProfileError as e:
+            errors.append(str(e))
+    if errors:
+        raise ProfileError(f"profile {name}:\n  " + "\n  ".join(errors))
+    return values
+
+
+# =========================================================
+# 프로필
+# =========================================================
+class Profile:
+    def __init__(self, name: str, values: dict, files, mtimes):
+        self.name = name
+        self.values = values
+        self.files = files    # [자기, 부모, 조부모, ...]
+        self.mtimes = mtimes
+
+    def constants(self) -> dict:
+        return {(k if k in LOWER else k.upper()): v for k, v in self.values.items()}
+
+    def stale(self) -> bool:
+        return _mtimes(self.files) != self.mtimes
+
+
+def _path(name) -> Path:
+    p = Path(name)
+    if p.suffix == ".toml":
+        return p
+    return PROFILE_DIR / f"{name}.toml"
+
+
+def _mtimes(files):
+    out = []
+    for f in files:
+        try:
+            out.append(os.stat(f).st_mtime_ns)
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+
+def _read(path: Path, seen=()):
+    """extends 따라 올라가며 섹션별로 합침 (자식 값이 이김) -> (합친 TOML, 파일 목록)"""
+    if path in seen:
+        raise ProfileError(f"extends loop: {' -> '.join(str(p) for p in seen + (path,))}")
+    try:
+        with open(path, "rb") as f:
+            raw = tomllib.load(f)
+    except FileNotFoundError:
+        raise ProfileError(f"profile not found: {path}") from None
+    except tomllib.TOMLDecodeError as e:
+        raise ProfileError(f"{path}: {e}") from None
+    files = [path]
+    if "extends" in raw:
+        ext = raw["extends"]
+        base, parents = _read(path.parent / (ext if ext.endswith(".toml") else f"{ext}.toml"), seen + (path,))
+        files += parents
+        for section, table in raw.items():
+            if section != "extends":
+                base.setdefault(section, {}).update(table)
+        raw = base
+    return raw, files
+
+
+_cache = {}  # 경로 -> Profile
+
+
+def load(name) -> Profile:
+    """검사까지 끝난 프로필. 파일이 그대로면 캐시"""
+    path = _path(name).resolve()
+    cached = _cache.get(path)
+    if cached is not None and not cached.stale():
+        return cached
+    raw, files = _read(path)
+    mtimes = _mtimes(files)
+    prof = Profile(path.stem, validate(raw, path.stem), files, mtimes)
+    _cache[path] = prof
+    return prof
+
+
+def reload(prof: Profile):
+    """조 사이: 바뀐 게 없으면 (prof, {}, []). 있으면 (새 프로필, hot 상수 {이름: 값}, 다음 실행부터인 키 목록)
+    새 파일이 틀리면 ProfileError (이전 값 유지는 부르는 쪽에서)"""
+    if not prof.stale():
+        return prof, {}, []
+    new = load(prof.files[0])
+    hot, static = {}, []
+    for key, value in new.values.items():
+        if value != prof.values[key]:
+            if FIELDS[key][3]:
+                hot[key if key in LOWER else key.upper()] = value
+            else:
+                static.append(key)
+    return new, hot, static
+
+
+def diff(a: Profile, b: Profile):
+    return [(k, a.values[k], b.values[k]) for k in FIELDS if a.values[k] != b.values[k]]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("name", nargs="?", help="프로필 이름 (profiles/<이름>.toml) 또는 .toml 경로")
+    ap.add_argument("--diff", help="비교할 프로필")
+    ap.add_argument("--check", action="store_true", help="profiles/*.toml 전부 검사")
+    args = ap.parse_args()
+
+    if args.check:
+        bad = 0
+        for p in sorted(PROFILE_DIR.glob("*.toml")):
+            try:
+                load(p)
+                print(f"[OK] {p.stem}")
+            except ProfileError as e:
+                bad += 1
+                print(f"[ERR] {e}")
+        raise SystemExit(1 if bad else 0)
+
+    t0 = time.perf_counter()
+    prof = load(args.name)
+    t1 = time.perf_counter()
+    load(args.name)
+    t2 = time.perf_counter()
+    chain = " <- ".join(f.stem for f in prof.files)
+    print(f"[PROFILE] {chain}: parse+validate {(t1 - t0) * 1000:.2f} ms, cached {(t2 - t1) * 1000:.3f} ms")
+    if args.diff:
+        other = load(args.diff)
+        rows = diff(prof, other)
+        print(f"{'key':22s} {prof.name:>24s} {other.name:>24s}")
+        for k, va, vb in rows:
+            print(f"{k:22s} {str(va):>24s} {str(vb):>24s}")
+        print(f"{len(rows)} differences")
+        return
+    for key, (section, *_rest) in FIELDS.items():
+        print(f"[{section}] {key} = {prof.values[key]!r}")
+
+
+if __name__ == "__main__":
+    main()
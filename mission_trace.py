@@ -0,0 +1,222 @@
+# mission_trace.py
+# 미션 단계별 시간 기록 (span) + 여러 번 돌린 기록 모아서 p50 / p95 / max
+# [REC] / [STT] print만으로는 6조 한 바퀴 시간이 주행 / 녹음 / 업로드 / 변환 / 판단 / 제스처에 어떻게 나뉘는지 모름
+#   - span(name): with 블록 시작 / 끝 시각(ns)을 메모리 리스트에 추가, 미션 끝에 JSONL 파일에 한 번에 씀
+#   - 꺼져 있으면(기본) span()은 같은 빈 컨텍스트를 돌려주기만 함 (시각 안 읽음)
+#   - 시각: 실제 보드는 time.perf_counter_ns, sim은 가상 시계 (hal.now)
+#   - 스레드 이름도 기록 (STT 워커에서 돈 변환은 주행과 겹쳐 보임)
+#
+#   mission_trace.setup("/home/pi/picar_trace.jsonl")     # 또는 PICAR_TRACE 환경변수
+#   with mission_trace.span("forward", cells=2): ...
+#   @mission_trace.traced("record")
+#   def record_audio(...): ...
+#   mission_trace.finish()                               # 한 번 돌린 기록 = run 하나 (파일에 이어 씀)
+#
+#   python3 mission_trace.py report /home/pi/picar_trace.jsonl
+#   python3 mission_trace.py chrome /home/pi/picar_trace.jsonl -o trace.json   # chrome://tracing / Perfetto
+
+import argparse
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import hal
+
+TRACE_PATH = os.environ.get("PICAR_TRACE")  # 없으면 기록 안 함
+
+_OFF = nullcontext()
+
+
+def _now_ns() -> int:
+    if hal.BACKEND == "real":
+        return time.perf_counter_ns()
+    return round(hal.now() * 1e9)
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "t0")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.t0 = _now_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        t1 = _now_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.spans.append((self.name, self.t0, t1 - self.t0, threading.current_thread().name, self.args))
+        return False
+
+
+class Tracer:
+    def __init__(self, path=None, run: str = None, meta: dict = None):
+        self.path = path
+        self.run = run or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.meta = meta or {}
+        self.spans = []  # (이름, 시작 ns, 길이 ns, 스레드, args) - list.append 는 스레드 안전
+        self.t0 = _now_ns()
+
+    def span(self, name: str, **args):
+        return _Span(self, name, args)
+
+    def records(self):
+        for name, t0, dur, thread, args in self.spans:
+            rec = {"run": self.run, "name": name, "ts": t0 - self.t0, "dur": dur, "thread": thread}
+            if args:
+                rec["args"] = args
+            yield rec
+
+    def finish(self):
+        """run 기록 (맨 앞 한 줄 = run 정보, 이후 span 한 줄씩) 파일 끝에 추가"""
+        wall = _now_ns() - self.t0
+        head = {"run": self.run, "name": "run", "ts": 0, "dur": wall, "meta": self.meta}
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(head, ensure_ascii=False) + "\n")
+            for rec in self.records():
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        print(f"[TRACE] {len(self.spans)} spans, {wall / 1e9:.2f}s -> {self.path}")
+
+
+# =========================================================
+# 기본 (미션 스크립트)
+# =========================================================
+_default = None
+
+
+def setup(path=None, **meta):
+    """path 없으면 TRACE_PATH, 그것도 없으면 끔. meta는 run 줄에 같이 기록 (프로필 이름 등)"""
+    global _default
+    path = path or TRACE_PATH
+    _default = Tracer(path, meta=meta) if path else None
+    if _default is not None:
+        print(f"[TRACE] run {_default.run} -> {path}")
+    return _default
+
+
+def span(name: str, **args):
+    if _default is None:
+        return _OFF
+    return _default.span(name, **args)
+
+
+def traced(name: str = None):
+    """함수 호출 하나 = span 하나. 꺼져 있으면 None 검사 한 번"""
+    def deco(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*a, **kw):
+            if _default is None:
+                return fn(*a, **kw)
+            with _default.span(label):
+                return fn(*a, **kw)
+        return wrapper
+    return deco
+
+
+def finish():
+    global _default
+    if _default is not None:
+        _default.finish()
+        _default = None
+
+
+# =========================================================
+# 리포트
+# =========================================================
+def load(path):
+    """-> {run: (run 줄, [span 줄, ...])} (파일 순서)"""
+    runs = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            rec = json.loads(line)
+            run = runs.setdefault(rec["run"], [None, []])
+            if rec["name"] == "run":
+                run[0] = rec
+            else:
+                run[1].append(rec)
+    return runs
+
+
+def percentile(values, q: float) -> float:
+    """최근접 순위 (q = 0..100)"""
+    v = sorted(values)
+    k = max(0, min(len(v) - 1, -(-len(v) * q // 100) - 1))
+    return v[int(k)]
+
+
+def report(runs):
+    by_name = {}
+    share = {}  # 이름 -> run별 (합 / run 전체)
+    walls = []
+    for head, spans in runs.values():
+        wall = head["dur"] if head else max((s["ts"] + s["dur"] for s in spans), default=0)
+        walls.append(wall)
+        totals = {}
+        for s in spans:
+            by_name.setdefault(s["name"], []).append(s["dur"])
+            totals[s["name"]] = totals.get(s["name"], 0) + s["dur"]
+        for name, t in totals.items():
+            share.setdefault(name, []).append(t / wall if wall else 0.0)
+
+    print(f"===== MISSION TRACE ({len(runs)} runs) =====")
+    if walls:
+        print(f"run wall: p50 {percentile(walls, 50) / 1e9:.2f}s  max {max(walls) / 1e9:.2f}s")
+    print(f"{'phase':18s} {'n':>5s} {'p50':>9s} {'p95':>9s} {'max':>9s} {'% of run':>9s}")
+    for name, durs in sorted(by_name.items(), key=lambda kv: -sum(kv[1])):
+        pct = sum(share[name]) / len(walls) * 100
+        print(f"{name:18s} {len(durs):5d} {percentile(durs, 50) / 1e9:8.3f}s {percentile(durs, 95) / 1e9:8.3f}s "
+              f"{max(durs) / 1e9:8.3f}s {pct:8.1f}%")
+    print("(spans on other threads overlap driving, so % can add up past 100)")
+    print("=" * 64)
+
+
+def chrome(runs, out):
+    """Chrome trace-event 형식 (run = 프로세스, 스레드 = 스레드). chrome://tracing 이나 ui.perfetto.dev 에서 열기"""
+    events = []
+    for pid, (run, (head, spans)) in enumerate(runs.items(), 1):
+        label = run + (f" {head['meta']}" if head and head.get("meta") else "")
+        events.append({"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": label}})
+        tids = {}
+        for s in spans:
+            tid = tids.setdefault(s["thread"], len(tids) + 1)
+            events.append({"ph": "X", "name": s["name"], "pid": pid, "tid": tid,
+                           "ts": s["ts"] / 1000, "dur": s["dur"] / 1000, "args": s.get("args", {})})
+        for thread, tid in tids.items():
+            events.append({"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": thread}})
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    print(f"saved {out} ({len(events)} events)")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("cmd", choices=["report", "chrome"])
+    ap.add_argument("trace", type=Path, help="JSONL 기록 (PICAR_TRACE)")
+    ap.add_argument("-o", "--out", default="trace.json", help="chrome: 출력 파일")
+    ap.add_argument("--last", type=int, help="마지막 N번만")
+    args = ap.parse_args()
+
+    runs = load(args.trace)
+    if args.last:
+        runs = dict(list(runs.items())[-args.last:])
+    if args.cmd == "report":
+        report(runs)
+    else:
+        chrome(runs, args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# mock_stt_server.py
+# 네트워크 / API 키 없이 STT를 시험하기 위한 로컬 대체 서버
+#   stream : 받은 오디오 길이에 맞춰 미리 정한 문장을 단어 단위로 흘려보냄 (stt_stream.py 소켓 프로토콜)
+#   http   : OpenAI POST /v1/audio/transcriptions 흉내 (multipart file + model -> {"text": ..})
+#            업로드 파일 이름(확장자 뺀 것)으로 녹음 대본을 찾아서 돌려줌, 없으면 --text
+#            지연 = latency + 0 ~ jitter
+#            업로드 이름 "g1~3.wav" 은 대본 g1 (replay.py 가 조마다 다른 이름으로 올림)
+#            새 연결마다 --connect-ms (TLS 핸드셰이크 흉내), --idle 초 쉬는 연결은 서버가 닫음
+#            GET /v1/models 는 바로 응답 (stt_client.py 워밍업)
+#            장애 흉내: 요청마다 --fail-rate 확률로 500, --slow-rate 확률로 --slow-ms 더 늦게 (stt_hedge.py 시험)
+#            지터 / 장애는 (seed, 파일 이름, 모델, 같은 이름+모델 몇 번째) 로 정함 -> 요청 순서 / 헤지 요청 수와
+#            상관없이 같은 업로드는 같은 결과 (replay.py --compare 헤지 끔 / 켬이 같은 장애를 봄)
+#
+#   python3 mock_stt_server.py --text "hello everyone we are group three" --wps 2.5
+#   python3 mock_stt_server.py --text-file script.txt --latency 300 --port 8770
+#   python3 mock_stt_server.py --http --dir /home/pi/recorded_voice --latency 800 --jitter 400
+#   python3 mock_stt_server.py --http --dir voices --latency 800 --slow-rate 0.2 --slow-ms 10000 --fail-rate 0.05
+
+import argparse
+import email.parser
+import email.policy
+import json
+import random
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from stt_stream import recv_frame
+
+HOST = "127.0.0.1"
+PORT = 8770
+ALIAS_SEP = "~"  # 업로드 이름 "<대본 이름>~<아무거나>"
+
+
+class MockStreamHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        cfg = self.server.cfg
+        words = cfg["text"].split()
+        sent = 0
+        received_sec = 0.0
+        lock = threading.Lock()
+
+        header = json.loads(recv_frame(self.request))
+        sr = int(header.get("samplerate", 16000))
+
+        def emit(obj):
+            line = (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+            with lock:
+                self.request.sendall(line)
+
+        def delayed(obj):
+            # 서버 추론 지연 흉내
+            if cfg["latency"] > 0:
+                threading.Timer(cfg["latency"] / 1000, emit, (obj,)).start()
+            else:
+                emit(obj)
+
+        try:
+            while True:
+                chunk = recv_frame(self.request)
+                if not chunk:
+                    break
+                received_sec += len(chunk) / 2 / sr
+                # 오디오 1초당 wps 단어씩 공개
+                due = min(len(words), int(received_sec * cfg["wps"]))
+                if due > sent:
+                    delayed({"type": "delta", "text": ("" if sent == 0 else " ") + " ".join(words[sent:due])})
+                    sent = due
+        except ConnectionError:
+            return
+
+        if cfg["latency"] > 0:
+            time.sleep(cfg["latency"] / 1000 + 0.01)  # 앞서 보낸 delta가 먼저 가도록
+        rest = " ".join(words[sent:])
+        if rest:
+            emit({"type": "delta", "text": ("" if sent == 0 else " ") + rest})
+        try:
+            emit({"type": "done", "text": " ".join(words)})
+        except OSError:
+            pass  # 클라이언트가 조기 판단 후 먼저 끊음
+
+
+class MockServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, addr, text: str, wps: float = 2.5, latency_ms: float = 0):
+        super().__init__(addr, MockStreamHandler)
+        self.cfg = {"text": text, "wps": wps, "latency": latency_ms}
+
+
+def start_in_thread(text: str, host: str = HOST, port: int = 0, **kw) -> MockServer:
+    """테스트용: 백그라운드 스레드에서 서버 실행 (port=0이면 빈 포트 자동 선택)"""
+    srv = MockServer((host, port), text, **kw)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+# =========================================================
+# HTTP (배치 STT)
+# =========================================================
+def load_transcripts(folder) -> dict:
+    """WAV 옆 .txt (lang_id.stt_sidecar 와 같은 규칙) -> {파일 이름: 대본}"""
+    return {t.stem: t.read_text(encoding="utf-8").strip() for t in sorted(Path(folder).glob("*.txt"))}
+
+
+def upload_fields(content_type: str, body: bytes):
+    """multipart/form-data -> (file 필드의 파일 이름, model)"""
+    msg = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+    name = model = ""
+    for part in msg.iter_parts():
+        field = part.get_param("name", header="content-disposition")
+        if field == "file":
+            name = part.get_filename() or ""
+        elif field == "model":
+            model = part.get_content().strip()
+    return name, model
+
+
+class MockHttpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        self.timeout = self.server.idle_sec or None  # 쉬는 keep-alive 연결 닫기
+        super().setup()
+        time.sleep(self.server.connect_ms / 1000)     # 새 연결 비용
+
+    def do_GET(self):
+        if not self.path.rstrip("/").endswith("/models"):
+            self._reply(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+        self._reply(200, {"object": "list", "data": [{"id": "mock-transcribe", "object": "model"}]})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.path.rstrip("/").endswith("/audio/transcriptions"):
+            self._reply(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+        srv = self.server
+        name, model = upload_fields(self.headers.get("Content-Type", ""), body)
+        stem = name.rsplit(".", 1)[0]
+        with srv.lock:
+            srv.requests += 1
+            n = srv.seen.get((name, model), 0)
+            srv.seen[(name, model)] = n + 1
+            rng = random.Random(f"{srv.seed}/{name}/{model}/{n}")  # 요청 순서와 무관
+            delay = srv.latency + rng.uniform(0, srv.jitter)
+            fault = srv.fault(rng)
+        if fault == "slow":
+            delay += srv.slow_ms
+        time.sleep(delay / 1000)
+        if fault == "fail":
+            self._reply(500, {"error": {"message": "injected failure"}})
+            return
+        self._reply(200, {"text": srv.texts.get(stem.split(ALIAS_SEP)[0], srv.text)})
+
+    def _reply(self, code: int, obj):
+        data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+class MockHttpServer(ThreadingHTTPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, addr, texts: dict = None, text: str = "", latency_ms: float = 0,
+                 jitter_ms: float = 0, seed: int = 0, connect_ms: float = 0, idle_sec: float = 0,
+                 fail_rate: float = 0, slow_rate: float = 0, slow_ms: float = 0):
+        super().__init__(addr, MockHttpHandler)
+        self.texts = texts or {}
+        self.text = text
+        self.latency = latency_ms
+        self.jitter = jitter_ms
+        self.connect_ms = connect_ms
+        self.idle_sec = idle_sec
+        self.fail_rate = fail_rate
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self.seed = seed
+        self.seen = {}  # (파일 이름, 모델) -> 요청 수
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.faults = {"fail": 0, "slow": 0}
+
+    def fault(self, rng: random.Random):
+        """-> None / "fail" / "slow" (lock 안에서 호출, rng = 요청마다 정한 난수)"""
+        if not (self.fail_rate or self.slow_rate):
+            return None
+        r = rng.random()
+        kind = "fail" if r < self.fail_rate else "slow" if r < self.fail_rate + self.slow_rate else None
+        if kind:
+            self.faults[kind] += 1
+        return kind
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+def start_http_in_thread(texts: dict = None, host: str = HOST, port: int = 0, **kw) -> MockHttpServer:
+    srv = MockHttpServer((host, port), texts, **kw)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--host", default=HOST)
+    ap.add_argument("--port", type=int, default=PORT)
+    ap.add_argument("--text", default="hello everyone this is our group project presentation")
+    ap.add_argument("--text-file")
+    ap.add_argument("--wps", type=float, default=2.5, help="오디오 1초당 공개할 단어 수")
+    ap.add_argument("--latency", type=float, default=0, help="delta / 응답 지연 (ms)")
+    ap.add_argument("--http", action="store_true", help="배치 STT (OpenAI transcriptions 흉내)")
+    ap.add_argument("--dir", help="http: WAV 옆 .txt 대본 폴더")
+    ap.add_argument("--jitter", type=float, default=0, help="http: 지연에 더할 0 ~ jitter ms")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--connect-ms", type=float, default=0, help="http: 새 연결마다 추가 지연 (TLS 흉내)")
+    ap.add_argument("--idle", type=float, default=0, help="http: 이만큼(s) 쉰 연결은 닫음 (0 = 안 닫음)")
+    ap.add_argument("--fail-rate", type=float, default=0, help="http: 500 에러 확률")
+    ap.add_argument("--slow-rate", type=float, default=0, help="http: 느린 응답 확률")
+    ap.add_argument("--slow-ms", type=float, default=10000, help="http: 느린 응답에 더할 지연 (ms)")
+    args = ap.parse_args()
+
+    text = open(args.text_file, encoding="utf-8").read() if args.text_file else args.text
+    if args.http:
+        texts = load_transcripts(args.dir) if args.dir else {}
+        srv = MockHttpServer((args.host, args.port), texts, text, args.latency, args.jitter, args.seed,
+                             args.connect_ms, args.idle, args.fail_rate, args.slow_rate, args.slow_ms)
+        print(f"[MOCK STT] http server on {srv.base_url} ({len(texts)} transcripts)")
+    else:
+        srv = MockServer((args.host, args.port), text, args.wps, args.latency)
+        print(f"[MOCK STT] stream server on {args.host}:{args.port}")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
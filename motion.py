@@ -0,0 +1,221 @@
+# motion.py
+# 시간 예약 동작 스케줄러 (time.sleep으로 main 스레드를 막지 않음)
+# 동작 = (시작 기준 오프셋 초, 함수) 목록. 스케줄러가 monotonic 마감 시각에 맞춰 실행하고
+# MotionFuture를 돌려줌 -> 미션은 그동안 다른 일(녹음, STT, 로그)을 하다가 fut.wait()
+#
+#   real : 전용 스레드. 마감 SPIN_SEC 전까지는 Condition.wait, 마지막은 바쁜 대기로 서브 ms 정확도
+#   sim  : 가상 시계 타이머 (hal.VirtualClock.call_at) - 주인 스레드가 시간을 돌릴 때 그 시각에 실행
+#
+#   fut = motion.drive(motors, 3.6, 0.236)   # 바로 돌아옴
+#   ...                                      # 주행 중 다른 일
+#   fut.wait()
+#   motion.report()                          # 구간별 지시 시간 vs 실제 시간, 마감 지연
+
+import heapq
+import threading
+import time
+
+import hal
+from pwm_batch import batch, set_throttle
+
+SPIN_SEC = 0.002  # 마감 직전 이 시간은 바쁜 대기 (OS 깨우기 지연 제거)
+
+
+class MotionFuture:
+    """예약한 동작 하나. 마지막 단계가 실행되면 done"""
+
+    def __init__(self, name: str, commanded: float):
+        self.name = name
+        self.commanded = commanded  # 첫 단계 ~ 마지막 단계 (지시)
+        self.started = None         # 첫 단계 실제 실행 시각
+        self.finished = None        # 마지막 단계 실제 실행 시각
+        self.lateness = []          # 단계별 (실제 - 마감) 초
+        self.error = None
+        self.done = threading.Event()
+
+    @property
+    def actual(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    def wait(self, timeout: float = None) -> bool:
+        ok = hal.wait(self.done, timeout)
+        if self.error is not None:
+            raise self.error
+        return ok
+
+    def cancel(self):
+        """남은 단계 취소 (이미 실행한 단계는 그대로)"""
+        self.done.set()
+
+
+class MotionScheduler:
+    def __init__(self):
+        self.clock = hal.clock
+        self.virtual = isinstance(self.clock, hal.VirtualClock)
+        self.futures = []
+        self._heap = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._running = True
+        self._thread = None
+        if not self.virtual:
+            self._thread = threading.Thread(target=self._loop, name="motion", daemon=True)
+            self._thread.start()
+
+    # -----------------------------------------------------
+    # 예약
+    # -----------------------------------------------------
+    def _call_at(self, due: float, fn):
+        if self.virtual:
+            self.clock.call_at(due, fn)
+            return
+        with self._cond:
+            self._seq += 1
+            heapq.heappush(self._heap, (due, self._seq, fn))
+            self._cond.notify()
+
+    def submit(self, steps, name: str = "motion", start: float = None) -> MotionFuture:
+        """steps = [(오프셋 초, 함수), ...]. start = 기준 시각 (기본: 지금)"""
+        steps = sorted(steps, key=lambda s: s[0])
+        t0 = hal.now() if start is None else start
+        fut = MotionFuture(name, steps[-1][0] - steps[0][0])
+        self.futures.append(fut)
+        last = len(steps) - 1
+        for i, (offset, fn) in enumerate(steps):
+            self._call_at(t0 + offset, self._step(fut, t0 + offset, fn, i == 0, i == last))
+        return fut
+
+    def _step(self, fut: MotionFuture, due: float, fn, first: bool, last: bool):
+        def run():
+            if fut.done.is_set():
+                return  # 취소 / 앞 단계 오류
+            t = hal.now()
+            fut.lateness.append(t - due)
+            if first:
+                fut.started = t
+            try:
+                fn()
+            except Exception as e:
+                fut.error = e
+                fut.done.set()
+                return
+            if last:
+                fut.finished = t
+                fut.done.set()
+        return run
+
+    # -----------------------------------------------------
+    # real: 전용 스레드
+    # -----------------------------------------------------
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._running and not self._heap:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                due = self._heap[0][0]
+                left = due - time.monotonic()
+                if left > SPIN_SEC:
+                    self._cond.wait(left - SPIN_SEC)  # 새 예약이 더 빠를 수 있어서 다시 확인
+                    continue
+            while time.monotonic() < due:
+                pass
+            with self._cond:
+                _, _, fn = heapq.heappop(self._heap)
+            fn()
+
+    def close(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    # -----------------------------------------------------
+    # 리포트
+    # -----------------------------------------------------
+    def report(self):
+        done = [f for f in self.futures if f.finished is not None]
+        if not done:
+            return
+        print("\n===== MOTION TIMING =====")
+        by_name = {}
+        for f in done:
+            by_name.setdefault(f.name, []).append(f)
+        for name, fs in by_name.items():
+            err = [(f.actual - f.commanded) * 1000 for f in fs]
+            late = sorted(x * 1000 for f in fs for x in f.lateness)
+            print(f"{name:12s} n={len(fs):3d} commanded={sum(f.commanded for f in fs):7.2f}s "
+                  f"actual={sum(f.actual for f in fs):7.2f}s err max={max(err, key=abs):+.2f} ms "
+                  f"| late p50={late[len(late) // 2]:.3f} max={late[-1]:.3f} ms")
+        print("=========================")
+
+
+# =========================================================
+# 기본 스케줄러 (hal 시계가 바뀌면 새로 만듦 - sim_mission.py)
+# =========================================================
+_default = None
+
+
+def scheduler() -> MotionScheduler:
+    global _default
+    if _default is None or _default.clock is not hal.clock:
+        if _default is not None:
+            _default.close()
+        _default = MotionScheduler()
+    return _default
+
+
+def submit(steps, name: str = "motion", start: float = None) -> MotionFuture:
+    return scheduler().submit(steps, name, start)
+
+
+def report():
+    if _default is not None:
+        _default.report()
+
+
+def shutdown():
+    """남은 예약 전부 취소 (미션 종료 / Ctrl+C 뒤에 모터가 다시 켜지지 않게)"""
+    global _default
+    if _default is None:
+        return
+    for f in _default.futures:
+        f.cancel()
+    _default.close()
+    _default = None
+
+
+# =========================================================
+# 자주 쓰는 동작
+# =========================================================
+def drive(motors, sec: float, throttle: float, name: str = "drive") -> MotionFuture:
+    """throttle로 sec초 주행 후 정지"""
+    return submit([
+        (0.0, lambda: set_throttle(motors, throttle)),
+        (sec, lambda: set_throttle(motors, 0)),
+    ], name)
+
+
+def pose_steps(servos, points, t0: float = 0.0):
+    """[(오프셋, (각도, 각도, ...)), ...] -> 서보 여러 개를 한 트랜잭션으로 움직이는 단계 목록"""
+    def setter(angles):
+        def run():
+            with batch():
+                for srv, a in zip(servos, angles):
+                    srv.angle = a
+        return run
+    return [(t0 + t, setter(angles)) for t, angles in points]
+
+
+def angle_steps(srv, points, t0: float = 0.0):
+    """[(오프셋, 각도), ...] -> 서보 하나 단계 목록"""
+    return pose_steps((srv,), [(t, (a,)) for t, a in points], t0)
+
+
+def hold(sec: float):
+    """sec초 뒤 끝나는 빈 단계 (동작 뒤 안정 대기)"""
+    return [(sec, lambda: None)]
@@ -2,14 +2,16 @@ import os
 from datetime import datetime
 import time
 import threading
-import re
 
 import sounddevice as sd
 import soundfile as sf
-from openai import OpenAI
+
+from stt_client import SttClient
+
+from text_ratio import analyze, english_words
 
 # --- OpenAI 클라이언트 ---
-client = OpenAI()   # 환경변수에 API KEY 저장했다면 괄호 비워두기
+client = SttClient()   # 환경변수에 API KEY 저장했다면 괄호 비워두기. 녹음하는 동안 미리 연결 (stt_client.py)
 
 # --- 설정 ---
 SAVE_DIR = "/home/pi/recorded_voice"  # 라즈베리파이 저장 경로
@@ -68,19 +70,18 @@ def record_audio_to_wav() -> str:
 
 def analyze_english_ratio(text: str):
     """STT 텍스트 속 영어 단어 비율 계산"""
-    english_words = re.findall(r"[A-Za-z]+", text)
-    all_words = re.findall(r"[A-Za-z0-9가-힣]+", text)
+    a = analyze(text)
 
-    eng_count = len(english_words)
-    total_count = len(all_words)
+    eng_count = a.en_words
+    total_count = a.words
 
-    ratio = (eng_count / total_count * 100) if total_count > 0 else 0
+    ratio = a.word_ratio * 100
 
     print("\n===== 🔍 영어 단어 비율 분석 =====")
     print(f"영어 단어 수: {eng_count}")
     print(f"전체 단어 수: {total_count}")
     print(f"영어 비율: {ratio:.2f}%")
-    print(f"영어 단어 리스트: {english_words}")
+    print(f"영어 단어 리스트: {english_words(text)}")
     print("================================")
 
     return ratio
@@ -97,6 +98,10 @@ def transcribe_audio(path: str):
 
     text = getattr(result, "text", "") or str(result)
 
+    # lang_id.py 학습/평가용으로 WAV 옆에 텍스트 저장
+    with open(os.path.splitext(path)[0] + ".txt", "w", encoding="utf-8") as f:
+        f.write(text)
+
     print("\n===== 📝 변환된 텍스트 =====")
     print(text)
     print("============================")
@@ -5,10 +5,11 @@ import threading
 
 import sounddevice as sd
 import soundfile as sf
-from openai import OpenAI
+
+from stt_client import SttClient
 
 # --- OpenAI 클라이언트 ---
-client = OpenAI()   # 환경변수에 API KEY 저장했다면 괄호 비워두기
+client = SttClient()   # 환경변수에 API KEY 저장했다면 괄호 비워두기. 녹음하는 동안 미리 연결 (stt_client.py)
 
 
 # --- 설정 ---
@@ -93,6 +94,10 @@ def transcribe_audio(path: str):
 
     text = getattr(result, "text", "") or str(result)
 
+    # lang_id.py 학습/평가용으로 WAV 옆에 텍스트 저장
+    with open(os.path.splitext(path)[0] + ".txt", "w", encoding="utf-8") as f:
+        f.write(text)
+
     print("\n===== 📝 변환된 텍스트 =====")
     print(text)
     print("============================")
@@ -4,10 +4,12 @@
 
 import sys
 sys.path.append("/home/pi/Adeept_PiCar-Pro")
+sys.path.append("/home/pi/stt")
 
 import time
 import subprocess
 from picarpro import car
+from speech_daemon import classify, print_result
 
 # ======== 테스트용 설정값 ========
 FORWARD_SPEED = 40     # 테스트용 속도 약하게
@@ -59,6 +61,17 @@ def run_stt_script():
     script_path = "/home/pi/stt/pi_english_proportion.py"
     venv_python = "/home/pi/stt_venv/bin/python"
 
+    # 상주 프로세스(speech_daemon.py serve)가 있으면 새 프로세스 없이 요청만 보냄
+    try:
+        res = classify()
+    except OSError as e:
+        print(f"⚠ speech daemon 오류: {e}")
+        res = None
+    if res is not None:
+        print_result(res)
+        print(f"▶ speech daemon 처리 완료 ({res.get('timing', {}).get('total', 0):.1f}s)\n")
+        return
+
     print(f"▶ 외부 스크립트 실행 (venv): {script_path}")
 
     try:
@@ -0,0 +1,223 @@
+# planner.py
+# 조 격자 경로 계획 (Dijkstra, 상태 = (다음 조, x, y, 방향))
+# 기존 move_to: 한 칸씩만 이동, 180도는 무조건 좌회전 2번 (5 s x 2), (2,0)->(2,1) U턴은 좌표로 하드코딩
+# 여기서는 동작 단위(직진 n칸 / 좌회전 / 우회전 / U턴)를 미션 상수로 보정한 시간 비용으로 골라
+# 전체 PATH를 최소 시간으로 도는 명령 목록을 만듦. 같은 방향 직진은 forward_cells(n) 한 번으로 합침
+#   - 회전은 제자리에서 방향만 바뀜 (기존 rotate_to 와 같은 가정)
+#   - U턴 = uturn_half_circle: 왼쪽 한 칸 옆으로 옮겨가며 방향 반대 (예: (2,0) 동쪽 -> (2,1) 서쪽)
+#
+#   route = plan_route(PATH, Costs.from_constants(globals()), heading)
+#   for cmd, n in route.legs[idx - 1]: ...   # ("forward", 2), ("left", 1), ("right", 1), ("uturn", 1)
+#
+#   python3 planner.py 888.py                       # 기존 방식 vs 계획 비용 비교
+#   python3 planner.py 999.py --path "0,0 2,0 2,1 0,1"
+
+import argparse
+import heapq
+from dataclasses import dataclass, field
+
+DIRS = [(1, 0), (0, 1), (-1, 0), (0, -1)]  # 0=동 1=북 2=서 3=남 (desired_heading 과 같음)
+STEER_SEC = 0.15  # steer_to 안정 대기
+
+
+@dataclass
+class Costs:
+    """동작별 시간 (s). 미션 스크립트의 함수와 같은 계산"""
+    fwd_cell: float
+    left: float
+    right: float
+    uturn: float = None  # None = U턴 없음
+    steer: float = STEER_SEC
+
+    @classmethod
+    def from_constants(cls, c):
+        """미션 모듈 상수 (globals() / vars(mod)) 에서"""
+        uturn = None
+        if "UTURN_SEC" in c:
+            # uturn_half_circle: 0.2 출발 대기 + 회전 + 0.4 정지 + 후진
+            uturn = 0.2 + c["UTURN_SEC"] + 0.4 + c.get("REVERSE_SEC", 0.0)
+        return cls(fwd_cell=c["FWD_SEC_1CELL"],
+                   left=2 * STEER_SEC + c["TURN_SEC_LEFT"],
+                   right=2 * STEER_SEC + c["TURN_SEC_RIGHT"],
+                   uturn=uturn)
+
+    def of(self, cmd: str, n: int = 1) -> float:
+        if cmd == "forward":
+            return self.steer + n * self.fwd_cell  # forward_cells: 중앙 조향 + n칸
+        return getattr(self, cmd)
+
+
+@dataclass
+class Route:
+    legs: list                     # 조 i -> i+1 마다 [(명령, n), ...]
+    headings: list                 # 각 조 도착 방향 (0번 = 시작)
+    costs: Costs
+    leg_sec: list = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        return sum(self.leg_sec)
+
+
+def _apply(cmd: str, n: int, x: int, y: int, h: int):
+    if cmd == "forward":
+        dx, dy = DIRS[h]
+        return x + n * dx, y + n * dy, h
+    if cmd == "left":
+        return x, y, (h + 1) % 4
+    if cmd == "right":
+        return x, y, (h - 1) % 4
+    dx, dy = DIRS[(h + 1) % 4]  # uturn
+    return x + dx, y + dy, (h + 2) % 4
+
+
+def bounds(points):
+    """조 좌표를 감싸는 격자 범위 (xmin, xmax, ymin, ymax) - 이 안에서만 주행"""
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+def primitives(box, costs: Costs):
+    span = max(box[1] - box[0], box[3] - box[2])
+    prims = [("left", 1), ("right", 1)] + [("forward", n) for n in range(1, span + 1)]
+    if costs.uturn is not None:
+        prims.append(("uturn", 1))
+    return prims
+
+
+def _moves(x, y, h, box, prims):
+    for cmd, n in prims:
+        nx, ny, nh = _apply(cmd, n, x, y, h)
+        if box[0] <= nx <= box[1] and box[2] <= ny <= box[3]:
+            yield (cmd, n), nx, ny, nh
+
+
+def reach(x: int, y: int, h: int, box, costs: Costs) -> dict:
+    """(x, y, h)에서 출발해 격자 안 모든 (x, y, 방향)까지 최소 시간"""
+    prims = primitives(box, costs)
+    dist = {(x, y, h): 0.0}
+    heap = [(0.0, (x, y, h))]
+    while heap:
+        d, s = heapq.heappop(heap)
+        if d > dist[s]:
+            continue
+        for c, nx, ny, nh in _moves(*s, box, prims):
+            nd = d + costs.of(*c)
+            if nd < dist.get((nx, ny, nh), float("inf")):
+                dist[(nx, ny, nh)] = nd
+                heapq.heappush(heap, (nd, (nx, ny, nh)))
+    return dist
+
+
+def plan_route(path, costs: Costs, heading: int = 0) -> Route:
+    """path 순서대로 모든 조에 멈추는 최소 시간 명령 목록"""
+    box = bounds(path)
+    prims = primitives(box, costs)
+
+    x0, y0 = path[0]
+    start = (1, x0, y0, heading)
+    dist = {start: 0.0}
+    prev = {}
+    heap = [(0.0, start)]
+    goal = None
+    while heap:
+        d, s = heapq.heappop(heap)
+        if d > dist[s]:
+            continue
+        k, x, y, h = s
+        if k == len(path):
+            goal = s
+            break
+        for (cmd, n), nx, ny, nh in _moves(x, y, h, box, prims):
+            # 이동으로 다음 조 칸에 멈추면 그 조 도착 (지나가기만 하면 아님)
+            moved = (nx, ny) != (x, y)
+            nk = k + 1 if moved and (nx, ny) == tuple(path[k]) else k
+            ns = (nk, nx, ny, nh)
+            nd = d + costs.of(cmd, n)
+            if nd < dist.get(ns, float("inf")):
+                dist[ns] = nd
+                prev[ns] = (s, (cmd, n))
+                heapq.heappush(heap, (nd, ns))
+    if goal is None:
+        raise ValueError(f"경로 계획 실패: {path}")
+
+    cmds = []
+    s = goal
+    while s != start:
+        s, c = prev[s]
+        cmds.append((s, c))
+    cmds.reverse()
+
+    route = Route([[] for _ in path[1:]], [heading], costs)
+    route.leg_sec = [0.0] * (len(path) - 1)
+    for (k, x, y, h), (cmd, n) in cmds:
+        route.legs[k - 1].append((cmd, n))
+        route.leg_sec[k - 1] += costs.of(cmd, n)
+        nx, ny, nh = _apply(cmd, n, x, y, h)
+        if (nx, ny) != (x, y) and (nx, ny) == tuple(path[k]):
+            route.headings.append(nh)
+    return route
+
+
+def legacy_route(path, costs: Costs, heading: int = 0) -> Route:
+    """기존 move_to / rotate_to 방식 (비교용)"""
+    route = Route([], [heading], costs)
+    for (x0, y0), (x1, y1) in zip(path, path[1:]):
+        if (x0, y0) == (2, 0) and (x1, y1) == (2, 1) and costs.uturn is not None:
+            leg, heading = [("uturn", 1)], 2
+        else:
+            tgt = DIRS.index((x1 - x0, y1 - y0))
+            diff = (tgt - heading) % 4
+            leg = {0: [], 1: [("left", 1)], 3: [("right", 1)], 2: [("left", 1), ("left", 1)]}[diff]
+            leg = leg + [("forward", 1)]
+            heading = tgt
+        route.legs.append(leg)
+        route.headings.append(heading)
+        route.leg_sec.append(sum(costs.of(c, n) for c, n in leg))
+    return route
+
+
+def describe(leg) -> str:
+    return " ".join(f"F{n}" if c == "forward" else c[0].upper() for c, n in leg) or "-"
+
+
+def report(path, costs: Costs, heading: int = 0):
+    new = plan_route(path, costs, heading)
+    try:
+        old = legacy_route(path, costs, heading)
+    except ValueError:
+        old = None  # 기존 방식은 한 칸 이동만 가능
+    print("===== ROUTE COST =====")
+    print(f"costs: F1={costs.of('forward'):.2f}s L={costs.left:.2f}s R={costs.right:.2f}s "
+          f"U={costs.uturn if costs.uturn is not None else float('nan'):.2f}s")
+    print(f"{'leg':14s} {'before':>18s} {'sec':>6s}   {'planned':>18s} {'sec':>6s}")
+    for i, (a, b) in enumerate(zip(path, path[1:])):
+        before = f"{describe(old.legs[i]):>18s} {old.leg_sec[i]:6.2f}" if old else f"{'n/a':>18s} {'':>6s}"
+        print(f"{str(a) + '->' + str(b):14s} {before}   {describe(new.legs[i]):>18s} {new.leg_sec[i]:6.2f}")
+    if old:
+        print(f"total: before {old.total:.2f}s -> planned {new.total:.2f}s (saved {old.total - new.total:.2f}s)")
+    else:
+        print(f"total: planned {new.total:.2f}s")
+    print("======================")
+    return new
+
+
+def main():
+    import sim_mission
+    from pathlib import Path
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("mission", help="비용 상수를 읽을 미션 스크립트 (888.py / 998.py / 999.py)")
+    ap.add_argument("--path", help='조 좌표 (예: "0,0 1,0 2,0"). 기본: 미션 PATH')
+    args = ap.parse_args()
+
+    mod = sim_mission.load_mission(Path(args.mission))
+    path = mod.PATH
+    if args.path:
+        path = [tuple(int(v) for v in p.split(",")) for p in args.path.split()]
+    report(path, Costs.from_constants(vars(mod)), mod.heading)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+# power.py
+# 전원 전압 보정 주행
+# 모터 속도는 (throttle x 공급 전압)에 거의 비례 -> 배터리가 닳거나 충전기로 바꾸면 같은 SPEED / 시간에 거리가 달라짐
+# (998.py 배터리 SPEED 23.6 / 999.py 충전기 SPEED 35 포크가 생긴 이유)
+# 튜닝할 때 전압(v_ref)을 기준으로 주행 중 TICK_SEC마다 전압을 읽어서
+#   throttle : throttle x v_ref / V 로 올려서 속도 유지 (1.0에 막히면 남은 만큼 시간 연장)
+#   duration : throttle 그대로, 기준 전압 환산 진행량이 sec가 될 때까지 주행
+#   v_ref x VOLT_OK 범위 밖 값(0 V / 분압 접촉 불량 / 잘못 적은 v_ref)은 보정 없이 그 틱만 throttle / 시간 그대로
+# 전압: ADS7830 (I2C 0x48, Adeept 확장 보드 배터리 분압) / sim은 가상 시계로 떨어지는 가짜 전압
+#
+#   power.setup(V_REF, "throttle")
+#   power.drive(motors, FWD_SEC_1CELL, sp(SPEED))   # 기준 전압에서 FWD_SEC_1CELL 만큼 간 거리
+#   power.report()
+#
+#   python3 power.py --discharge                    # 8.4 -> 6.4 V 방전 중 1칸 거리 / 속도 안정성 (sim)
+#   python3 power.py --discharge --log discharge.csv
+
+import argparse
+import csv
+import statistics
+
+import hal
+from pwm_batch import BatchedPCA9685, set_throttle
+
+TICK_SEC = 0.1  # 주행 중 전압 다시 읽는 주기
+VOLT_OK = (0.5, 1.5)  # v_ref 대비 믿을 수 있는 전압 범위
+
+ADC_ADDRESS = 0x48
+ADC_CHANNEL = 0
+ADC_VREF = 3.3    # ADS7830 기준 전압
+ADC_DIVIDER = 3.0  # 배터리 -> ADC 분압비 (보드 저항에 맞게. 멀티미터로 확인)
+
+# sim 전압 (sim_mission.py --volt / --drain)
+SIM_VOLT = None    # None = v_ref 그대로 (보정 없음과 같은 결과)
+SIM_DRAIN = 0.0    # 모터 켜진 1초당 떨어지는 전압 (V)
+SIM_MPS_PER_VOLT = 0.0834 / (0.236 * 7.8)  # sim 모터 모델: 속도 = 이 값 x throttle x V (7.8 V, SPEED 23.6 -> 30 cm / 3.6 s)
+
+
+# =========================================================
+# 전압 읽기
+# =========================================================
+class ADS7830:
+    """8비트 ADC. 명령 바이트 하나 쓰고 한 바이트 읽기"""
+
+    def __init__(self, i2c, address: int = ADC_ADDRESS, channel: int = ADC_CHANNEL):
+        self.i2c = i2c
+        self.address = address
+        # 단일 입력, 내부 기준 끔 / ADC 켬 (PD = 01)
+        self.cmd = 0x84 | (((channel << 2 | channel >> 1) & 0x07) << 4)
+        self.read()  # 없으면 여기서 예외
+
+    def read(self) -> float:
+        buf = bytearray(1)
+        while not self.i2c.try_lock():
+            pass
+        try:
+            self.i2c.writeto_then_readfrom(self.address, bytes([self.cmd]), buf)
+        finally:
+            self.i2c.unlock()
+        return buf[0] / 255 * ADC_VREF * ADC_DIVIDER
+
+
+class SimSupply:
+    """모터가 켜져 있던 시간만큼 선형으로 떨어지는 전압 (부하 없으면 유지) + 간 거리 적분"""
+
+    def __init__(self, volt: float, drain: float = 0.0):
+        self.volt = volt
+        self.drain = drain
+        self.on_sec = 0.0
+        self.distance = 0.0  # m
+
+    def true_volt(self) -> float:
+        return self.volt - self.drain * self.on_sec
+
+    def read(self) -> float:
+        """ADS7830 8비트 해상도로 양자화한 값"""
+        lsb = ADC_VREF * ADC_DIVIDER / 255
+        return round(self.true_volt() / lsb) * lsb
+
+    def run(self, sec: float, throttle: float):
+        v0 = self.true_volt()
+        self.on_sec += sec
+        self.distance += SIM_MPS_PER_VOLT * throttle * (v0 + self.true_volt()) / 2 * sec
+
+
+# =========================================================
+# 보정 주행
+# =========================================================
+class Supply:
+    def __init__(self, source, v_ref: float, mode: str = "throttle"):
+        self.source = source
+        self.v_ref = v_ref
+        self.mode = mode
+        self.segments = []  # (시작 시각, 기준 sec, 실제 sec, 시작 V, 끝 V, 평균 throttle)
+        self.bad_reads = 0  # VOLT_OK 밖이라 보정 안 한 틱
+
+    def read(self) -> float:
+        return self.source.read()
+
+    def command(self, throttle: float, volt: float):
+        """-> (실제 throttle, 기준 전압 대비 진행 속도 비)"""
+        ratio = volt / self.v_ref
+        if not VOLT_OK[0] <= ratio <= VOLT_OK[1]:
+            if self.bad_reads == 0:
+                print(f"[POWER WARN] {volt:.2f} V outside {VOLT_OK[0] * self.v_ref:.2f}-"
+                      f"{VOLT_OK[1] * self.v_ref:.2f} V -> 보정 없이 주행")
+            self.bad_reads += 1
+            return throttle, 1.0
+        if self.mode == "throttle" and throttle > 0:
+            thr = min(1.0, throttle / ratio)
+            return thr, ratio * thr / throttle
+        return throttle, ratio
+
+    def drive(self, motors, sec: float, throttle: float) -> float:
+        """기준 전압에서 sec초 간 거리만큼 주행 -> 실제 걸린 시간"""
+        t0 = t = hal.now()
+        v0 = self.read()
+        done = 0.0  # 기준 전압 환산 진행 (s)
+        thr_sum = 0.0
+        while done < sec - 1e-9:
+            thr, rate = self.command(throttle, self.read())
+            set_throttle(motors, thr)
+            # 전압 읽기 / I2C 쓰기 시간도 주행 중이므로 마감 시각 기준으로 대기
+            hal.sleep(max(0.0, t + min(TICK_SEC, (sec - done) / rate) - hal.now()))
+            dt, t = hal.now() - t, hal.now()
+            if isinstance(self.source, SimSupply):
+                self.source.run(dt, thr)
+            done += dt * rate
+            thr_sum += thr * dt
+        set_throttle(motors, 0)
+        actual = hal.now() - t0
+        self.segments.append((t0, sec, actual, v0, self.read(), thr_sum / max(actual, 1e-9)))
+        return actual
+
+    def scale(self, throttle: float):
+        """미리 짠 타임라인(U턴 등)용: 지금 전압 기준 (throttle, 시간 배율)"""
+        thr, rate = self.command(throttle, self.read())
+        return thr, 1.0 / rate
+
+    def report(self):
+        if not self.segments:
+            return
+        print(f"\n===== SUPPLY ({self.mode}, v_ref {self.v_ref:.2f} V) =====")
+        for t0, sec, actual, v0, v1, thr in self.segments:
+            print(f"t={t0:7.2f}s  {v0:.2f}->{v1:.2f} V  ref {sec:.2f}s -> {actual:.2f}s  throttle {thr:.3f}")
+        if self.bad_reads:
+            print(f"implausible readings {self.bad_reads} (driven uncompensated)")
+        print("=" * 44)
+
+
+# =========================================================
+# 기본 전원 (미션 스크립트)
+# =========================================================
+_default = None
+
+
+def setup(v_ref: float, mode: str = "throttle"):
+    """mode = "throttle" / "duration" / None(보정 안 함). 전압을 못 읽으면 보정 없이 주행"""
+    global _default
+    _default = None
+    if mode is None:
+        return None
+    if hal.BACKEND == "sim":
+        source = SimSupply(v_ref if SIM_VOLT is None else SIM_VOLT, SIM_DRAIN)
+    else:
+        try:
+            source = ADS7830(hal.i2c_bus())
+        except Exception as e:
+            print(f"[POWER] 전압 못 읽음 -> 보정 없이 주행 ({e})")
+            return None
+    _default = Supply(source, v_ref, mode)
+    print(f"[POWER] {_default.read():.2f} V (ref {v_ref:.2f} V, {mode})")
+    return _default
+
+
+def drive(motors, sec: float, throttle: float):
+    if _default is None:
+        import motion
+        motion.drive(motors, sec, throttle).wait()
+        return sec
+    return _default.drive(motors, sec, throttle)
+
+
+def scale(throttle: float):
+    if _default is None:
+        return throttle, 1.0
+    return _default.scale(throttle)
+
+
+def report():
+    if _default is not None:
+        _default.report()
+
+
+# =========================================================
+# 방전 시뮬레이션
+# =========================================================
+def discharge_sim(mode, v_full=8.4, v_empty=6.4, v_ref=7.8, sec=3.6, throttle=0.236, cells=60):
+    """1칸 주행 cells번 하는 동안 v_full -> v_empty. mode None = 보정 없음 (TICK_SEC마다 같은 throttle)"""
+    hal.use_sim()
+    pca = BatchedPCA9685(hal.pca9685(None, hal.SIM_ADDRESS))
+    motors = [hal.motor.DCMotor(pca.channels[a], pca.channels[b]) for a, b in ((15, 14), (12, 13))]
+    src = SimSupply(v_full, (v_full - v_empty) / (cells * sec))
+    sup = Supply(src, v_ref, mode)
+    if mode is None:
+        sup.command = lambda thr, volt: (thr, 1.0)
+    rows = []
+    for i in range(cells):
+        v0, d0 = src.true_volt(), src.distance
+        actual = sup.drive(motors, sec, throttle)
+        cm = (src.distance - d0) * 100
+        rows.append((i, round(v0, 3), round(actual, 3), round(cm, 2), round(cm / actual, 3)))
+    pca.deinit()
+    return rows
+
+
+def discharge_bench(log=None):
+    print("===== DISCHARGE SIM (8.4 -> 6.4 V, 60 x 1 cell, ref 7.8 V = 30 cm) =====")
+    print(f"{'mode':10s} {'cm/cell mean':>12s} {'min':>6s} {'max':>6s} {'stdev':>6s} "
+          f"{'sec/cell':>12s} {'cm/s range':>14s}")
+    out = []
+    for mode in (None, "throttle", "duration"):
+        rows = discharge_sim(mode)
+        cm = [r[3] for r in rows]
+        cms = [r[4] for r in rows]
+        secs = [r[2] for r in rows]
+        print(f"{str(mode):10s} {statistics.mean(cm):12.1f} {min(cm):6.1f} {max(cm):6.1f} "
+              f"{statistics.stdev(cm):6.2f} {min(secs):5.2f}-{max(secs):5.2f}s "
+              f"{min(cms):6.2f}-{max(cms):6.2f}")
+        out += [(str(mode),) + r for r in rows]
+    print("=" * 72)
+    if log:
+        with open(log, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["mode", "cell", "volt", "sec", "cm", "cm_per_s"])
+            w.writerows(out)
+        print(f"saved {log}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--discharge", action="store_true")
+    ap.add_argument("--log", help="셀별 기록 CSV")
+    args = ap.parse_args()
+    if args.discharge:
+        discharge_bench(args.log)
+    else:
+        src = ADS7830(hal.i2c_bus())
+        print(f"[POWER] {src.read():.2f} V")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+# pwm_batch.py
+# PCA9685 채널 쓰기 묶음 처리
+# adafruit 드라이버는 duty_cycle 하나 쓸 때마다 I2C 트랜잭션 한 번 -> 모터 2개(채널 4개)를 차례로 켜면
+# 좌우 시작 시각이 어긋나고 서보 스윕 중에는 버스가 계속 바쁨
+#   - with pwm_batch.batch(): 안의 쓰기는 모아뒀다가 LED0_ON_L(0x06)부터 자동 증가 블록 쓰기 한 번으로 전송
+#     (PCA9685는 STOP 때 출력을 바꾸므로 같은 트랜잭션 안의 채널은 동시에 바뀜)
+#   - 레지스터 값(12비트)이 이전과 같으면 쓰기 생략
+#
+#   python3 pwm_batch.py --bench          # sim: 트랜잭션 수 / 좌우 시작 어긋남 비교
+#   python3 pwm_batch.py --bench --real   # 라즈베리파이에서 실제 I2C 시간 측정 (모터는 정지/브레이크만)
+
+import argparse
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import hal
+
+LED0_ON_L = 0x06
+FULL = 0x1000  # ON_H / OFF_H 의 full on / full off 비트
+
+
+def encode(duty: int):
+    """16비트 duty -> (ON, OFF) 12비트 레지스터 값 (adafruit PCA9685와 같은 규칙)"""
+    if duty == 0xFFFF:
+        return FULL, 0
+    if duty < 0x10:
+        return 0, FULL
+    return 0, duty >> 4
+
+
+class BatchChannel:
+    def __init__(self, board, index: int):
+        self._board = board
+        self._index = index
+
+    @property
+    def frequency(self):
+        return self._board.frequency
+
+    @property
+    def duty_cycle(self) -> int:
+        return self._board.duty[self._index]
+
+    @duty_cycle.setter
+    def duty_cycle(self, value: int):
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError(f"Out of range: value {value} not 0 <= value <= 65,535")
+        self._board.write(self._index, int(value))
+
+
+class BatchedPCA9685:
+    """PCA9685 (hal.pca9685 결과)를 감싸서 채널 쓰기를 묶음 / 중복 제거"""
+
+    def __init__(self, pca, dedupe: bool = True):
+        self.pca = pca
+        self.dedupe = dedupe
+        self.channels = [BatchChannel(self, i) for i in range(16)]
+        self.duty = [0] * 16
+        self._regs = [None] * 16  # 마지막으로 보낸 (ON, OFF), None = 모름
+        self._staged = {}
+        self._lock = threading.RLock()
+        self.transactions = 0
+        self.channel_writes = 0
+        self.skipped = 0
+        _boards.append(self)
+
+    @property
+    def frequency(self):
+        return self.pca.frequency
+
+    @frequency.setter
+    def frequency(self, value):
+        self.pca.frequency = value
+
+    def deinit(self):
+        _boards.remove(self)
+        self.pca.deinit()
+
+    def write(self, ch: int, duty: int):
+        with self._lock:
+            self.duty[ch] = duty
+            self._staged[ch] = duty
+            if _depth == 0:
+                self.flush()
+
+    def _runs(self, changed):
+        """바뀐 채널들을 연속 구간으로. 사이 채널 값을 알고 있으면 한 구간으로 합침"""
+        runs = []
+        for ch in changed:
+            if runs and all(self._regs[c] is not None for c in range(runs[-1][1] + 1, ch)):
+                runs[-1][1] = ch
+            else:
+                runs.append([ch, ch])
+        return runs
+
+    def flush(self):
+        with self._lock:
+            staged, self._staged = self._staged, {}
+            changed = []
+            for ch in sorted(staged):
+                if self.dedupe and self._regs[ch] == encode(staged[ch]):
+                    self.skipped += 1
+                else:
+                    changed.append(ch)
+            for lo, hi in self._runs(changed):
+                self._send(lo, hi)
+
+    def _send(self, lo: int, hi: int):
+        duties = self.duty[lo:hi + 1]
+        regs = [encode(d) for d in duties]
+        if hasattr(self.pca, "write_channels"):  # hal sim
+            self.pca.write_channels(lo, duties)
+        else:
+            buf = bytearray([LED0_ON_L + 4 * lo])
+            for on, off in regs:
+                buf += bytes((on & 0xFF, on >> 8, off & 0xFF, off >> 8))
+            with self.pca.i2c_device as i2c:
+                i2c.write(buf)
+        self._regs[lo:hi + 1] = regs
+        self.transactions += 1
+        self.channel_writes += hi - lo + 1
+
+    def report(self, name: str = "PCA9685"):
+        print(f"[I2C] {name}: {self.transactions} transactions, {self.channel_writes} channel writes, "
+              f"{self.skipped} skipped (unchanged)")
+
+
+_boards = []
+_depth = 0
+_depth_lock = threading.Lock()
+
+
+@contextmanager
+def batch():
+    """안에서 쓴 채널을 모아뒀다가 끝날 때 보드마다 블록 쓰기 (중첩 가능)"""
+    global _depth
+    with _depth_lock:
+        _depth += 1
+    try:
+        yield
+    finally:
+        with _depth_lock:
+            _depth -= 1
+            last = _depth == 0
+        if last:
+            for b in list(_boards):
+                b.flush()
+
+
+def set_throttle(motors, value):
+    """모터 여러 개를 트랜잭션 한 번으로 (좌우 동시 출발 / 정지)"""
+    with batch():
+        for m in motors:
+            m.throttle = value
+
+
+# =========================================================
+# 벤치마크
+# =========================================================
+M1, M2 = (15, 14), (12, 13)  # 미션 스크립트의 M1_IN1/IN2, M2_IN1/IN2
+ARM1_CH, ARM2_CH = 9, 8
+
+
+def _start_times(log, since: float, ch_pairs):
+    """모터별로 두 채널이 새 값이 된 시각 (sim 기록 기준)"""
+    out = []
+    for pair in ch_pairs:
+        out.append(max(t for t, ch, _ in log if ch in pair and t >= since))
+    return out
+
+
+def _bench_sim(batched: bool):
+    hal.use_sim()
+    pca = hal.pca9685(None, hal.SIM_ADDRESS)
+    board = BatchedPCA9685(pca) if batched else pca
+    group = batch if batched else nullcontext
+    ms = [hal.motor.DCMotor(board.channels[a], board.channels[b]) for a, b in (M1, M2)]
+    for m in ms:
+        m.decay_mode = hal.motor.SLOW_DECAY
+    a1 = hal.servo.Servo(board.channels[ARM1_CH], min_pulse=500, max_pulse=2500)
+    a2 = hal.servo.Servo(board.channels[ARM2_CH], min_pulse=500, max_pulse=2500)
+
+    with group():
+        for m in ms:
+            m.throttle = 0
+    tx0, t0 = pca.transactions, hal.now()
+    with group():
+        for m in ms:
+            m.throttle = 0.236
+    start_tx = pca.transactions - tx0
+    s1, s2 = _start_times(pca.log, t0, (M1, M2))
+
+    # 888.py arm_grip_action 과 같은 스윕 (40->145, 90->180, 2도씩, 단계마다 묶음)
+    tx0 = pca.transactions
+    for i in range(0, 106, 2):
+        with group():
+            a1.angle = min(40 + i, 145)
+            a2.angle = min(90 + i, 180)
+    sweep_tx = pca.transactions - tx0
+    if batched:
+        board.deinit()
+    return start_tx, abs(s2 - s1) * 1000, sweep_tx
+
+
+def bench_sim():
+    print("===== PCA9685 BATCH BENCH (sim, "
+          f"{hal.I2C_HZ // 1000} kHz + {hal.TX_OVERHEAD_SEC * 1e3:.1f} ms/tx) =====")
+    for name, batched in (("per-channel (before)", False), ("batched + dedupe", True)):
+        tx, skew, sweep = _bench_sim(batched)
+        print(f"{name:22s} motor start: {tx} tx, L/R skew {skew:.2f} ms | arm sweep: {sweep} tx")
+    print("=" * 60)
+
+
+def bench_real(repeat: int = 50):
+    """실제 I2C. 모터는 브레이크(0) <-> 공회전(None)만 번갈아 써서 움직이지 않음"""
+    i2c = hal.i2c_bus()
+    pca = hal.pca9685(i2c, 0x5F)
+    pca.frequency = 50
+    board = BatchedPCA9685(pca)
+    for name, chs, batched in (("per-channel (before)", pca.channels, False),
+                               ("batched", board.channels, True)):
+        ms = [hal.motor.DCMotor(chs[a], chs[b]) for a, b in (M1, M2)]
+        skews = []
+        for k in range(repeat):
+            v = 0 if k % 2 else None
+            t0 = time.perf_counter()
+            if batched:
+                set_throttle(ms, v)
+            else:
+                for m in ms:
+                    m.throttle = v
+            skews.append((time.perf_counter() - t0) * 1000)
+        skews.sort()
+        tx = "1 tx" if batched else "4 tx"
+        print(f"{name:22s} {tx}, write span p50={skews[len(skews) // 2]:.2f} ms max={skews[-1]:.2f} ms")
+    board.report()
+    pca.deinit()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--bench", action="store_true")
+    ap.add_argument("--real", action="store_true", help="라즈베리파이 실제 PCA9685 (0x5F)")
+    args = ap.parse_args()
+    if args.real:
+        bench_real()
+    else:
+        bench_sim()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+# replay.py
+# 미션 음성 쪽 재생 (사람 없이 녹음 -> STT -> english_ratio -> 제스처 판단 벤치마크)
+# 조별로 녹음해둔 WAV(/home/pi/recorded_voice)를 녹음 대신 넣고, STT는 mock_stt_server.py HTTP 대체 서버
+# (WAV 옆 .txt 대본을 지연 시간 뒤 돌려줌)로 보내서 mission.py 와 같은 함수로 판단
+#   - transcribe(헤지 / 마감 포함) / local_decision / deadline_ratio / decide 는 mission.py 것을 그대로 (프로필 값 포함)
+#   - 파이프라인(조 N STT를 조 N+1 이동 중에)도 미션과 같은 순서, 이동 시간은 planner 계획 x --pace
+#   - 조별 end-to-end 지연(녹음 끝 -> 판단) / STT 시간 / 차가 기다린 시간 + 처리량
+#   - --expect 로 저장해둔 판단과 비교 (판단이 바뀌면 exit 1)
+#
+#   python3 replay.py --dir /home/pi/recorded_voice --latency 800 --jitter 400
+#   python3 replay.py --dir voices --profile 999 --pace 1          # 실제 시간으로 (녹음 / 이동 대기)
+#   python3 replay.py --dir voices --save-expect expect.json       # 기준 판단 저장
+#   python3 replay.py --dir voices --expect expect.json --no-pipeline --repeat 5
+#   python3 replay.py --dir voices --cache /tmp/stt_cache --repeat 2  # STT 캐시 켜고 (기본은 꺼서 STT 매번)
+#   python3 replay.py --dir voices --connect-ms 300 --pace 1 --pooled  # 미션과 같은 연결 풀 + 워밍업 (stt_client.py)
+#   python3 replay.py --dir voices --repeat 5 --slow-rate 0.2 --fail-rate 0.05 --compare \
+#       --deadline 8 --hedge-model gpt-4o-mini-transcribe                     # 헤지 끔 vs 켬 꼬리 지연
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import urllib.request
+import uuid
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+
+import mock_stt_server
+import stt_cache
+import stt_hedge
+from mission_trace import percentile
+from planner import Costs, plan_route
+from stt_pipeline import SttPipeline
+from text_ratio import english_ratio
+
+
+# =========================================================
+# STT 클라이언트 (OpenAI client 중 audio.transcriptions.create 만)
+# =========================================================
+class HttpClient:
+    """stdlib urllib, 요청마다 새 연결 (--pooled 는 미션과 같은 stt_client.SttClient)"""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.audio = SimpleNamespace(transcriptions=SimpleNamespace(create=self.transcribe))
+
+    def transcribe(self, model: str, file, **kw):
+        b = uuid.uuid4().hex
+        name = Path(getattr(file, "name", "audio.wav")).name
+        body = (f'--{b}\r\nContent-Disposition: form-data; name="model"\r\n\r\n{model}\r\n'
+                f'--{b}\r\nContent-Disposition: form-data; name="file"; filename="{name}"\r\n'
+                f'Content-Type: application/octet-stream\r\n\r\n').encode() + file.read() + f"\r\n--{b}--\r\n".encode()
+        req = urllib.request.Request(self.base_url + "/audio/transcriptions", data=body,
+                                     headers={"Content-Type": f"multipart/form-data; boundary={b}"})
+        with urllib.request.urlopen(req, timeout=self.timeout) as r:
+            return SimpleNamespace(text=json.loads(r.read())["text"])
+
+
+# =========================================================
+# 재생
+# =========================================================
+@dataclass
+class Stop:
+    idx: int
+    wav: Path
+    rec_end: float = 0.0
+    decided: float = 0.0
+    stt_sec: float = 0.0
+    wait_sec: float = 0.0
+    path: str = "stt"    # "stt" / "local" / "miss" (STT 마감 넘김 -> lang_id 추정)
+    text: str = ""
+    ratio: float = 0.0
+    decision: str = ""
+
+    @property
+    def e2e(self) -> float:
+        return self.decided - self.rec_end
+
+
+def wav_sec(wav: Path) -> float:
+    with wave.open(str(wav), "rb") as w:
+        return w.getnframes() / w.getframerate()
+
+
+def stop_uploads(wavs, folder) -> list:
+    """조마다 다른 업로드 이름 (<이름>~<조 순번>.wav 심볼릭 링크) -> 대체 서버가 --repeat 바퀴 /
+    헤지 요청 수와 상관없이 같은 조에 같은 지연 / 장애 (--compare 두 번이 같은 조건)"""
+    out = []
+    for idx, wav in enumerate(wavs):
+        link = Path(folder) / f"{wav.stem}{mock_stt_server.ALIAS_SEP}{idx}{wav.suffix}"
+        link.symlink_to(wav.resolve())
+        out.append(link)
+    return out
+
+
+def replay(mod, wavs, client, pipeline: bool = True, pace: float = 0.0, lid=None, uploads=None):
+    """미션 main 루프의 음성 쪽 순서 그대로. -> (Stop 목록, 전체 시간)
+    uploads = STT에 올릴 파일 (wavs 와 같은 순서, 기본 wavs 그대로)"""
+    uploads = uploads or wavs
+    legs = plan_route(mod.PATH, Costs.from_constants(vars(mod)), mod.heading).leg_sec
+    pipe = SttPipeline(lambda audio: mod.transcribe(client, audio)) if pipeline else None
+    stops = []
+    pending = None
+
+    def settle(stop, text, ratio=None, path="stt"):
+        if text is None:
+            ratio, path = mod.deadline_ratio(lid, stop.wav), "miss"
+        stop.text = text or ""
+        stop.ratio = english_ratio(text) if ratio is None else ratio
+        stop.decision = mod.decide(stop.ratio)
+        stop.path = path
+        stop.decided = time.perf_counter()
+
+    t0 = time.perf_counter()
+    try:
+        for idx, wav in enumerate(wavs):
+            if idx > 0:
+                time.sleep(legs[(idx - 1) % len(legs)] * pace)  # 이동
+            if pending is not None:
+                job, prev = pending
+                w0 = time.perf_counter()
+                text = pipe.wait(job)
+                prev.wait_sec = time.perf_counter() - w0
+                prev.stt_sec = job.busy_sec
+                settle(prev, text)
+                pending = None
+
+            stop = Stop(idx, wav)
+            stops.append(stop)
+            time.sleep(min(wav_sec(wav), mod.RECORD_SEC) * pace)  # 녹음
+            stop.rec_end = time.perf_counter()
+
+            est = mod.local_decision(lid, wav)
+            if est is not None:
+                settle(stop, "", est.ratio, "local")
+                continue
+            if pipe is not None:
+                pending = (pipe.submit(idx, uploads[idx]), stop)
+                continue
+            try:
+                text = mod.transcribe(client, uploads[idx])
+            except Exception as e:
+                text = ""
+                print(f"[STT ERR] {e}")
+            stop.stt_sec = stop.wait_sec = time.perf_counter() - stop.rec_end
+            settle(stop, text)
+
+        if pending is not None:
+            job, prev = pending
+            w0 = time.perf_counter()
+            text = pipe.wait(job)
+            prev.wait_sec = time.perf_counter() - w0
+            prev.stt_sec = job.busy_sec
+            settle(prev, text)
+    finally:
+        if pipe is not None:
+            pipe.close()
+    return stops, time.perf_counter() - t0
+
+
+def report(stops, wall: float, expect: dict = None) -> int:
+    """-> 기대 판단과 다른 조 수"""
+    print(f"\n===== REPLAY ({len(stops)} stops) =====")
+    print(f"{'stop':>4s} {'file':24s} {'path':5s} {'stt':>7s} {'e2e':>7s} {'wait':>7s} {'ratio':>7s}  decision")
+    bad = 0
+    for s in stops:
+        mark = ""
+        if expect is not None and s.wav.name in expect and expect[s.wav.name] != s.decision:
+            mark = f"  REGRESSION (expected {expect[s.wav.name]})"
+            bad += 1
+        print(f"{s.idx + 1:4d} {s.wav.name[:24]:24s} {s.path:5s} {s.stt_sec:6.2f}s {s.e2e:6.2f}s "
+              f"{s.wait_sec:6.2f}s {s.ratio * 100:6.1f}%  {s.decision}{mark}")
+    e2e = [s.e2e for s in stops]
+    stt = [s.stt_sec for s in stops if s.path == "stt"]
+    if len(stt) > 1:
+        print(f"first stop STT {stt[0]:.2f}s vs rest p50 {percentile(stt[1:], 50):.2f}s")
+    print(f"throughput: {len(stops)} stops in {wall:.2f}s = {len(stops) / wall * 60:.1f} stops/min")
+    print(f"e2e latency: p50 {percentile(e2e, 50):.2f}s  p95 {percentile(e2e, 95):.2f}s  max {max(e2e):.2f}s")
+    print(f"car waited for STT: {sum(s.wait_sec for s in stops):.2f}s total")
+    if expect is not None:
+        checked = sum(1 for s in stops if s.wav.name in expect)
+        print(f"decisions: {checked - bad}/{checked} match expected")
+    print("=" * 40)
+    return bad
+
+
+def run_once(args, mod, wavs, lid, hedge: bool):
+    """대체 서버 하나 띄워서 한 번 재생 (--compare 는 같은 seed로 두 번)"""
+    deadline = mod.STT_DEADLINE_SEC
+    if not hedge:
+        mod.STT_DEADLINE_SEC = None
+    stt_hedge.setup()
+    srv = mock_stt_server.start_http_in_thread(mock_stt_server.load_transcripts(args.dir), text=args.text,
+                                               latency_ms=args.latency, jitter_ms=args.jitter, seed=args.seed,
+                                               connect_ms=args.connect_ms, idle_sec=args.idle,
+                                               fail_rate=args.fail_rate, slow_rate=args.slow_rate,
+                                               slow_ms=args.slow_ms)
+    if args.pooled:
+        import stt_client
+        client = stt_client.SttClient(srv.base_url, "mock")
+    else:
+        client = HttpClient(srv.base_url)
+    print(f"[REPLAY] {len(wavs)} WAV x {args.repeat}, stub {srv.base_url} "
+          f"latency {args.latency:.0f}+0~{args.jitter:.0f} ms, profile {mod.PROFILE.name}, "
+          f"{'sync' if args.no_pipeline else 'pipeline'}, pace {args.pace}, "
+          f"{'pooled' if args.pooled else 'urllib'} client, "
+          f"{'hedge' if mod.STT_DEADLINE_SEC is not None else 'no hedge'}")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            wavs = wavs * args.repeat
+            return replay(mod, wavs, client, not args.no_pipeline, args.pace, lid, stop_uploads(wavs, tmp))
+    finally:
+        srv.shutdown()
+        if srv.faults["fail"] or srv.faults["slow"]:
+            print(f"[REPLAY] injected {srv.faults['fail']} failures, {srv.faults['slow']} slow of {srv.requests}")
+        if args.pooled:
+            client.report()
+            client.close()
+        mod.STT_DEADLINE_SEC = deadline
+
+
+def main():
+    import sim_mission
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dir", default="/home/pi/recorded_voice", help="조별 WAV (+ 같은 이름 .txt 대본)")
+    ap.add_argument("--mission", default="mission.py")
+    ap.add_argument("--profile", help="PICAR_PROFILE (기본 998)")
+    ap.add_argument("--latency", type=float, default=800, help="대체 서버 응답 지연 (ms)")
+    ap.add_argument("--jitter", type=float, default=0, help="지연에 더할 0 ~ jitter ms")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--text", default="", help=".txt 없는 WAV에 돌려줄 문장")
+    ap.add_argument("--no-pipeline", action="store_true", help="STT 끝날 때까지 기다렸다가 다음 조")
+    ap.add_argument("--pace", type=float, default=0.0,
+                    help="녹음 / 이동 시간 배율 (0 = 안 기다림, 1 = 실제 미션 시간)")
+    ap.add_argument("--repeat", type=int, default=1, help="WAV 목록을 몇 바퀴")
+    ap.add_argument("--expect", type=Path, help="기준 판단 JSON {파일: 제스처}")
+    ap.add_argument("--save-expect", type=Path, help="이번 판단을 기준으로 저장")
+    ap.add_argument("--cache", type=Path, help="STT 캐시 폴더 (없으면 캐시 끔)")
+    ap.add_argument("--connect-ms", type=float, default=0, help="대체 서버 새 연결 비용 (ms, TLS 흉내)")
+    ap.add_argument("--idle", type=float, default=0, help="대체 서버가 쉬는 연결을 닫는 시간 (s)")
+    ap.add_argument("--pooled", action="store_true", help="stt_client.SttClient (httpx 풀 + 워밍업)")
+    ap.add_argument("--fail-rate", type=float, default=0, help="대체 서버 500 에러 확률")
+    ap.add_argument("--slow-rate", type=float, default=0, help="대체 서버 느린 응답 확률")
+    ap.add_argument("--slow-ms", type=float, default=10000, help="느린 응답에 더할 지연 (ms)")
+    ap.add_argument("--deadline", type=float, help="STT_DEADLINE_SEC 바꾸기")
+    ap.add_argument("--hedge-model", help="STT_HEDGE_MODEL 바꾸기")
+    ap.add_argument("--no-hedge", action="store_true", help="헤지 / 마감 끄기 (기존 stt_transcribe 그대로)")
+    ap.add_argument("--compare", action="store_true", help="헤지 끔 / 켬 두 번 돌려서 꼬리 지연 비교")
+    args = ap.parse_args()
+
+    if args.profile:
+        os.environ["PICAR_PROFILE"] = args.profile
+    wavs = sorted(Path(args.dir).glob("*.wav"))
+    if not wavs:
+        raise SystemExit(f"{args.dir}에 WAV 없음")
+    mod = sim_mission.load_mission(Path(args.mission))
+    mod.STT_CACHE = args.cache is not None
+    if args.cache:
+        stt_cache.setup(args.cache)
+    if args.deadline is not None:
+        mod.STT_DEADLINE_SEC = args.deadline
+    if args.hedge_model is not None:
+        mod.STT_HEDGE_MODEL = args.hedge_model
+    lid = None
+    if mod.LANG_ID_MODEL.exists():
+        lid = mod.lang_id.LangId.load(mod.LANG_ID_MODEL)
+    expect = json.loads(args.expect.read_text(encoding="utf-8")) if args.expect else None
+
+    if args.compare and mod.STT_DEADLINE_SEC is None:
+        raise SystemExit("--compare: 프로필에 stt_deadline_sec 없음 -> --deadline 필요")
+    if args.compare:
+        rows = [(label, run_once(args, mod, wavs, lid, hedge)) for label, hedge in (("no hedge", False),
+                                                                                    ("hedge", True))]
+        print(f"\n===== HEDGE COMPARE (deadline {mod.STT_DEADLINE_SEC}s, hedge model {mod.STT_HEDGE_MODEL}) =====")
+        print(f"{'':10s} {'e2e p50':>8s} {'p95':>7s} {'max':>7s} {'waited':>8s} {'miss':>5s}")
+        for label, (stops, wall) in rows:
+            e2e = [s.e2e for s in stops]
+            print(f"{label:10s} {percentile(e2e, 50):7.2f}s {percentile(e2e, 95):6.2f}s {max(e2e):6.2f}s "
+                  f"{sum(s.wait_sec for s in stops):7.2f}s {sum(s.path == 'miss' for s in stops):5d}")
+        print("=" * 52)
+        stops, wall = rows[-1][1]
+    else:
+        stops, wall = run_once(args, mod, wavs, lid, not args.no_hedge)
+    bad = report(stops, wall, expect)
+    stt_cache.report()
+    stt_hedge.report()
+    if args.save_expect:
+        args.save_expect.write_text(json.dumps({s.wav.name: s.decision for s in stops}, indent=1,
+                                               ensure_ascii=False), encoding="utf-8")
+        print(f"saved {args.save_expect}")
+    if bad:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# route_opt.py
+# 조 방문 순서 최적화 (PATH 자동 생성)
+# PATH는 손으로 쓴 6개 좌표, body.py 는 1 -> 2 -> 3 -> 6 -> 5 -> 4 고정 순서
+# 여기서는 조 좌표 설정 파일(TOML)과 planner.py 동작 비용(좌회전 5 s / 우회전 0.8 s 처럼 비대칭)으로
+# 조 사이 이동 시간 표 C[조, 도착 방향, 조, 도착 방향]을 만들고 전체 주행 시간이 최소인 순서를 찾음
+#   - 출발 조 빼고 12개 이하: Held-Karp (비트마스크 DP, 방향까지 포함한 정확한 해)
+#   - 그보다 많으면: 최근접 이웃 + 2-opt
+#
+#   PATH = path_from_config("groups.toml", Costs.from_constants(globals()), heading)
+#
+#   python3 route_opt.py groups.toml --mission 888.py
+#   python3 route_opt.py groups.toml --mission 999.py --return
+
+import argparse
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+
+from planner import Costs, bounds, reach
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 이하
+    import tomli as tomllib
+
+EXACT_MAX = 12  # 출발 조 뺀 조 수가 이 이하면 Held-Karp
+
+
+# =========================================================
+# 설정
+# =========================================================
+def load_config(path):
+    """groups.toml -> (이름 목록, 좌표 목록, 출발 조 번호, 복귀 여부, 비용 덮어쓰기)"""
+    with open(path, "rb") as f:
+        cfg = tomllib.load(f)
+    names = list(cfg["groups"])
+    points = [tuple(int(v) for v in cfg["groups"][n]) for n in names]
+    if len(set(points)) != len(points):
+        raise ValueError(f"{path}: 같은 칸에 조가 둘 이상")
+    start = names.index(cfg.get("start", names[0]))
+    return names, points, start, bool(cfg.get("return", False)), cfg.get("costs", {})
+
+
+# =========================================================
+# 이동 시간 표
+# =========================================================
+def cost_table(points, costs: Costs) -> np.ndarray:
+    """C[i, hi, j, hj] = 조 i에서 방향 hi로 출발해 조 j에 방향 hj로 멈추기까지 최소 시간"""
+    n = len(points)
+    box = bounds(points)
+    C = np.full((n, 4, n, 4), np.inf)
+    for i, (x, y) in enumerate(points):
+        for hi in range(4):
+            dist = reach(x, y, hi, box, costs)
+            for j, (xj, yj) in enumerate(points):
+                for hj in range(4):
+                    C[i, hi, j, hj] = dist.get((xj, yj, hj), np.inf)
+    return C
+
+
+def order_cost(C: np.ndarray, order, heading: int, ret: bool = False) -> float:
+    """정해진 순서에서 각 조 도착 방향까지 최적으로 골랐을 때 총 시간"""
+    d = np.full(4, np.inf)
+    d[heading] = 0.0
+    seq = list(order) + ([order[0]] if ret else [])
+    for i, j in zip(seq, seq[1:]):
+        d = (d[:, None] + C[i, :, j, :]).min(axis=0)
+    return float(d.min())
+
+
+# =========================================================
+# 풀이
+# =========================================================
+def held_karp(C: np.ndarray, start: int, heading: int, ret: bool = False):
+    """상태 = (방문한 조 집합, 마지막 조, 도착 방향)"""
+    n = C.shape[0]
+    rest = [k for k in range(n) if k != start]
+    m = len(rest)
+    if m == 0:
+        return [start], 0.0
+    Cr = C[np.ix_(rest, range(4), rest, range(4))]  # 나머지 조끼리
+    full = 1 << m
+    dp = np.full((full, m, 4), np.inf)
+    parent = np.full((full, m, 4, 2), -1, dtype=np.int16)
+    for j in range(m):
+        dp[1 << j, j] = C[start, heading, rest[j]]
+
+    for mask in range(1, full):
+        if mask & (mask - 1) == 0:
+            continue
+        for j in range(m):
+            if not mask >> j & 1:
+                continue
+            prev = mask ^ (1 << j)
+            # (이전 조, 이전 방향, 이번 방향)
+            cand = dp[prev][:, :, None] + Cr[:, :, j, :]
+            flat = cand.reshape(m * 4, 4)
+            best = flat.argmin(axis=0)
+            dp[mask, j] = flat[best, range(4)]
+            parent[mask, j, :, 0] = best // 4
+            parent[mask, j, :, 1] = best % 4
+
+    final = dp[full - 1].copy()
+    if ret:
+        final += C[rest, :, start, :].min(axis=2)
+    j, h = np.unravel_index(final.argmin(), final.shape)
+    sec = float(final[j, h])
+
+    order, mask = [], full - 1
+    while j >= 0:
+        order.append(rest[j])
+        pj, ph = parent[mask, j, h]
+        mask ^= 1 << j
+        j, h = int(pj), int(ph)
+    return [start] + order[::-1], sec
+
+
+def nearest_two_opt(C: np.ndarray, start: int, heading: int, ret: bool = False):
+    """최근접 이웃으로 시작 순서 -> 구간 뒤집기(2-opt)로 줄어드는 동안 반복"""
+    n = C.shape[0]
+    order, cur, h = [start], start, heading
+    left = set(range(n)) - {start}
+    while left:
+        j, hj = min(((j, hj) for j in left for hj in range(4)), key=lambda s: C[cur, h, s[0], s[1]])
+        order.append(j)
+        left.discard(j)
+        cur, h = j, hj
+
+    best = order_cost(C, order, heading, ret)
+    improved = True
+    while improved:
+        improved = False
+        for a in range(1, n - 1):
+            for b in range(a + 1, n):
+                cand = order[:a] + order[a:b + 1][::-1] + order[b + 1:]
+                sec = order_cost(C, cand, heading, ret)
+                if sec < best - 1e-9:
+                    order, best, improved = cand, sec, True
+    return order, best
+
+
+def optimize(points, costs: Costs, heading: int = 0, start: int = 0, ret: bool = False):
+    """-> (방문 순서 번호 목록, 총 주행 시간, 방법)"""
+    C = cost_table(points, costs)
+    if len(points) - 1 <= EXACT_MAX:
+        order, sec = held_karp(C, start, heading, ret)
+        method = "held-karp"
+    else:
+        order, sec = nearest_two_opt(C, start, heading, ret)
+        method = "nn+2opt"
+    if not np.isfinite(sec):
+        raise ValueError("갈 수 없는 조가 있음 (격자 / U턴 설정 확인)")
+    return order, sec, method
+
+
+def path_from_config(path, costs: Costs, heading: int = 0):
+    """미션 루프용 PATH (방문 순서대로 좌표, 복귀하면 출발 조를 끝에 한 번 더)"""
+    names, points, start, ret, override = load_config(path)
+    if override:
+        costs = Costs(**{**asdict(costs), **override})
+    order, sec, method = optimize(points, costs, heading, start, ret)
+    print(f"[ROUTE] {method}: {' -> '.join(names[k] for k in order)}{' -> ' + names[start] if ret else ''} "
+          f"({sec:.2f}s)")
+    return [points[k] for k in order] + ([points[start]] if ret else [])
+
+
+def main():
+    import sim_mission
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("config", help="조 좌표 TOML (예: groups.toml)")
+    ap.add_argument("--mission", default="888.py", help="비용 상수를 읽을 미션 스크립트")
+    ap.add_argument("--return", dest="ret", action="store_true", help="마지막에 출발 조로 복귀")
+    args = ap.parse_args()
+
+    mod = sim_mission.load_mission(Path(args.mission))
+    names, points, start, ret, override = load_config(args.config)
+    ret = ret or args.ret
+    costs = Costs(**{**asdict(Costs.from_constants(vars(mod))), **override})
+    C = cost_table(points, costs)
+
+    as_written = list(range(len(points)))
+    as_written.remove(start)
+    as_written = [start] + as_written
+    t0 = time.perf_counter()
+    order, sec, method = optimize(points, costs, mod.heading, start, ret)
+    solve_ms = (time.perf_counter() - t0) * 1000
+
+    print("===== VISIT ORDER =====")
+    print(f"groups: {len(points)}  return: {ret}  solver: {method} ({solve_ms:.0f} ms)")
+    print(f"config order : {' -> '.join(names[k] for k in as_written)}  "
+          f"{order_cost(C, as_written, mod.heading, ret):.2f}s")
+    print(f"optimized    : {' -> '.join(names[k] for k in order)}  {sec:.2f}s")
+    print(f"PATH = {[points[k] for k in order] + ([points[start]] if ret else [])}")
+    print("=======================")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# sim_mission.py
+# 미션 스크립트(888.py / 998.py / 999.py)의 main()을 가짜 PCA9685 + 가상 시계로 실행
+# 차 없이 노트북에서 6조 전체를 몇 ms 만에 돌리고, 채널 쓰기 기록으로 주행 타이밍 확인
+# 녹음은 RECORD_SEC 만큼 가상 시간만 흐르고, STT는 --text 문장을 --stt-latency 뒤에 돌려줌
+#
+#   python3 sim_mission.py 888.py
+#   python3 sim_mission.py 999.py --stt-latency 2.5 --text "hello everyone" --text "안녕하세요 여러분"
+#   python3 sim_mission.py 888.py --set FWD_SEC_1CELL=3.8 --set UTURN_SEC=7.5 --log writes.csv
+#   python3 sim_mission.py 998.py --volt 8.4 --drain 0.05 --set SUPPLY_MODE='"throttle"'   # 방전 중 전압 보정 주행 (power.py)
+#   python3 sim_mission.py mission.py --profile 999
+#   python3 sim_mission.py 888.py --set PIPELINE=True           # STT 파이프라인 켜고 (프로필 기본은 꺼짐)
+#   python3 sim_mission.py 888.py --trace trace.jsonl           # 단계별 시간 (mission_trace.py)
+
+import argparse
+import ast
+import csv
+import importlib.util
+import itertools
+import os
+import time
+from pathlib import Path
+
+import hal
+import mission_trace
+import power
+
+DEFAULT_TEXTS = [
+    "hello everyone today we present our robot navigation project",
+    "안녕하세요 저희 조는 로봇 경로 주행을 발표하겠습니다",
+]
+
+
+def load_mission(path: Path):
+    # 888.py 처럼 숫자로 시작하는 파일은 import 문으로 못 불러서 importlib 사용
+    spec = importlib.util.spec_from_file_location(f"mission_{path.stem}", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return getattr(mod, "mission", mod)  # 런처(888.py ...)는 프로필만 고르고 import mission
+
+
+def stub_audio(mod, texts, latency: float, record_sec: float = None):
+    """녹음 / STT / 로컬 판단을 가상 시간만 쓰는 대역으로 교체"""
+    counter = itertools.count()
+    rec = mod.RECORD_SEC if record_sec is None else record_sec
+
+    def record_audio(cap, on_chunk=None):
+        n = next(counter)
+        print(f"[REC] sim {rec}s")
+        hal.sleep(rec)
+        return n  # 오디오 대신 조 순번
+
+    def stt_transcribe(client, audio=None):
+        if audio is None:
+            return ""
+        hal.sleep(latency)
+        return texts[audio % len(texts)]
+
+    mod.make_client = lambda: None
+    mod.CAPTURE = "sim"
+    mod.STT_MODE = "batch"
+    mod.record_audio = record_audio
+    mod.stt_transcribe = stt_transcribe
+    mod.local_decision = lambda lid, audio: None
+
+
+def motor_segments(log, ch_a: int, ch_b: int):
+    """모터 한 개(채널 두 개)가 돌고 있던 구간 [(시작, 길이, 방향)]"""
+    duty = {ch_a: 0, ch_b: 0}
+    segs = []
+    start = direction = None
+    for t, ch, value in log:
+        if ch not in duty:
+            continue
+        duty[ch] = value
+        a, b = duty[ch_a], duty[ch_b]
+        moving = a != b
+        d = 1 if a > b else -1
+        if start is not None and (not moving or d != direction):
+            if t > start:  # 두 채널을 차례로 쓰는 사이의 순간 상태는 제외
+                segs.append((start, t - start, direction))
+            start = None
+        if moving and start is None:
+            start, direction = t, d
+    return segs
+
+
+def report(mod, board, virtual_sec: float, real_sec: float):
+    log = board.log
+    print("\n===== SIM REPORT =====")
+    print(f"virtual mission time: {virtual_sec:.2f}s (real {real_sec * 1000:.0f} ms, "
+          f"x{virtual_sec / max(real_sec, 1e-9):.0f})")
+    print(f"channel writes: {len(log)} (I2C transactions: {board.transactions})")
+    per_ch = {}
+    for _, ch, _ in log:
+        per_ch[ch] = per_ch.get(ch, 0) + 1
+    print("  " + ", ".join(f"ch{ch}={n}" for ch, n in sorted(per_ch.items())))
+
+    segs = motor_segments(log, mod.M1_IN1, mod.M1_IN2)
+    print(f"drive segments (motor 1): {len(segs)}, total {sum(s[1] for s in segs):.2f}s")
+    for t0, dur, d in segs:
+        print(f"  t={t0:7.2f}s  {'fwd' if d > 0 else 'rev'} {dur:.2f}s")
+    print("======================")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("mission", help="888.py / 998.py / 999.py / mission.py")
+    ap.add_argument("--profile", help="mission.py 로 돌릴 프로필 (profiles/<이름>.toml)")
+    ap.add_argument("--text", action="append", help="조별 STT 결과 (여러 번 주면 돌아가며 사용)")
+    ap.add_argument("--stt-latency", type=float, default=2.0, help="가상 STT 지연 (s)")
+    ap.add_argument("--record-sec", type=float, help="가상 녹음 길이 (기본 RECORD_SEC)")
+    ap.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                    help="미션 상수 덮어쓰기 (예: FWD_SEC_1CELL=3.8)")
+    ap.add_argument("--log", help="채널 쓰기 기록 CSV (t, ch, duty)")
+    ap.add_argument("--volt", type=float, help="가상 전원 시작 전압 (기본: 미션 V_REF)")
+    ap.add_argument("--drain", type=float, default=0.0, help="모터 켜진 1초당 전압 강하 (V)")
+    ap.add_argument("--trace", help="단계별 시간 JSONL에 이어 쓰기 (mission_trace.py report / chrome)")
+    args = ap.parse_args()
+
+    clock = hal.use_sim()
+    power.SIM_VOLT = args.volt
+    power.SIM_DRAIN = args.drain
+    mission_trace.TRACE_PATH = args.trace
+    if args.profile:
+        os.environ["PICAR_PROFILE"] = args.profile
+    mod = load_mission(Path(args.mission))
+    for kv in args.set:
+        name, value = kv.split("=", 1)
+        if not hasattr(mod, name):
+            raise SystemExit(f"{args.mission}에 {name} 없음")
+        setattr(mod, name, ast.literal_eval(value))
+    stub_audio(mod, args.text or DEFAULT_TEXTS, args.stt_latency, args.record_sec)
+
+    t0 = time.perf_counter()
+    mod.main()
+    real = time.perf_counter() - t0
+
+    board = hal.sim_boards[-1]
+    report(mod, board, clock.now(), real)
+    if args.log:
+        with open(args.log, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["t", "ch", "duty"])
+            w.writerows(board.log)
+        print(f"saved {args.log}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# speech_daemon.py
+# 음성인식 상주 프로세스 (Unix 소켓)
+# 조마다 python3 pi_english_proportion.py 를 새로 띄우면 인터프리터 시작, openai/sounddevice import,
+# 클라이언트 생성, USB 마이크 탐색을 매번 다시 함 -> 한 번 띄워두고 요청만 주고받음
+#
+# 서버 (stt_venv 안에서, 미션 시작 전에 한 번)
+#   source /home/pi/stt_venv/bin/activate && python3 /home/pi/stt/speech_daemon.py serve
+#   기본은 pi_english_proportion.py 와 같게 20초 다 녹음 + SAVE_DIR에 WAV / 텍스트 저장
+#   --vad : 말 끝나면 녹음 일찍 끝냄, --no-save : 저장 안 함
+# 클라이언트 (가상환경 필요 없음, 표준 라이브러리만 사용)
+#   from speech_daemon import classify
+#   res = classify(seconds=20)   # 데몬 없으면 None
+#
+# 프로토콜: 요청/응답 모두 JSON 한 줄
+#   {"cmd": "ping"}                                  -> {"ok": true, "uptime": ..}
+#   {"cmd": "classify", "seconds": 20}               -> {"ok": true, "text": .., "word_ratio": .., "char_ratio": ..,
+#                                                        "timing": {"record": .., "stt": .., "total": ..}}
+#   seconds 는 링 버퍼(RING_SEC)까지만 녹음 -> 잘랐으면 응답에 "warning" / 0 이하면 {"ok": false, "error": ..}
+
+import argparse
+import json
+import os
+import socket
+import time
+
+SOCKET_PATH = "/tmp/picar_speech.sock"
+SAVE_DIR = "/home/pi/recorded_voice"
+
+SAMPLE_RATE = 44100
+DURATION_SEC = 20
+RING_SEC = DURATION_SEC * 2  # 마이크 링 버퍼 (요청 한 번 최대 녹음 길이)
+STT_MODEL = "gpt-4o-transcribe"
+
+
+# =========================================================
+# 클라이언트
+# =========================================================
+def request(msg: dict, timeout: float = 120.0, path: str = SOCKET_PATH):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        s.connect(path)
+        s.sendall((json.dumps(msg) + "\n").encode("utf-8"))
+        f = s.makefile("r", encoding="utf-8")
+        return json.loads(f.readline())
+
+
+def classify(seconds: float = DURATION_SEC, timeout: float = 120.0):
+    """녹음 + STT + 영어 비율. 데몬이 안 떠 있으면 None (호출한 쪽에서 예전 방식으로)"""
+    try:
+        return request({"cmd": "classify", "seconds": seconds}, timeout)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+
+# =========================================================
+# 서버
+# =========================================================
+class SpeechService:
+    """미리 데워둔 OpenAI 클라이언트 + 열려 있는 마이크 스트림"""
+
+    def __init__(self, save: bool = True, vad: bool = False):
+        from openai import OpenAI
+
+        from audio_capture import RingCapture
+
+        self.started = time.monotonic()
+        self.client = OpenAI()
+        self.cap = RingCapture(SAMPLE_RATE, seconds=RING_SEC)
+        self.cap.start()
+        self.save = save
+        self.vad = vad
+
+    def classify(self, seconds: float) -> dict:
+        from datetime import datetime
+
+        from text_ratio import analyze
+        from upload_prep import prepare_upload
+        from vad import StreamingVad
+
+        t0 = time.perf_counter()
+        vad = StreamingVad(SAMPLE_RATE) if self.vad else None
+        seg = self.cap.record(seconds, progress=False, vad=vad)
+        t1 = time.perf_counter()
+        speech = vad.speech_detected if vad is not None else True
+
+        text = ""
+        if speech:
+            with prepare_upload(seg) as f:
+                res = self.client.audio.transcriptions.create(model=STT_MODEL, file=f)
+            text = (getattr(res, "text", "") or "").strip()
+        t2 = time.perf_counter()
+
+        if self.save:
+            os.makedirs(SAVE_DIR, exist_ok=True)
+            stem = os.path.join(SAVE_DIR, "record_" + datetime.now().strftime("%Y%m%d_%H%M%S"))
+            with open(stem + ".wav", "wb") as w:
+                w.write(seg.as_wav().getbuffer())
+            with open(stem + ".txt", "w", encoding="utf-8") as w:
+                w.write(text)
+
+        a = analyze(text)
+        return {
+            "ok": True,
+            "text": text,
+            "word_ratio": a.word_ratio,
+            "char_ratio": a.char_ratio,
+            "en_words": a.en_words,
+            "words": a.words,
+            "speech": speech,
+            "timing": {"record": t1 - t0, "stt": t2 - t1, "total": time.perf_counter() - t0},
+        }
+
+    def handle(self, msg: dict) -> dict:
+        cmd = msg.get("cmd")
+        if cmd == "ping":
+            return {"ok": True, "uptime": time.monotonic() - self.started}
+        if cmd == "classify":
+            seconds = float(msg.get("seconds", DURATION_SEC))
+            if not seconds > 0:
+                return {"ok": False, "error": f"seconds {seconds} must be > 0"}
+            if seconds > RING_SEC:
+                reply = self.classify(RING_SEC)
+                reply["warning"] = f"seconds {seconds:g} > ring {RING_SEC}s -> recorded {RING_SEC}s"
+                return reply
+            return self.classify(seconds)
+        return {"ok": False, "error": f"unknown cmd {cmd!r}"}
+
+
+def serve(path: str = SOCKET_PATH, save: bool = True, vad: bool = False):
+    t0 = time.perf_counter()
+    svc = SpeechService(save=save, vad=vad)
+    print(f"[SPEECH] warm in {time.perf_counter() - t0:.2f}s, listening on {path}")
+
+    if os.path.exists(path):
+        os.unlink(path)
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    srv.bind(path)
+    srv.listen(1)
+    try:
+        while True:
+            conn, _ = srv.accept()  # 마이크가 하나라서 요청은 한 번에 하나씩
+            with conn:
+                f = conn.makefile("rw", encoding="utf-8")
+                try:
+                    msg = json.loads(f.readline())
+                    t = time.perf_counter()
+                    reply = svc.handle(msg)
+                    print(f"[SPEECH] {msg.get('cmd')} -> {time.perf_counter() - t:.2f}s")
+                except Exception as e:
+                    reply = {"ok": False, "error": str(e)}
+                    print(f"[SPEECH ERR] {e}")
+                try:
+                    f.write(json.dumps(reply, ensure_ascii=False) + "\n")
+                    f.flush()
+                except OSError:
+                    pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.close()
+        svc.cap.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def print_result(res: dict):
+    """pi_english_proportion.py 와 같은 모양으로 출력"""
+    if not res.get("ok"):
+        print(f"[Warning] 음성인식 오류: {res.get('error')}")
+        return
+    if res.get("warning"):
+        print(f"[Warning] {res['warning']}")
+    print("\n===== 📝 변환된 텍스트 =====")
+    print(res["text"])
+    print("============================")
+    print("\n===== 🔍 영어 단어 비율 분석 =====")
+    print(f"영어 단어 수: {res['en_words']}")
+    print(f"전체 단어 수: {res['words']}")
+    print(f"영어 비율: {res['word_ratio'] * 100:.2f}%")
+    t = res["timing"]
+    print(f"(녹음 {t['record']:.1f}s, STT {t['stt']:.1f}s)")
+    print("================================")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("serve")
+    p.add_argument("--socket", default=SOCKET_PATH)
+    p.add_argument("--no-save", action="store_true", help="녹음 WAV + 텍스트를 SAVE_DIR에 저장 안 함")
+    p.add_argument("--vad", action="store_true", help="말이 끝나면 녹음 일찍 끝냄 (기본: seconds 다 녹음)")
+    sub.add_parser("ping")
+    p = sub.add_parser("classify")
+    p.add_argument("--seconds", type=float, default=DURATION_SEC)
+    args = ap.parse_args()
+
+    if args.cmd == "serve":
+        serve(args.socket, not args.no_save, args.vad)
+    elif args.cmd == "ping":
+        t0 = time.perf_counter()
+        print(request({"cmd": "ping"}), f"rtt={(time.perf_counter() - t0) * 1000:.1f} ms")
+    else:
+        res = classify(args.seconds)
+        if res is None:
+            raise SystemExit("speech daemon not running")
+        print_result(res)
+
+
+if __name__ == "__main__":
+    main()
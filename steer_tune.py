@@ -1,5 +1,6 @@
 import time
 from adafruit_motor import motor, servo
+from calib_store import fit, load_trials, log_trial
 from adafruit_pca9685 import PCA9685
 import busio
 from board import SCL, SDA
@@ -43,10 +44,18 @@ def forward_test(sec=1, speed=30):
 start_angle = 95
 end_angle = 115
 step = 2
+POWER = "battery"  # battery / charger
 
 for angle in range(start_angle, end_angle+1, step):
     steer.angle = angle
     print(f"Testing STEER_CENTER = {angle}")
     forward_test(2)
-    print("Check the path and adjust angle accordingly")
-    time.sleep(2)  # 로봇 이동 후 확인 시간
+    # 출발선 기준 옆으로 벗어난 거리 -> calib_store 에 기록 (쏠림 0 인 각도를 맞춰서 STEER_CENTER)
+    drift = input("옆으로 쏠린 거리 cm (+ 왼쪽 / - 오른쪽, 빈칸 = 건너뜀): ").strip()
+    if drift:
+        log_trial("center", speed=30, sec=2, steer=angle, drift_cm=float(drift), power=POWER,
+                  script="steer_tune")
+
+center = fit(load_trials(power=POWER)).center
+if center is not None:
+    print(f"fitted STEER_CENTER = {center:.1f}")
@@ -0,0 +1,156 @@
+# stt_cache.py
+# STT 결과 캐시 (같은 녹음을 리허설마다 다시 변환하지 않기)
+# 키 = sha256(모델 이름 + 정규화한 PCM): upload_prep.normalize 결과 (mono / 앞뒤 무음 제거 / 16 kHz int16)
+#   -> 같은 WAV, 같은 녹음의 Segment, 앞뒤 무음 길이만 다른 녹음은 같은 키. 모델이 다르면 다른 키
+# 항목 = 폴더 안 <키>.json 하나 (텍스트, 모델, 원래 STT 시간). 읽으면 mtime 갱신 -> 전체 크기가
+# MAX_BYTES 넘으면 mtime 오래된 것부터 삭제 (LRU)
+#
+#   norm = upload_prep.normalize(audio)
+#   key = stt_cache.key(norm, STT_MODEL)
+#   text = stt_cache.get(key)                 # None = 없음 -> 업로드
+#   stt_cache.put(key, text, STT_MODEL, sec)
+#   stt_cache.report()                        # 미션 끝 hit / miss
+#
+#   python3 stt_cache.py                      # 캐시 내용 / 크기
+#   python3 stt_cache.py --clear
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("PICAR_STT_CACHE", "/home/pi/stt_cache"))
+MAX_BYTES = 4 * 1024 * 1024
+
+
+def key(norm, model: str) -> str:
+    """norm = upload_prep.normalize() 결과 (pcm, 원본 샘플 수, 원본 samplerate)"""
+    h = hashlib.sha256(model.encode("utf-8") + b"\0")
+    h.update(norm[0].tobytes())
+    return h.hexdigest()
+
+
+class SttCache:
+    def __init__(self, folder=CACHE_DIR, max_bytes: int = MAX_BYTES):
+        self.folder = Path(folder)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.saved_sec = 0.0  # hit 으로 아낀 STT 시간 (저장할 때 잰 값)
+        self.disabled = False
+
+    def _path(self, k: str) -> Path:
+        return self.folder / f"{k}.json"
+
+    def get(self, k: str):
+        p = self._path(k)
+        try:
+            with open(p, encoding="utf-8") as f:
+                rec = json.load(f)
+            os.utime(p)  # LRU: 최근 사용
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.saved_sec += rec.get("stt_sec", 0.0)
+        return rec["text"]
+
+    def put(self, k: str, text: str, model: str, stt_sec: float = 0.0):
+        if self.disabled:
+            return
+        rec = {"text": text, "model": model, "stt_sec": round(stt_sec, 3),
+               "time": time.strftime("%Y-%m-%d %H:%M:%S")}
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(rec, f, ensure_ascii=False)
+            os.replace(tmp, self._path(k))
+        except OSError as e:
+            print(f"[CACHE] 저장 못 함 -> 이번 실행은 캐시 안 씀 ({e})")
+            self.disabled = True
+            return
+        self.evict()
+
+    def entries(self):
+        """-> [(mtime, 크기, 경로)] 오래된 것부터"""
+        out = []
+        for p in self.folder.glob("*.json"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            out.append((st.st_mtime, st.st_size, p))
+        return sorted(out)
+
+    def evict(self) -> int:
+        entries = self.entries()
+        total = sum(e[1] for e in entries)
+        removed = 0
+        for _, size, p in entries:
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def report(self):
+        n = self.hits + self.misses
+        if n == 0:
+            return
+        print(f"[CACHE] STT hit {self.hits} / miss {self.misses} ({self.hits / n * 100:.0f}%), "
+              f"saved {self.saved_sec:.1f}s of STT")
+
+
+# =========================================================
+# 기본 (미션 스크립트)
+# =========================================================
+_default = SttCache()
+
+
+def setup(folder=CACHE_DIR, max_bytes: int = MAX_BYTES) -> SttCache:
+    global _default
+    _default = SttCache(folder, max_bytes)
+    return _default
+
+
+def get(k: str):
+    return _default.get(k)
+
+
+def put(k: str, text: str, model: str, stt_sec: float = 0.0):
+    _default.put(k, text, model, stt_sec)
+
+
+def report():
+    _default.report()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dir", type=Path, default=CACHE_DIR)
+    ap.add_argument("--clear", action="store_true")
+    args = ap.parse_args()
+    cache = SttCache(args.dir)
+    entries = cache.entries()
+    if args.clear:
+        for _, _, p in entries:
+            p.unlink(missing_ok=True)
+        print(f"removed {len(entries)} entries from {args.dir}")
+        return
+    print(f"===== STT CACHE ({args.dir}) =====")
+    for mtime, size, p in entries[::-1]:
+        rec = json.loads(p.read_text(encoding="utf-8"))
+        print(f"{time.strftime('%m-%d %H:%M', time.localtime(mtime))} {p.stem[:12]} {rec['model']:24s} "
+              f"{rec.get('stt_sec', 0):5.2f}s {rec['text'][:40]!r}")
+    total = sum(e[1] for e in entries)
+    print(f"{len(entries)} entries, {total / 1024:.0f} / {MAX_BYTES / 1024:.0f} KB")
+    print("=" * 34)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+# stt_client.py
+# STT 클라이언트: 연결 재사용 + 미리 연결 (1조 STT가 DNS + TCP + TLS 까지 기다리지 않게)
+# OpenAI() 기본 httpx 풀은 5초 쉰 연결을 닫음 -> 조 사이 이동(10초 이상)마다 새로 TLS 연결
+#   - httpx.Client 하나(연결 풀, 쉬는 연결 KEEPALIVE_SEC 유지)를 OpenAI(http_client=...)에 넘김
+#   - 만들자마자 백그라운드로 GET /models (가벼운 요청) -> 하드웨어 시작 / 1조로 가는 동안 연결 준비
+#   - PING_SEC 동안 요청이 없으면 같은 요청 한 번 (서버가 쉬는 연결을 끊기 전에)
+#   - 요청마다 새 연결인지 재사용인지(httpcore trace) + 연결 / TLS 시간 -> report()
+#
+#   client = stt_client.SttClient()                 # 바로 연결 시작 (백그라운드)
+#   client.audio.transcriptions.create(model=STT_MODEL, file=f)
+#   client.report()
+#   client.close()                                  # 미션 끝: 연결 유지 스레드 / 연결 풀 정리
+#
+#   python3 stt_client.py --n 5 --gap 8             # 실제 API: 요청 사이 8초 쉬면서 새 연결 / 재사용
+#   python3 stt_client.py --base-url http://127.0.0.1:8771/v1 --no-warm
+
+import argparse
+import importlib
+import threading
+import time
+
+from mission_trace import percentile
+
+KEEPALIVE_SEC = 120.0  # 풀에서 쉬는 연결 유지 (httpx 기본 5초)
+PING_SEC = 20.0        # 이만큼 요청이 없으면 워밍업 요청으로 연결 유지
+MAX_CONNECTIONS = 4    # 파이프라인 STT + 워밍업이 겹쳐도 충분
+TIMEOUT_SEC = 30.0
+
+_CONNECT = "connection.connect_tcp.started"
+_CONNECT_DONE = "connection.connect_tcp.complete"
+_TLS = "connection.start_tls.started"
+_TLS_DONE = "connection.start_tls.complete"
+
+
+class ConnStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stt = []       # (응답 헤더까지 s, 새 연결?) STT 요청
+        self.warm = []      # 워밍업 요청
+        self.connect_sec = 0.0
+        self.tls_sec = 0.0
+        self.errors = 0
+
+    def add(self, warm: bool, sec: float, marks: dict):
+        new = _CONNECT in marks
+        with self.lock:
+            (self.warm if warm else self.stt).append((sec, new))
+            if _CONNECT_DONE in marks:
+                self.connect_sec += marks[_CONNECT_DONE] - marks[_CONNECT]
+            if _TLS_DONE in marks:
+                self.tls_sec += marks[_TLS_DONE] - marks[_TLS]
+
+    def add_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def report(self):
+        with self.lock:  # keepalive / 요청 스레드가 계속 추가 -> 복사본으로 출력
+            stt, warm = list(self.stt), list(self.warm)
+            connect_sec, tls_sec, errors = self.connect_sec, self.tls_sec, self.errors
+        reqs = stt + warm
+        if not reqs:
+            return
+        new = sum(1 for _, n in reqs if n)
+        print("\n===== STT CONNECTIONS =====")
+        print(f"requests {len(stt)} STT + {len(warm)} warm-up, new connections {new}, "
+              f"reused {len(reqs) - new} ({(len(reqs) - new) / len(reqs) * 100:.0f}%)")
+        print(f"connect {connect_sec * 1000:.0f} ms, TLS {tls_sec * 1000:.0f} ms total")
+        if stt:
+            first, first_new = stt[0]
+            rest = [s for s, _ in stt[1:]]
+            line = f"first STT {first:.2f}s ({'new connection' if first_new else 'reused'})"
+            if rest:
+                line += f", rest p50 {percentile(rest, 50):.2f}s"
+            print(line)
+        if errors:
+            print(f"warm-up errors {errors}")
+        print("===========================")
+
+
+def _httpx():
+    """openai 가 쓰는 httpx 모듈 (SDK 버전에 따라 httpx / httpx2). 다른 쪽 Client 를 넘기면 요청에서 TypeError"""
+    from openai import DefaultHttpxClient
+    return importlib.import_module(DefaultHttpxClient.__mro__[1].__module__.split(".")[0])
+
+
+class SttClient:
+    """OpenAI 클라이언트 + 연결 풀. audio.transcriptions.create 등은 OpenAI 그대로"""
+
+    def __init__(self, base_url: str = None, api_key: str = None, warm: bool = True,
+                 ping_sec: float = PING_SEC):
+        from openai import DefaultHttpxClient, OpenAI
+
+        httpx = _httpx()
+        self.stats = ConnStats()
+        self.ping_sec = ping_sec
+        self.last_used = time.perf_counter()
+        self.http = DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS,
+                                keepalive_expiry=KEEPALIVE_SEC),
+            timeout=TIMEOUT_SEC,
+            event_hooks={"request": [self._on_request], "response": [self._on_response]},
+        )
+        self.openai = OpenAI(base_url=base_url, api_key=api_key, http_client=self.http)
+        self.audio = self.openai.audio
+        self._stop = threading.Event()
+        self._thread = None
+        if warm:
+            self._thread = threading.Thread(target=self._keepalive, name="stt-keepalive", daemon=True)
+            self._thread.start()
+
+    def __getattr__(self, attr):
+        if attr == "openai":  # __init__ 에서 실패한 경우
+            raise AttributeError(attr)
+        return getattr(self.openai, attr)
+
+    # httpx event hook: 요청마다 httpcore trace 로 연결 단계 시각 기록
+    def _on_request(self, request):
+        marks = {}
+
+        def trace(event, info):
+            marks[event] = time.perf_counter()
+
+        trace.marks = marks
+        trace.t0 = time.perf_counter()
+        request.extensions["trace"] = trace
+
+    def _on_response(self, response):
+        trace = response.request.extensions.get("trace")
+        if trace is None or not hasattr(trace, "marks"):
+            return
+        now = time.perf_counter()
+        self.last_used = now
+        self.stats.add(response.request.extensions.get("warm", False), now - trace.t0, trace.marks)
+
+    def warm(self) -> bool:
+        """GET /models 한 번 (상태 코드 상관없이 연결만 열어두면 됨)"""
+        try:
+            r = self.http.get(self.openai.base_url.join("models"), headers=self.openai.auth_headers,
+                              extensions={"warm": True})
+            r.read()
+            return True
+        except Exception as e:
+            self.stats.add_error()
+            print(f"[STT] warm-up failed ({e})")
+            return False
+
+    def _keepalive(self):
+        self.warm()
+        while not self._stop.wait(self.ping_sec / 4):
+            if time.perf_counter() - self.last_used >= self.ping_sec:
+                self.warm()
+
+    def report(self):
+        self.stats.report()
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.http.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--base-url", help="기본 OPENAI_BASE_URL / api.openai.com")
+    ap.add_argument("--api-key", help="mock_stt_server.py 는 아무 값")
+    ap.add_argument("--n", type=int, default=5, help="요청 수 (GET /models)")
+    ap.add_argument("--gap", type=float, default=8.0, help="요청 사이 쉬는 시간 (s)")
+    ap.add_argument("--no-warm", action="store_true", help="미리 연결 / 연결 유지 끄기 (비교용)")
+    args = ap.parse_args()
+
+    client = SttClient(args.base_url, args.api_key, warm=not args.no_warm)
+    time.sleep(1.0)  # 하드웨어 시작 / 1조 녹음 대신
+    for i in range(args.n):
+        if i:
+            time.sleep(args.gap)
+        t0 = time.perf_counter()
+        client.http.get(client.openai.base_url.join("models"), headers=client.openai.auth_headers).read()
+        new = client.stats.stt[-1][1] if client.stats.stt else False
+        print(f"request {i + 1}: {(time.perf_counter() - t0) * 1000:7.1f} ms ({'new' if new else 'reused'})")
+    client.report()
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
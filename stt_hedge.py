@@ -0,0 +1,144 @@
+# stt_hedge.py
+# STT 지연 상한 (조마다 마감 시간 + 헤지 요청)
+# transcriptions.create 하나가 느리면(네트워크 / 서버) 차가 그만큼 조 앞에서 멈춤
+#   - 1차 요청(STT_MODEL)을 스레드에서 시작
+#   - 최근 성공한 STT 시간의 p90 (처음 MIN_SAMPLES번은 HEDGE_AFTER_SEC)이 지나도 안 오면
+#     2차 요청(STT_HEDGE_MODEL)을 하나 더. 1차가 에러로 끝나면 바로 2차
+#   - 먼저 온 결과 사용. 늦은 쪽은 결과만 버림 (블로킹 HTTP 호출은 밖에서 못 끊어서 스레드는 끝까지 돎)
+#     -> fn 이 읽는 녹음은 복사본, 캐시 저장은 이긴 쪽만 (mission.transcribe)
+#   - 마감까지 둘 다 안 오면 None -> 미션은 lang_id 추정으로 판단 (mission.deadline_ratio)
+#
+#   res = stt_hedge.run(lambda model: stt_upload(client, audio, model, norm),
+#                       STT_MODEL, STT_HEDGE_MODEL, STT_DEADLINE_SEC)
+#   res.text / res.source ("primary" / "hedge" / "deadline" / "error") / res.sec
+#   stt_hedge.report()
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from mission_trace import percentile
+
+HEDGE_AFTER_SEC = 3.0  # 기록이 모이기 전 헤지 시작 시간
+HEDGE_PCT = 90
+MIN_SAMPLES = 5
+WINDOW = 20            # 최근 STT 시간 몇 개로 p90
+
+
+@dataclass
+class HedgeResult:
+    text: str       # None = 마감 / 둘 다 에러
+    source: str     # "primary" / "hedge" / "deadline" / "error"
+    sec: float
+    hedged: bool
+
+
+class Hedger:
+    def __init__(self, hedge_after: float = HEDGE_AFTER_SEC, window: int = WINDOW):
+        self.hedge_after = hedge_after
+        self.samples = deque(maxlen=window)  # 성공한 요청 시간 (늦게 와서 버린 것도)
+        self.lock = threading.Lock()
+        self.results = []
+
+    def threshold(self) -> float:
+        with self.lock:
+            if len(self.samples) < MIN_SAMPLES:
+                return self.hedge_after
+            return percentile(self.samples, HEDGE_PCT)
+
+    def run(self, fn, model: str, hedge_model: str = None, deadline: float = None) -> HedgeResult:
+        """fn(model) -> 텍스트. deadline None = 마감 없음"""
+        t0 = time.perf_counter()
+        done = threading.Event()
+        state = {"win": None, "running": 0, "errors": []}
+
+        def call(source, m):
+            s0 = time.perf_counter()
+            try:
+                text, err = fn(m), None
+            except Exception as e:
+                text, err = None, e
+            with self.lock:
+                state["running"] -= 1
+                if err is None:
+                    self.samples.append(time.perf_counter() - s0)
+                    if state["win"] is None:
+                        state["win"] = (source, text)
+                        done.set()
+                else:
+                    state["errors"].append(err)
+                    if state["running"] == 0:
+                        done.set()
+
+        def start(source, m):
+            threading.Thread(target=call, args=(source, m), name=f"stt-{source}", daemon=True).start()
+
+        def left():
+            return None if deadline is None else max(0.0, deadline - (time.perf_counter() - t0))
+
+        hedged = False
+        state["running"] = 1
+        start("primary", model)
+        if hedge_model:
+            wait = self.threshold()
+            if deadline is not None:
+                wait = min(wait, deadline)
+            done.wait(wait)
+            with self.lock:  # 1차가 그 사이 끝났으면 헤지 안 함
+                hedged = state["win"] is None and left() != 0.0
+                if hedged:
+                    state["running"] += 1
+                    done.clear()
+            if hedged:
+                start("hedge", hedge_model)
+        done.wait(left())
+
+        with self.lock:
+            win = state["win"]
+            errors = list(state["errors"])
+        sec = time.perf_counter() - t0
+        if win is not None:
+            res = HedgeResult(win[1], win[0], sec, hedged)
+        elif errors and len(errors) == (2 if hedged else 1):
+            print(f"[STT ERR] {errors[-1]}")
+            res = HedgeResult(None, "error", sec, hedged)
+        else:
+            print(f"[STT] deadline {deadline:.1f}s missed")
+            res = HedgeResult(None, "deadline", sec, hedged)
+        self.results.append(res)
+        return res
+
+    def report(self):
+        if not self.results:
+            return
+        by = {}
+        for r in self.results:
+            by[r.source] = by.get(r.source, 0) + 1
+        secs = [r.sec for r in self.results]
+        print("\n===== STT HEDGE =====")
+        print(f"stops {len(self.results)}, hedged {sum(r.hedged for r in self.results)}, "
+              + ", ".join(f"{k} {v}" for k, v in sorted(by.items())))
+        print(f"latency p50 {percentile(secs, 50):.2f}s  p95 {percentile(secs, 95):.2f}s  max {max(secs):.2f}s")
+        print(f"hedge after {self.threshold():.2f}s (p{HEDGE_PCT} of last {len(self.samples)})")
+        print("=====================")
+
+
+# =========================================================
+# 기본 (미션 스크립트)
+# =========================================================
+_default = Hedger()
+
+
+def setup(hedge_after: float = HEDGE_AFTER_SEC, window: int = WINDOW) -> Hedger:
+    global _default
+    _default = Hedger(hedge_after, window)
+    return _default
+
+
+def run(fn, model: str, hedge_model: str = None, deadline: float = None) -> HedgeResult:
+    return _default.run(fn, model, hedge_model, deadline)
+
+
+def report():
+    _default.report()
@@ -0,0 +1,112 @@
+# stt_pipeline.py
+# 조 N 음성 변환(STT)을 워커 스레드에서 처리하고, 그동안 차는 조 N+1로 이동
+#
+# 사용 순서 (미션 main 루프):
+#   pipe = SttPipeline(lambda audio: stt_transcribe(client, audio))
+#   job = pipe.submit(idx, audio)        # 녹음 직후 바로 제출
+#   with pipe.driving(idx + 1): ...      # 다음 조로 이동 (겹치는 시간 측정)
+#   text = pipe.wait(job)                # 도착 후 결과 받아서 제스처 재생
+#   pipe.report()                        # 조별 겹침 시간 출력
+# 시각은 hal 시계 기준 (sim_mission.py에서는 가상 시계)
+
+import queue
+import threading
+from contextlib import contextmanager
+
+import hal
+
+
+class SttJob:
+    """조 하나의 STT 작업 (제출/시작/종료 시각 기록)"""
+
+    def __init__(self, idx, audio):
+        self.idx = idx
+        self.audio = audio
+        self.submitted = hal.now()
+        self.started = None
+        self.finished = None
+        self.text = ""
+        self.error = None
+        self.done = threading.Event()
+
+    @property
+    def busy_sec(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+class SttPipeline:
+    def __init__(self, transcribe, maxsize: int = 1):
+        # transcribe(audio) -> str, 워커 스레드에서 호출됨
+        self._transcribe = transcribe
+        self._queue = queue.Queue(maxsize=maxsize)  # 밀린 작업은 maxsize개까지만
+        self._thread = threading.Thread(target=self._worker, name="stt-pipeline", daemon=True)
+        self._thread.start()
+        self.jobs = []
+        self.drives = []  # (도착 조 idx, 시작, 종료)
+
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            job.started = hal.now()
+            try:
+                job.text = self._transcribe(job.audio)
+            except Exception as e:
+                job.error = e
+                job.text = ""
+            finally:
+                job.finished = hal.now()
+                job.done.set()
+                hal.clock.release()
+
+    def submit(self, idx, audio) -> SttJob:
+        job = SttJob(idx, audio)
+        self.jobs.append(job)
+        hal.clock.hold()  # 가상 시계: 워커가 이 작업을 끝낼 때까지 손님으로 셈
+        self._queue.put(job)  # 큐가 꽉 차면 앞 작업이 빠질 때까지 대기
+        return job
+
+    def wait(self, job: SttJob) -> str:
+        hal.wait(job.done)
+        if job.error is not None:
+            print(f"[STT ERR] group {job.idx + 1}: {job.error}")
+        return job.text
+
+    @contextmanager
+    def driving(self, idx):
+        t0 = hal.now()
+        try:
+            yield
+        finally:
+            self.drives.append((idx, t0, hal.now()))
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
+
+    # -----------------------------------------------------
+    # 겹침 리포트
+    # -----------------------------------------------------
+    def overlap_sec(self, job: SttJob) -> float:
+        """STT 처리 구간과 주행 구간이 겹친 시간"""
+        if job.started is None or job.finished is None:
+            return 0.0
+        total = 0.0
+        for _, d0, d1 in self.drives:
+            total += max(0.0, min(job.finished, d1) - max(job.started, d0))
+        return total
+
+    def report(self):
+        print("\n===== STT PIPELINE OVERLAP =====")
+        saved = 0.0
+        for job in self.jobs:
+            ov = self.overlap_sec(job)
+            saved += ov
+            pct = (ov / job.busy_sec * 100) if job.busy_sec > 0 else 0.0
+            print(f"group {job.idx + 1}: stt={job.busy_sec:.2f}s overlap={ov:.2f}s ({pct:.0f}%)")
+        print(f"total hidden STT time: {saved:.2f}s")
+        print("================================")
+        return saved
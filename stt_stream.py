@@ -0,0 +1,265 @@
+# stt_stream.py
+# 스트리밍 STT + 조기 판단
+# 녹음하면서 오디오 조각을 바로 보내고, 돌아오는 텍스트 조각마다 영어 비율을 갱신해서
+# 통계적으로 결론이 나면(신뢰구간이 기준선을 벗어나면) 녹음/대기를 끊고 바로 제스처로 넘어감
+#
+# 백엔드
+#   SocketStream : 로컬 대체 서버 (mock_stt_server.py) - 오디오를 녹음 중에 조각 단위로 전송
+#   OpenAIStream : OpenAI transcriptions stream=True - 업로드는 녹음 후 한 번, 응답 텍스트를 조각으로 받음
+#
+# 소켓 프로토콜 (길이 4바이트 big-endian + 내용)
+#   client -> server : 첫 프레임 JSON 헤더 {"samplerate":.., "model":..}, 이후 int16 PCM, 길이 0 = 끝
+#   server -> client : 한 줄에 JSON 하나 {"type": "delta", "text": ..} / {"type": "done", "text": ..}
+
+import json
+import math
+import queue
+import socket
+import struct
+import threading
+import time
+
+from text_ratio import RatioAnalyzer
+
+Z_DECIDE = 2.58        # 99% 신뢰구간
+DESIGN_EFFECT = 4.0    # 글자들은 단어 단위로 묶여 있어서 독립 표본 수를 이만큼 나눠서 봄
+MIN_CHARS = 20
+
+
+# =========================================================
+# 조기 판단
+# =========================================================
+def wilson_interval(k: float, n: float, z: float = Z_DECIDE):
+    if n <= 0:
+        return 0.0, 1.0
+    p = k / n
+    d = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / d
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / d
+    return center - half, center + half
+
+
+class EarlyDecider:
+    def __init__(self, threshold: float, z: float = Z_DECIDE, min_chars: int = MIN_CHARS):
+        self.threshold = threshold
+        self.z = z
+        self.min_chars = min_chars
+        self.ratio = RatioAnalyzer()
+        self.text = ""
+        self.decision = None   # True = 영어, False = 한국어, None = 아직
+        self.decided_at = None  # 판단 시점 (monotonic)
+
+    def feed(self, delta: str):
+        self.text += delta
+        self.ratio.feed(delta)
+        if self.decision is None:
+            en, ko = self.ratio.en_chars, self.ratio.ko_chars
+            if en + ko >= self.min_chars:
+                n = (en + ko) / DESIGN_EFFECT
+                lo, hi = wilson_interval(en / DESIGN_EFFECT, n, self.z)
+                if lo >= self.threshold:
+                    self.decision = True
+                elif hi < self.threshold:
+                    self.decision = False
+                if self.decision is not None:
+                    self.decided_at = time.monotonic()
+                    print(f"[STREAM] early decision english={self.decision} "
+                          f"ratio={self.ratio.char_ratio * 100:.1f}% CI=({lo:.2f}, {hi:.2f})")
+        return self.decision
+
+    def final_decision(self) -> bool:
+        if self.decision is None:
+            return self.ratio.char_ratio >= self.threshold
+        return self.decision
+
+
+# =========================================================
+# 소켓 프레임
+# =========================================================
+def send_frame(sock, payload: bytes):
+    sock.sendall(struct.pack(">I", len(payload)) + payload)
+
+
+def recv_exact(sock, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        part = sock.recv(n - len(buf))
+        if not part:
+            raise ConnectionError("socket closed")
+        buf += part
+    return bytes(buf)
+
+
+def recv_frame(sock) -> bytes:
+    (n,) = struct.unpack(">I", recv_exact(sock, 4))
+    return recv_exact(sock, n) if n else b""
+
+
+# =========================================================
+# 백엔드
+# =========================================================
+class SocketStream:
+    """로컬 대체 서버로 녹음 중 오디오 조각 전송, 텍스트 조각은 별도 스레드에서 수신"""
+
+    def __init__(self, host: str, port: int, samplerate: int, model: str = "mock"):
+        self.sock = socket.create_connection((host, port), timeout=10)
+        self.sock.settimeout(None)  # 녹음 중 텍스트가 한동안 안 와도 끊지 않음
+        send_frame(self.sock, json.dumps({"samplerate": samplerate, "model": model}).encode())
+        self.events = queue.Queue()
+        self.broken = False  # 보내다 끊기면 더 안 보냄 (녹음은 계속)
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def _read(self):
+        try:
+            f = self.sock.makefile("r", encoding="utf-8")
+            for line in f:
+                ev = json.loads(line)
+                self.events.put(ev)
+                if ev.get("type") == "done":
+                    break
+        except (OSError, ValueError) as e:
+            self.events.put({"type": "error", "error": str(e)})
+        finally:
+            self.events.put(None)
+
+    def _send(self, payload: bytes):
+        if self.broken:
+            return
+        try:
+            send_frame(self.sock, payload)
+        except OSError as e:
+            self.broken = True
+            self.events.put({"type": "error", "error": str(e)})
+            self.events.put(None)
+
+    def send_audio(self, pcm):
+        self._send(pcm.tobytes())
+
+    def finish(self, audio=None):
+        self._send(b"")
+
+    def close(self):
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class OpenAIStream:
+    """OpenAI stream=True. 오디오는 녹음 끝나고 한 번에 올라가고, 텍스트가 조각으로 옴"""
+
+    def __init__(self, client, model: str, upload_format: str = "flac"):
+        self.client = client
+        self.model = model
+        self.upload_format = upload_format  # None = 원본 WAV 그대로 (배치 STT와 같은 규칙)
+        self.events = queue.Queue()
+        self._stream = None
+
+    def send_audio(self, pcm):
+        pass  # 녹음 구간 자체를 finish()에서 업로드
+
+    def finish(self, audio=None):
+        from audio_capture import open_for_upload
+        from upload_prep import prepare_upload
+
+        if audio is None:  # VAD: 말소리 없음 -> 업로드 생략
+            self.events.put(None)
+            return
+
+        def run():
+            try:
+                f = prepare_upload(audio, self.upload_format) if self.upload_format else open_for_upload(audio)
+                with f:
+                    self._stream = self.client.audio.transcriptions.create(
+                        model=self.model, file=f, stream=True)
+                    for ev in self._stream:
+                        if ev.type == "transcript.text.delta":
+                            self.events.put({"type": "delta", "text": ev.delta})
+                        elif ev.type == "transcript.text.done":
+                            self.events.put({"type": "done", "text": ev.text})
+            except Exception as e:
+                self.events.put({"type": "error", "error": str(e)})
+            finally:
+                self.events.put(None)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def close(self):
+        if self._stream is not None:
+            try:
+                self._stream.close()  # 조기 판단 후 남은 응답은 버림
+            except Exception:
+                pass
+
+
+# =========================================================
+# 한 조(stop)의 스트리밍 세션
+# =========================================================
+class StreamSession:
+    def __init__(self, backend, threshold: float):
+        self.backend = backend
+        self.decider = EarlyDecider(threshold)
+        self.t0 = time.monotonic()
+        self.ended = False
+        self.error = None
+
+    def _drain(self, block: bool, timeout: float = None) -> bool:
+        """도착한 이벤트 처리. 스트림이 끝났으면 True"""
+        while True:
+            try:
+                ev = self.backend.events.get(block=block, timeout=timeout)
+            except queue.Empty:
+                return False
+            if ev is None:
+                self.ended = True
+                return True
+            if ev["type"] == "delta":
+                self.decider.feed(ev["text"])
+            elif ev["type"] == "done":
+                # done 텍스트가 delta 합과 다르면 done 기준으로 다시 계산
+                if ev["text"] and ev["text"] != self.decider.text:
+                    self.decider = EarlyDecider(self.decider.threshold)
+                    self.decider.feed(ev["text"])
+            elif ev["type"] == "error":
+                self.error = ev["error"]
+                print(f"[STREAM ERR] {ev['error']}")
+            if self.decider.decision is not None:
+                return False
+
+    def on_chunk(self, pcm) -> bool:
+        """녹음 콜백: 오디오 전송 + 도착한 텍스트 반영. True면 녹음 종료"""
+        self.backend.send_audio(pcm)
+        self._drain(block=False)
+        return self.decider.decision is not None
+
+    def finish(self, audio=None, timeout: float = 30.0) -> bool:
+        if self.decider.decision is None:
+            try:
+                self.backend.finish(audio)
+            except Exception as e:
+                self.error = str(e)
+                print(f"[STREAM ERR] {e}")
+            deadline = time.monotonic() + timeout
+            while self.error is None and self.decider.decision is None and not self.ended:
+                left = deadline - time.monotonic()
+                if left <= 0 or self._drain(block=True, timeout=left):
+                    break
+        self.backend.close()
+        english = self.decider.final_decision()
+        early = "early" if self.decider.decided_at is not None else "full"
+        print(f"[STREAM] decision english={english} ({early}, {time.monotonic() - self.t0:.2f}s)")
+        return english
+
+    @property
+    def failed(self) -> bool:
+        """에러로 끝나서 판단 못 함 -> 미션은 같은 녹음으로 배치 STT"""
+        return self.error is not None and self.decider.decision is None
+
+    @property
+    def text(self) -> str:
+        return self.decider.text
+
+    @property
+    def ratio(self) -> float:
+        return self.decider.ratio.char_ratio
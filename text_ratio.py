@@ -0,0 +1,170 @@
+# text_ratio.py
+# STT 텍스트의 영어 비율 분석기 (글자 기준 + 단어 기준을 한 번에)
+#   - 글자 기준: count_lang / english_ratio (888.py, 999.py ...)
+#   - 단어 기준: analyze_english_ratio (pi_english_proportion.py, 12133.py), english_words = 영어 단어 목록
+# str.translate 표 한 번으로 글자를 분류하고 나머지는 C 레벨 count/split만 사용.
+# 스트리밍 STT에서 조각(chunk) 단위로 feed() 가능 (조각 경계에 걸친 단어도 한 단어로 셈)
+#
+#   python3 text_ratio.py --bench   # 기존 정규식 함수와 속도 비교
+
+import re
+import time
+
+# 글자 분류 기호
+LATIN = "a"    # A-Z a-z
+HANGUL = "k"   # 가-힣 (U+AC00 ~ U+D7A3)
+DIGIT = "d"    # 0-9
+OTHER = "o"    # 그 밖의 문자(한자, 키릴 등) - 단어 구분자로 취급
+SEP = " "      # 공백, 문장부호 등
+
+
+class _ClassTable(dict):
+    """str.translate용 표. 처음 보는 문자는 isalpha()로 분류해서 캐시"""
+
+    def __missing__(self, cp):
+        v = OTHER if chr(cp).isalpha() else SEP
+        self[cp] = v
+        return v
+
+
+def _build_table() -> _ClassTable:
+    t = _ClassTable()
+    for cp in range(128):
+        ch = chr(cp)
+        if ch.isascii() and ch.isalpha():
+            t[cp] = LATIN
+        elif ch.isdigit():
+            t[cp] = DIGIT
+        else:
+            t[cp] = SEP
+    for cp in range(0xAC00, 0xD7A4):
+        t[cp] = HANGUL
+    return t
+
+
+_TABLE = _build_table()
+_WORD = (LATIN, HANGUL, DIGIT)
+
+
+class RatioAnalyzer:
+    def __init__(self):
+        self.en_chars = 0
+        self.ko_chars = 0
+        self.digits = 0
+        self.other_chars = 0
+        self.en_words = 0
+        self.words = 0
+        self._tail = SEP  # 직전 조각 마지막 글자 분류
+
+    def feed(self, chunk: str) -> "RatioAnalyzer":
+        if not chunk:
+            return self
+        c = chunk.translate(_TABLE)
+        self.en_chars += c.count(LATIN)
+        self.ko_chars += c.count(HANGUL)
+        self.digits += c.count(DIGIT)
+        n_other = c.count(OTHER)
+        self.other_chars += n_other
+
+        words = c.replace(OTHER, SEP) if n_other else c
+        self.words += len(words.split())
+        # 영문 연속 구간 수 (= 기존 [A-Za-z]+ 매치 수)
+        self.en_words += len(words.replace(HANGUL, SEP).replace(DIGIT, SEP).split())
+
+        # 조각 경계에 걸친 단어 / 영문 구간은 한 번만 셈
+        if self._tail in _WORD and c[0] in _WORD:
+            self.words -= 1
+            if self._tail == LATIN and c[0] == LATIN:
+                self.en_words -= 1
+        self._tail = c[-1]
+        return self
+
+    @property
+    def char_ratio(self) -> float:
+        """영어 글자 / (영어 + 한글 글자), 0~1"""
+        denom = self.en_chars + self.ko_chars
+        return self.en_chars / denom if denom else 0.0
+
+    @property
+    def word_ratio(self) -> float:
+        """영어 단어 / 전체 단어, 0~1"""
+        return self.en_words / self.words if self.words else 0.0
+
+
+def analyze(text: str) -> RatioAnalyzer:
+    return RatioAnalyzer().feed(text)
+
+
+def english_words(text: str) -> list:
+    """영문 연속 구간 목록 (= 기존 re.findall(r"[A-Za-z]+")). 분류 문자열은 원문과 글자 위치가 같음"""
+    c = text.translate(_TABLE)
+    return "".join(ch if k == LATIN else SEP for ch, k in zip(text, c)).split()
+
+
+def count_lang(text: str):
+    a = analyze(text)
+    return a.en_chars, a.ko_chars
+
+
+def english_ratio(text: str) -> float:
+    return analyze(text).char_ratio
+
+
+# =========================================================
+# 벤치마크 (기존 구현과 결과 / 속도 비교)
+# =========================================================
+def _legacy_count_lang(text):
+    en = len(re.findall(r"[A-Za-z]", text))
+    ko = len(re.findall(r"[가-힣]", text))
+    return en, ko
+
+
+def _legacy_word_counts(text):
+    english_words = re.findall(r"[A-Za-z]+", text)
+    all_words = re.findall(r"[A-Za-z0-9가-힣]+", text)
+    return len(english_words), len(all_words)
+
+
+def _bench(fn, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def bench(size_kb: int = 512, repeat: int = 5):
+    sample = ("오늘 발표 주제는 robot navigation 입니다. We use a PCA9685 at 50Hz, "
+              "그리고 STT는 gpt-4o-mini-transcribe 모델! 東京 Привет 123개 ... ")
+    text = sample * (size_kb * 1024 // len(sample.encode()) + 1)
+
+    a = analyze(text)
+    assert (a.en_chars, a.ko_chars) == _legacy_count_lang(text)
+    assert (a.en_words, a.words) == _legacy_word_counts(text)
+    assert english_words(sample) == re.findall(r"[A-Za-z]+", sample)
+
+    # 스트리밍: 아무 데서나 잘라서 넣어도 결과 동일해야 함
+    s = RatioAnalyzer()
+    for i in range(0, len(text), 37):
+        s.feed(text[i:i + 37])
+    assert (s.en_chars, s.ko_chars, s.en_words, s.words) == (a.en_chars, a.ko_chars, a.en_words, a.words)
+
+    legacy = _bench(lambda t: (_legacy_count_lang(t), _legacy_word_counts(t)), text, repeat)
+    new = _bench(analyze, text, repeat)
+    print(f"text: {len(text):,} chars")
+    print(f"legacy regex (4 findall): {legacy:8.2f} ms")
+    print(f"RatioAnalyzer (1 pass):   {new:8.2f} ms  ({legacy / new:.1f}x)")
+    print(f"char ratio={a.char_ratio:.3f} word ratio={a.word_ratio:.3f} "
+          f"digits={a.digits} other={a.other_chars}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--bench" in sys.argv:
+        bench()
+    else:
+        a = analyze(sys.stdin.read())
+        print(f"english chars={a.en_chars} korean chars={a.ko_chars} "
+              f"char ratio={a.char_ratio * 100:.1f}% word ratio={a.word_ratio * 100:.1f}%")
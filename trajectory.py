@@ -0,0 +1,196 @@
+# trajectory.py
+# 여러 관절 서보 궤적 (NumPy)
+# 기존 방식: 2도씩 30 ms마다 range로 올리고 min()으로 자름 -> 관절마다 도착 시각이 다르고
+#            PCA9685 펄스 폭(12비트)이 그대로인 쓰기도 매번 보냄
+# 여기서는 모든 관절이 같은 시간에 출발 / 도착하는 프로파일(최소 저크 또는 사다리꼴)을
+# (시각, 관절별 각도) 배열로 미리 계산하고, 관절별로 양자화한 펄스 값이 바뀐 것만 보냄
+#
+#   traj = plan((ARM1_HOME, ARM2_HOME), (ARM1_EXTEND, ARM2_EXTEND), duration=1.6)
+#   steps = to_steps((arm1, arm2), traj)   # motion.submit / choreo.play 에 넣을 단계 목록
+#
+#   python3 trajectory.py --bench   # 기존 2도/30 ms 스윕과 쓰기 수 / 동작 시간 비교 (sim)
+
+import argparse
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+import motion
+
+UPDATE_HZ = 33.3      # 갱신 주기 = 기존 30 ms (PCA9685 PWM 50 Hz보다 자주 써도 다음 주기에만 반영됨)
+VMAX_DEG_S = 120.0    # duration 안 주면 이 속도 / 가속도 한도로 시간 계산
+AMAX_DEG_S2 = 400.0
+ACCEL_FRAC = 0.25     # 사다리꼴: 전체 시간 중 가속 구간 비율 (감속도 같음)
+
+# 미션 스크립트 make_servo() 와 같은 서보 설정
+MIN_PULSE = 500
+MAX_PULSE = 2500
+PWM_FREQ = 50
+ACTUATION_RANGE = 180
+
+
+@dataclass
+class Trajectory:
+    t: np.ndarray       # (n,) 시작 기준 초
+    angles: np.ndarray  # (n, 관절 수)
+
+    @property
+    def duration(self) -> float:
+        return float(self.t[-1])
+
+
+# =========================================================
+# 프로파일 (s = 0~1 시간 -> 0~1 위치)
+# =========================================================
+def min_jerk(s: np.ndarray) -> np.ndarray:
+    return s * s * s * (10 - 15 * s + 6 * s * s)
+
+
+def trapezoid(s: np.ndarray, accel_frac: float = ACCEL_FRAC) -> np.ndarray:
+    a = accel_frac
+    v = 1.0 / (1.0 - a)  # 등속 구간 속도 (전체 이동 = 1)
+    return np.where(
+        s < a, 0.5 * v / a * s * s,
+        np.where(s <= 1 - a, v * (s - a / 2), 1 - 0.5 * v / a * (1 - s) ** 2))
+
+
+PROFILES = {"min_jerk": min_jerk, "trapezoid": trapezoid}
+
+
+def min_duration(distance: float, profile: str = "min_jerk",
+                 vmax: float = VMAX_DEG_S, amax: float = AMAX_DEG_S2) -> float:
+    """가장 많이 움직이는 관절이 속도 / 가속도 한도를 넘지 않는 최소 시간"""
+    if distance <= 0:
+        return 0.0
+    if profile == "min_jerk":
+        # 최대 속도 1.875 D/T, 최대 가속도 5.774 D/T^2
+        return max(1.875 * distance / vmax, math.sqrt(5.774 * distance / amax))
+    v = 1.0 / (1.0 - ACCEL_FRAC)
+    return max(v * distance / vmax, math.sqrt(v / ACCEL_FRAC * distance / amax))
+
+
+def plan(start, end, duration: float = None, profile: str = "min_jerk",
+         rate: float = UPDATE_HZ) -> Trajectory:
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    if duration is None:
+        duration = min_duration(float(np.abs(end - start).max()), profile)
+    n = max(2, int(math.ceil(duration * rate)) + 1)
+    t = np.linspace(0.0, duration, n)
+    s = PROFILES[profile](t / duration) if duration > 0 else np.ones(n)
+    return Trajectory(t, start + s[:, None] * (end - start))
+
+
+def sweep(start, end, step: int = 2, delay: float = 0.03) -> Trajectory:
+    """기존 방식 (2도씩, min()으로 자름) - 벤치마크 비교용"""
+    start = np.asarray(start)
+    end = np.asarray(end)
+    n = int(np.abs(end - start).max())
+    i = np.arange(0, n + 1, step)
+    sign = np.sign(end - start)
+    angles = start + sign * np.minimum(i[:, None], np.abs(end - start))
+    return Trajectory(np.arange(len(i)) * delay, angles.astype(np.float64))
+
+
+# =========================================================
+# 양자화 / 단계 변환
+# =========================================================
+def pulse_counts(angles: np.ndarray) -> np.ndarray:
+    """각도 -> PCA9685 12비트 OFF 카운트 (adafruit Servo + PCA9685와 같은 정수 계산)
+    Servo는 보드가 실제로 내는 주파수(PRESCALE에서 계산, 50 Hz 설정이면 50.03 Hz)로 duty를 계산함"""
+    prescale = int(25000000 / 4096 / PWM_FREQ + 0.5) - 1
+    freq = 25000000 / 4096 / (prescale + 1)
+    min_duty = int(MIN_PULSE * freq / 1000000 * 0xFFFF)
+    max_duty = int(MAX_PULSE * freq / 1000000 * 0xFFFF)
+    duty = min_duty + (angles / ACTUATION_RANGE * (max_duty - min_duty)).astype(np.int64)
+    return duty >> 4
+
+
+def changed_mask(traj: Trajectory) -> np.ndarray:
+    """(n, 관절) 직전 보낸 값과 카운트가 다르면 True (첫 줄은 항상 보냄)"""
+    c = pulse_counts(traj.angles)
+    mask = np.ones_like(c, dtype=bool)
+    mask[1:] = c[1:] != c[:-1]
+    return mask
+
+
+def to_steps(servos, traj: Trajectory, t0: float = 0.0):
+    """바뀐 관절만 쓰는 motion 단계 목록 (바뀐 게 없는 시각은 단계 자체를 안 만듦)"""
+    mask = changed_mask(traj)
+    steps = []
+    for k in np.flatnonzero(mask.any(axis=1)):
+        js = np.flatnonzero(mask[k])
+        steps += motion.pose_steps([servos[j] for j in js],
+                                   [(float(traj.t[k]), tuple(float(a) for a in traj.angles[k, js]))], t0)
+    return steps
+
+
+def play(servos, traj: Trajectory, name: str = "trajectory") -> motion.MotionFuture:
+    return motion.submit(to_steps(servos, traj), name)
+
+
+# =========================================================
+# 벤치마크
+# =========================================================
+def arrival(traj: Trajectory, tol: float = 0.5) -> np.ndarray:
+    """관절별로 목표 ±tol도 안에 처음 들어온 시각"""
+    err = np.abs(traj.angles - traj.angles[-1])
+    return traj.t[np.argmax(err <= tol, axis=0)]
+
+
+def _run_sim(traj: Trajectory, legacy: bool = False):
+    """가상 PCA9685에서 재생 -> (I2C 트랜잭션, 채널 쓰기)
+    legacy = 기존 코드처럼 매 단계 두 관절 모두, 채널마다 따로 쓰기"""
+    import hal
+    from pwm_batch import BatchedPCA9685
+
+    hal.use_sim()
+    pca = hal.pca9685(None, hal.SIM_ADDRESS)
+    pca.frequency = PWM_FREQ
+    board = pca if legacy else BatchedPCA9685(pca)
+    joints = [hal.servo.Servo(board.channels[ch], min_pulse=MIN_PULSE, max_pulse=MAX_PULSE) for ch in (9, 8)]
+    if legacy:
+        steps = motion.pose_steps(joints, [(float(t), tuple(a)) for t, a in zip(traj.t, traj.angles)])
+    else:
+        steps = to_steps(joints, traj)
+    motion.submit(steps, "bench").wait()
+    if not legacy:
+        board.deinit()
+    return pca.transactions, len(pca.log)
+
+
+def bench():
+    # 888.py arm_grip_action 팔 뻗기 (ARM1 40->145, ARM2 90->180)
+    start, end = (40, 90), (145, 180)
+    legacy = sweep(start, end)
+    T = legacy.duration
+    cases = [
+        ("legacy 2deg/30ms", legacy),
+        (f"min_jerk T={T:.2f}s", plan(start, end, T, "min_jerk")),
+        (f"trapezoid T={T:.2f}s", plan(start, end, T, "trapezoid")),
+        (f"min_jerk T={T:.2f}s 50Hz", plan(start, end, T, "min_jerk", rate=50)),
+        ("min_jerk (limits)", plan(start, end, None, "min_jerk")),
+    ]
+    print("===== ARM TRAJECTORY BENCH (sim, arm extend) =====")
+    print(f"{'profile':24s} {'time':>6s} {'tx':>5s} {'writes':>6s} {'redundant':>9s} "
+          f"{'arrive j1/j2':>14s} {'vmax j1':>8s}")
+    for name, traj in cases:
+        tx, writes = _run_sim(traj, legacy=traj is legacy)
+        a1, a2 = arrival(traj)
+        v = np.abs(np.diff(traj.angles[:, 0]) / np.diff(traj.t)).max()
+        redundant = int((~changed_mask(traj)).sum()) if traj is legacy else 0
+        print(f"{name:24s} {traj.duration:5.2f}s {tx:5d} {writes:6d} {redundant:9d} "
+              f"{a1:6.2f}/{a2:5.2f}s {v:6.0f}°/s")
+    print("=" * 50)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--bench", action="store_true")
+    ap.parse_args()
+    bench()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# upload_prep.py
+# STT 업로드 전 처리: 16 kHz 리샘플(폴리페이즈 FIR) -> 앞뒤 무음 제거 -> FLAC/Opus 인코딩 (전부 메모리)
+# 44.1 kHz 20초 WAV(~1.7MB)를 수백 KB 이하로 줄여서 Wi-Fi 업로드 시간 단축
+
+import io
+import time
+import wave
+from functools import lru_cache
+from math import gcd
+from pathlib import Path
+
+import numpy as np
+
+from vad import StreamingVad
+
+TARGET_SR = 16000
+TAPS_PER_PHASE = 32    # 위상당 필터 길이 (32: 10 kHz 이상 -34 dB 이하)
+KAISER_BETA = 8.0
+BLOCK = 8192           # 한 번에 계산할 출력 샘플 수 (Pi 메모리 고려)
+
+FORMATS = {
+    # fmt: (soundfile format, subtype, 확장자)
+    "flac": ("FLAC", "PCM_16", "flac"),
+    "ogg":  ("OGG", "OPUS", "ogg"),
+    "wav":  (None, None, "wav"),
+}
+
+
+@lru_cache(maxsize=4)
+def polyphase_filter(up: int, down: int, taps: int = TAPS_PER_PHASE, beta: float = KAISER_BETA):
+    """
+    저역통과 프로토타입(kaiser-windowed sinc)을 up개 위상으로 나눈 (up, taps) 행렬.
+    H[p, k] = h[p + up*k]
+    """
+    n = taps * up
+    fc = 0.5 / max(up, down) * 0.95  # 업샘플된 속도 기준 차단 주파수
+    t = np.arange(n) - (n - 1) / 2
+    h = 2 * fc * np.sinc(2 * fc * t) * np.kaiser(n, beta)
+    h *= up / h.sum()  # 업샘플 0 삽입만큼 이득 보정
+    return h.reshape(taps, up).T.astype(np.float32).copy(), n // 2
+
+
+def resample(x: np.ndarray, sr_in: int, sr_out: int = TARGET_SR, taps: int = TAPS_PER_PHASE) -> np.ndarray:
+    """int16 mono 리샘플 (유리수 비율 up/down 폴리페이즈, 출력 블록 단위 벡터 연산)"""
+    if sr_in == sr_out:
+        return x
+    g = gcd(sr_in, sr_out)
+    up, down = sr_out // g, sr_in // g
+    H, delay = polyphase_filter(up, down, taps)
+
+    n_out = (len(x) * up) // down
+    # 앞쪽 taps, 뒤쪽 taps 만큼 0 패딩 -> 인덱스 범위 검사 불필요
+    xp = np.concatenate((np.zeros(taps, np.float32), x.astype(np.float32), np.zeros(taps + 1, np.float32)))
+    k = np.arange(taps)
+    y = np.empty(n_out, np.float32)
+    for b0 in range(0, n_out, BLOCK):
+        m = np.arange(b0, min(b0 + BLOCK, n_out))
+        t = m * down + delay            # 업샘플 축 위치 (필터 지연 보정)
+        base, phase = np.divmod(t, up)
+        idx = np.minimum(base, len(x))[:, None] - k[None, :] + taps
+        y[b0:b0 + len(m)] = np.einsum("ij,ij->i", xp[idx], H[phase])
+    return np.clip(np.rint(y), -32768, 32767).astype(np.int16)
+
+
+def trim_silence(x: np.ndarray, sr: int, pad_ms: int = 200) -> np.ndarray:
+    vad = StreamingVad(sr, no_speech_sec=0)
+    vad.feed(x)
+    bounds = vad.speech_bounds(pad_ms)
+    if bounds is None:
+        return x
+    return x[bounds[0]:bounds[1]]
+
+
+def read_audio(audio):
+    """Segment 또는 WAV 경로 -> (int16 mono, samplerate)"""
+    if hasattr(audio, "samples"):
+        x, sr, ch = audio.samples(), audio.samplerate, audio.channels
+    else:
+        with wave.open(str(Path(audio)), "rb") as w:
+            sr, ch = w.getframerate(), w.getnchannels()
+            x = np.frombuffer(w.readframes(w.getnframes()), dtype=np.int16)
+    if ch > 1:
+        x = x[::ch]  # 첫 채널만
+    return x, sr
+
+
+def encode(x: np.ndarray, sr: int, fmt: str = "flac", name: str = "group") -> io.BytesIO:
+    sf_format, subtype, ext = FORMATS[fmt]
+    buf = io.BytesIO()
+    if sf_format is None:
+        with wave.open(buf, "wb") as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(sr)
+            w.writeframes(x.tobytes())
+    else:
+        import soundfile as sf
+        sf.write(buf, x, sr, format=sf_format, subtype=subtype)
+    buf.seek(0)
+    buf.name = f"{name}.{ext}"  # openai 업로드 시 확장자로 포맷 판단
+    return buf
+
+
+def normalize(audio, target_sr: int = TARGET_SR, trim: bool = True):
+    """-> (앞뒤 무음 뺀 target_sr mono int16, 원본 샘플 수, 원본 samplerate). stt_cache 키도 이 결과로"""
+    x, sr = read_audio(audio)
+    n = len(x)
+    if trim:
+        x = trim_silence(x, sr)
+    return resample(x, sr, target_sr), n, sr
+
+
+def prepare_upload(audio, fmt: str = "flac", target_sr: int = TARGET_SR, trim: bool = True,
+                   norm=None) -> io.BytesIO:
+    """norm = 이미 계산한 normalize(audio) 결과 (캐시 키 만들 때 한 것 재사용)"""
+    t0 = time.perf_counter()
+    x, n, sr = norm if norm is not None else normalize(audio, target_sr, trim)
+    raw_bytes = n * 2 + 44
+    raw_sec = n / sr
+    name = Path(audio).stem if isinstance(audio, (str, Path)) else "group"  # WAV 파일 이름 유지 (replay.py)
+
+    try:
+        buf = encode(x, target_sr, fmt, name)
+    except Exception as e:
+        # libsndfile이 Opus 등을 지원 안 하면 WAV로
+        print(f"[UPLOAD] {fmt} encode failed ({e}) -> wav")
+        buf = encode(x, target_sr, "wav", name)
+
+    out_bytes = buf.getbuffer().nbytes
+    ms = (time.perf_counter() - t0) * 1000
+    print(f"[UPLOAD] {raw_bytes / 1024:.0f} KB -> {out_bytes / 1024:.0f} KB "
+          f"({raw_bytes / max(out_bytes, 1):.1f}x), {raw_sec:.1f}s -> {len(x) / target_sr:.1f}s "
+          f"@ {target_sr} Hz {buf.name}, prep {ms:.0f} ms")
+    return buf
@@ -0,0 +1,127 @@
+# vad.py
+# 에너지 + 영교차율(ZCR) 기반 음성 구간 검출 (NumPy 프레임 단위 벡터 연산)
+# 녹음 중에 조금씩 feed() 하다가, 말이 끝나고 일정 시간 조용하면 done=True
+
+import numpy as np
+
+FRAME_MS = 30
+
+
+def frame_features(pcm: np.ndarray, samplerate: int, frame_ms: int = FRAME_MS):
+    """int16 mono -> (프레임별 dBFS, 프레임별 ZCR). 남는 샘플은 버림"""
+    n = samplerate * frame_ms // 1000
+    k = len(pcm) // n
+    if k == 0:
+        return np.empty(0, np.float32), np.empty(0, np.float32)
+    frames = pcm[:k * n].reshape(k, n).astype(np.float32)
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    db = 20.0 * np.log10(np.maximum(rms, 1.0) / 32768.0)
+    sign = np.signbit(frames)
+    zcr = np.mean(sign[:, 1:] != sign[:, :-1], axis=1)
+    return db, zcr
+
+
+def speech_mask(db: np.ndarray, zcr: np.ndarray, floor_db: np.ndarray,
+                margin_db: float = 10.0, zcr_max: float = 0.35, strong_db: float = 20.0):
+    """
+    노이즈 바닥보다 margin_db 이상 크고 ZCR이 낮으면 음성(유성음),
+    strong_db 이상 크면 ZCR과 상관없이 음성(무성 자음)
+    """
+    above = db - floor_db
+    return ((above > margin_db) & (zcr < zcr_max)) | (above > strong_db)
+
+
+class StreamingVad:
+    def __init__(self, samplerate: int, frame_ms: int = FRAME_MS,
+                 trailing_ms: int = 1500, min_speech_ms: int = 300,
+                 no_speech_sec: float = 5.0, margin_db: float = 10.0,
+                 zcr_max: float = 0.35, floor_rise_db: float = 0.05):
+        self.samplerate = samplerate
+        self.frame_ms = frame_ms
+        self.frame_len = samplerate * frame_ms // 1000
+        self.trailing_frames = trailing_ms // frame_ms
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.no_speech_frames = int(no_speech_sec * 1000) // frame_ms
+        self.margin_db = margin_db
+        self.zcr_max = zcr_max
+        self.floor_rise_db = floor_rise_db  # 노이즈 바닥은 천천히 올라가고 바로 내려감
+
+        self._rest = np.empty(0, np.int16)
+        self.floor_db = None
+        self.frames = 0
+        self.speech_frames = 0
+        self.first_speech = None  # 프레임 index
+        self.last_speech = None
+
+    @property
+    def speech_detected(self) -> bool:
+        return self.speech_frames >= self.min_speech_frames
+
+    @property
+    def speech_sec(self) -> float:
+        return self.speech_frames * self.frame_ms / 1000
+
+    @property
+    def done(self) -> bool:
+        if self.speech_detected:
+            return self.frames - 1 - self.last_speech >= self.trailing_frames
+        return self.no_speech_frames > 0 and self.frames >= self.no_speech_frames
+
+    def feed(self, pcm: np.ndarray) -> bool:
+        if len(self._rest):
+            pcm = np.concatenate((self._rest, pcm))
+        db, zcr = frame_features(pcm, self.samplerate, self.frame_ms)
+        used = len(db) * self.frame_len
+        self._rest = pcm[used:].copy()
+        if len(db) == 0:
+            return self.done
+
+        # 프레임별 노이즈 바닥 추적: floor[i] = min(floor[i-1] + rise, db[i])
+        # 펼치면 floor[i] = rise*i + min(f + rise, cummin(db[j] - rise*j))
+        f = db[0] if self.floor_db is None else self.floor_db
+        steps = np.arange(len(db), dtype=np.float32) * self.floor_rise_db
+        floor = steps + np.minimum(f + self.floor_rise_db, np.minimum.accumulate(db - steps))
+        self.floor_db = float(floor[-1])
+
+        mask = speech_mask(db, zcr, floor, self.margin_db, self.zcr_max)
+        idx = np.flatnonzero(mask)
+        if len(idx):
+            if self.first_speech is None:
+                self.first_speech = self.frames + int(idx[0])
+            self.last_speech = self.frames + int(idx[-1])
+            self.speech_frames += len(idx)
+        self.frames += len(db)
+        return self.done
+
+    def speech_bounds(self, pad_ms: int = 200):
+        """(시작 sample, 끝 sample) - 앞뒤 무음 잘라낼 때 사용. 음성 없으면 None"""
+        if self.first_speech is None:
+            return None
+        pad = pad_ms // self.frame_ms
+        s = max(0, self.first_speech - pad) * self.frame_len
+        e = min(self.frames, self.last_speech + 1 + pad) * self.frame_len
+        return s, e
+
+
+class VadStats:
+    """조별 녹음 시간 / 절약 시간 기록"""
+
+    def __init__(self):
+        self.stops = []  # (최대 녹음 sec, 실제 녹음 sec, 음성 여부)
+
+    def add(self, max_sec: float, recorded_sec: float, speech: bool):
+        self.stops.append((max_sec, recorded_sec, speech))
+        saved = max_sec - recorded_sec
+        tag = "speech" if speech else "no speech -> STT skip"
+        print(f"[VAD] recorded {recorded_sec:.1f}s / {max_sec}s (saved {saved:.1f}s, {tag})")
+
+    @property
+    def saved_sec(self) -> float:
+        return sum(m - r for m, r, _ in self.stops)
+
+    def report(self):
+        print("\n===== VAD =====")
+        for i, (m, r, sp) in enumerate(self.stops):
+            print(f"group {i + 1}: {r:.1f}s / {m}s saved={m - r:.1f}s speech={sp}")
+        print(f"total saved: {self.saved_sec:.1f}s")
+        print("===============")